@@ -222,6 +222,29 @@ AVAILABLE_CLI_OPTIONS = {
         default=constants.BACKTEST_CACHE_DEFAULT,
         choices=constants.BACKTEST_CACHE_AGE,
     ),
+    "backtest_jobs": Arg(
+        '--backtest-jobs',
+        help='The number of worker processes to backtest with. Strategies from '
+        '`--strategy-list` are backtested in parallel, a single strategy is split by pair if '
+        'its pairs are independent. If -1, all CPUs are used, for -2, all CPUs but one are '
+        'used, etc. If 1 (default), everything runs in one process.',
+        type=check_int_nonzero,
+        metavar='JOBS',
+    ),
+    "indicator_cache": Arg(
+        '--indicator-cache',
+        help='Cache populated indicators on disk, and reuse them while strategy (including '
+        'its base classes), parameters and candles are unchanged. Changes to helper modules '
+        'or other files used by the strategy are not detected.',
+        action='store_true',
+    ),
+    "backtest_checkpoint": Arg(
+        '--backtest-checkpoint',
+        help='Store the backtest state at the end of the timerange. Backtesting the same '
+        'strategy and config with a later end date resumes from this state, and only '
+        'backtests the new candles.',
+        action='store_true',
+    ),
     # Edge
     "stoploss_range": Arg(
         '--stoplosses',
@@ -460,6 +483,14 @@ AVAILABLE_CLI_OPTIONS = {
         default=['1m', '5m'],
         nargs='+',
     ),
+    "download_jobs": Arg(
+        '--dl-jobs',
+        help='The number of pairs to download concurrently. Requests are still limited to the '
+        'rate limit of the exchange. Default: `%(default)s`.',
+        type=check_int_positive,
+        metavar='INT',
+        default=1,
+    ),
     "prepend_data": Arg(
         '--prepend',
         help='Allow data prepending. (Data-appending is disabled)',
@@ -8,7 +8,7 @@ from freqtrade.configuration import setup_utils_configuration
 from freqtrade.data.btanalysis import get_latest_hyperopt_file
 from freqtrade.enums import RunMode
 from freqtrade.exceptions import OperationalException
-from freqtrade.optimize.optimize_reports import show_backtest_result
+from freqtrade.optimize.optimize_reports import complete_strategy_stats, show_backtest_result
 
 
 logger = logging.getLogger(__name__)
@@ -73,8 +73,8 @@ def start_hyperopt_show(args: Dict[str, Any]) -> None:
 
     n = config.get('hyperopt_show_index', -1)
 
-    # Previous evaluations
-    epochs, total_epochs = HyperoptTools.load_filtered_results(results_file, config)
+    # Previous evaluations - only the shown epoch is parsed for indexed results.
+    epochs, total_epochs = HyperoptTools.load_filtered_epochs(results_file, config)
 
     filtered_epochs = len(epochs)
 
@@ -94,6 +94,7 @@ def start_hyperopt_show(args: Dict[str, Any]) -> None:
 
         metrics = val['results_metrics']
         if 'strategy_name' in metrics:
+            metrics = complete_strategy_stats(metrics)
             strategy_name = metrics['strategy_name']
             show_backtest_result(strategy_name, metrics,
                                  metrics['stake_currency'], config.get('backtest_breakdown', []))
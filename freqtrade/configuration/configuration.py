@@ -282,6 +282,15 @@ class Configuration:
         self._args_to_config(config, argname='freqai_backtest_live_models',
                              logstring='Parameter --freqai-backtest-live-models detected ...')
 
+        self._args_to_config(config, argname='backtest_jobs',
+                             logstring='Parameter --backtest-jobs detected: {}')
+
+        self._args_to_config(config, argname='backtest_checkpoint',
+                             logstring='Parameter --backtest-checkpoint detected ...')
+
+        self._args_to_config(config, argname='indicator_cache',
+                             logstring='Parameter --indicator-cache detected ...')
+
         # Edge section:
         if 'stoploss_range' in self.args and self.args["stoploss_range"]:
             txt_range = eval(self.args["stoploss_range"])
@@ -429,6 +438,9 @@ class Configuration:
         self._args_to_config(config, argname='download_trades',
                              logstring='Detected --dl-trades: {}')
 
+        self._args_to_config(config, argname='download_jobs',
+                             logstring='Detected --dl-jobs: {}')
+
         self._args_to_config(config, argname='dataformat_ohlcv',
                              logstring='Using "{}" to store OHLCV data.')
 
@@ -38,8 +38,8 @@ AVAILABLE_PAIRLISTS = ['StaticPairList', 'VolumePairList', 'ProducerPairList', '
                        'ShuffleFilter', 'SpreadFilter', 'VolatilityFilter']
 AVAILABLE_PROTECTIONS = ['CooldownPeriod',
                          'LowProfitPairs', 'MaxDrawdown', 'StoplossGuard']
-AVAILABLE_DATAHANDLERS_TRADES = ['json', 'jsongz', 'hdf5', 'feather']
-AVAILABLE_DATAHANDLERS = AVAILABLE_DATAHANDLERS_TRADES + ['parquet']
+AVAILABLE_DATAHANDLERS_TRADES = ['json', 'jsongz', 'hdf5', 'feather', 'parquet']
+AVAILABLE_DATAHANDLERS = AVAILABLE_DATAHANDLERS_TRADES
 BACKTEST_BREAKDOWNS = ['day', 'week', 'month']
 BACKTEST_CACHE_AGE = ['none', 'day', 'week', 'month']
 BACKTEST_CACHE_DEFAULT = 'day'
@@ -143,6 +143,8 @@ CONF_SCHEMA = {
         'dry_run_wallet': {'type': 'number', 'default': DRY_RUN_WALLET},
         'cancel_open_orders_on_exit': {'type': 'boolean', 'default': False},
         'process_only_new_candles': {'type': 'boolean'},
+        'incremental_analysis': {'type': 'boolean'},
+        'analyze_workers': {'type': 'integer', 'minimum': 1},
         'minimal_roi': {
             'type': 'object',
             'patternProperties': {
@@ -446,6 +448,7 @@ CONF_SCHEMA = {
             'enum': AVAILABLE_DATAHANDLERS_TRADES,
             'default': 'jsongz'
         },
+        'data_load_workers': {'type': 'integer', 'minimum': 1},
         'position_adjustment_enable': {'type': 'boolean'},
         'max_entry_position_adjustment': {'type': ['integer', 'number'], 'minimum': -1},
     },
@@ -477,7 +480,8 @@ CONF_SCHEMA = {
                 'outdated_offset': {'type': 'integer', 'minimum': 1},
                 'markets_refresh_interval': {'type': 'integer'},
                 'ccxt_config': {'type': 'object'},
-                'ccxt_async_config': {'type': 'object'}
+                'ccxt_async_config': {'type': 'object'},
+                'enable_ws': {'type': 'boolean'},
             },
             'required': ['name']
         },
@@ -4,7 +4,7 @@ Functions to convert data from one format to another
 import itertools
 import logging
 from operator import itemgetter
-from typing import Dict, List
+from typing import Dict, Iterable, List, Union
 
 import numpy as np
 import pandas as pd
@@ -135,11 +135,18 @@ def trim_dataframe(df: DataFrame, timerange, df_date_col: str = 'date',
     if startup_candles:
         # Trim candles instead of timeframe in case of given startup_candle count
         df = df.iloc[startup_candles:, :]
-    else:
-        if timerange.starttype == 'date':
+    # Sorted dates can be trimmed by position - which returns a view instead of a copy.
+    is_sorted = df[df_date_col].is_monotonic_increasing
+    if not startup_candles and timerange.starttype == 'date':
+        if is_sorted:
+            df = df.iloc[df[df_date_col].searchsorted(timerange.startdt, side='left'):, :]
+        else:
             df = df.loc[df[df_date_col] >= timerange.startdt, :]
     if timerange.stoptype == 'date':
-        df = df.loc[df[df_date_col] <= timerange.stopdt, :]
+        if is_sorted:
+            df = df.iloc[:df[df_date_col].searchsorted(timerange.stopdt, side='right'), :]
+        else:
+            df = df.loc[df[df_date_col] <= timerange.stopdt, :]
     return df
 
 
@@ -200,6 +207,19 @@ def trades_remove_duplicates(trades: List[List]) -> List[List]:
     return [i for i, _ in itertools.groupby(sorted(trades, key=itemgetter(0)))]
 
 
+def trades_df_remove_duplicates(trades: DataFrame) -> DataFrame:
+    """
+    Removes duplicates from a trades DataFrame, like trades_remove_duplicates():
+    Sorts by timestamp, and removes trades identical to the preceding trade.
+    :param trades: DataFrame with constants.DEFAULT_TRADES_COLUMNS as columns
+    :return: same format as above, but with duplicates removed
+    """
+    trades = trades.sort_values('timestamp', kind='stable', ignore_index=True)
+    previous = trades.shift()
+    duplicate = (trades.eq(previous) | (trades.isna() & previous.isna())).all(axis=1)
+    return trades.loc[~duplicate].reset_index(drop=True)
+
+
 def trades_dict_to_list(trades: List[Dict]) -> TradeList:
     """
     Convert fetch_trades result into a List (to be more memory efficient).
@@ -209,17 +229,17 @@ def trades_dict_to_list(trades: List[Dict]) -> TradeList:
     return [[t[col] for col in DEFAULT_TRADES_COLUMNS] for t in trades]
 
 
-def trades_to_ohlcv(trades: TradeList, timeframe: str) -> DataFrame:
+def trades_to_ohlcv(trades: Union[TradeList, DataFrame], timeframe: str) -> DataFrame:
     """
     Converts trades list to OHLCV list
-    :param trades: List of trades, as returned by ccxt.fetch_trades.
+    :param trades: List of trades, as returned by ccxt.fetch_trades - or DataFrame of trades.
     :param timeframe: Timeframe to resample data to
     :return: OHLCV Dataframe.
     :raises: ValueError if no trades are provided
     """
     from freqtrade.exchange import timeframe_to_minutes
     timeframe_minutes = timeframe_to_minutes(timeframe)
-    if not trades:
+    if len(trades) == 0:
         raise ValueError('Trade-list empty.')
     df = pd.DataFrame(trades, columns=DEFAULT_TRADES_COLUMNS)
     df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms',
@@ -234,6 +254,34 @@ def trades_to_ohlcv(trades: TradeList, timeframe: str) -> DataFrame:
     return df_new.loc[:, DEFAULT_DATAFRAME_COLUMNS]
 
 
+def trades_chunks_to_ohlcv(chunks: Iterable[DataFrame],
+                           timeframes: List[str]) -> Dict[str, DataFrame]:
+    """
+    Converts trades to OHLCV chunk by chunk - so only one chunk of trades is in memory.
+    Candles spanning multiple chunks are combined.
+    :param chunks: DataFrames of trades, sorted by timestamp
+    :param timeframes: Timeframes to resample data to
+    :return: Dict of timeframe: OHLCV Dataframe
+    :raises: ValueError if no trades are provided
+    """
+    candles: Dict[str, List[DataFrame]] = {timeframe: [] for timeframe in timeframes}
+    for trades in chunks:
+        if len(trades) == 0:
+            continue
+        for timeframe in timeframes:
+            candles[timeframe].append(trades_to_ohlcv(trades, timeframe))
+    if not all(candles.values()):
+        raise ValueError('Trade-list empty.')
+
+    return {timeframe: pd.concat(parts).groupby(by='date', as_index=False, sort=True).agg({
+        'open': 'first',
+        'high': 'max',
+        'low': 'min',
+        'close': 'last',
+        'volume': 'sum',
+    }).loc[:, DEFAULT_DATAFRAME_COLUMNS] for timeframe, parts in candles.items()}
+
+
 def convert_trades_format(config: Config, convert_from: str, convert_to: str, erase: bool):
     """
     Convert trades from one format to another format.
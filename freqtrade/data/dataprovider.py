@@ -6,6 +6,7 @@ Common Interface for bot and strategy to access data.
 """
 import logging
 from collections import deque
+from copy import copy
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional, Tuple
 
@@ -88,6 +89,21 @@ class DataProvider:
         self.__cached_pairs[pair_key] = (
             dataframe, datetime.now(timezone.utc))
 
+    def _copy_for_pairs(self, pairs: List[str]) -> 'DataProvider':
+        """
+        Shallow copy, caching only the dataframes of the given pairs.
+        Using private method as this should never be used by a user
+        (used to ship a subset of the data to backtesting worker processes)
+        :param pairs: Pairs to keep cached dataframes for
+        """
+        dp = copy(self)
+        dp.__cached_pairs = {
+            key: value for key, value in self.__cached_pairs.items() if key[0] in pairs}
+        dp.__cached_pairs_backtesting = {
+            key: value for key, value in self.__cached_pairs_backtesting.items()
+            if key[0] in pairs}
+        return dp
+
     # For multiple producers we will want to merge the pairlists instead of overwriting
     def _set_producer_pairs(self, pairlist: List[str], producer_name: str = "default"):
         """
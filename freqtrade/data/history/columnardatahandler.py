@@ -0,0 +1,389 @@
+"""
+Base class for columnar (feather / parquet) data handlers.
+
+Columnar files can't be appended to. Appended candles (and trades) are therefore written as
+segments (files of the same format) to a directory next to the data file - named after the
+date of their first row. Once there are too many segments, they are merged into the data file.
+"""
+import logging
+import shutil
+from abc import abstractmethod
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Iterable, Iterator, List, Optional, Tuple
+
+import pyarrow as pa
+from pandas import DataFrame, concat, to_datetime
+
+from freqtrade.configuration import TimeRange
+from freqtrade.constants import DEFAULT_DATAFRAME_COLUMNS, DEFAULT_TRADES_COLUMNS, TradeList
+from freqtrade.data.converter import clean_ohlcv_dataframe, trades_df_remove_duplicates
+from freqtrade.enums import CandleType
+
+from .idatahandler import IDataHandler
+
+
+logger = logging.getLogger(__name__)
+
+# Segments are merged into the data file when appending this many segments.
+MAX_SEGMENTS = 30
+
+# Trades per chunk returned by trades_load_chunks().
+TRADES_CHUNK_SIZE = 1_000_000
+
+TRADES_SCHEMA = pa.schema([
+    ('timestamp', pa.int64()),
+    ('id', pa.string()),
+    ('type', pa.string()),
+    ('side', pa.string()),
+    ('price', pa.float64()),
+    ('amount', pa.float64()),
+    ('cost', pa.float64()),
+])
+
+
+def date_to_ms(date: Any) -> int:
+    """
+    Convert a stored date (datetime, or milliseconds) to milliseconds.
+    """
+    if isinstance(date, datetime):
+        if date.tzinfo is None:
+            date = date.replace(tzinfo=timezone.utc)
+        return int(date.timestamp() * 1000)
+    # Dates stored as milliseconds
+    return int(date)
+
+
+class ColumnarDataHandler(IDataHandler):
+
+    _columns = DEFAULT_DATAFRAME_COLUMNS
+    supports_append = True
+
+    @abstractmethod
+    def _write_file(self, filename: Path, table: pa.Table) -> None:
+        """
+        Write one file (data file or segment).
+        """
+
+    @abstractmethod
+    def _write_batches(self, filename: Path, schema: pa.Schema,
+                       batches: Iterable[pa.RecordBatch]) -> None:
+        """
+        Write one file from record batches - without holding all of them in memory.
+        """
+
+    @abstractmethod
+    def _read_file(self, filename: Path, timerange: Optional[TimeRange]) -> pa.Table:
+        """
+        Read one file (data file or segment).
+        :param timerange: Limit data to be loaded to this timerange where possible - based on
+            the first column (date / timestamp).
+        """
+
+    @abstractmethod
+    def _iter_batches(self, filename: Path) -> Iterator[pa.RecordBatch]:
+        """
+        Read one file (data file or segment) batch by batch.
+        """
+
+    @abstractmethod
+    def _read_date_range(self, filename: Path) -> Optional[Tuple[int, int]]:
+        """
+        Read the date (ms) of the first and the last row of one file (data file or segment),
+        without loading the file.
+        :return: (first, last), or None if the file is empty
+        """
+
+    @staticmethod
+    def _segments_dir(filename: Path) -> Path:
+        return filename.with_name(f'{filename.name}.segments')
+
+    def _get_segments(self, filename: Path) -> List[Tuple[int, Path]]:
+        """
+        Get the segments appended to a data file, with the date (ms) of their first row.
+        """
+        segments_dir = self._segments_dir(filename)
+        if not segments_dir.is_dir():
+            return []
+        return sorted((int(segment.stem), segment)
+                      for segment in segments_dir.glob(f'*.{self._get_file_extension()}'))
+
+    def _get_files(self, filename: Path, timerange: Optional[TimeRange] = None) -> List[Path]:
+        """
+        Get the data file and its segments - limited to the files covering the timerange.
+        """
+        # Each file contains the rows up to the first row of the next file.
+        files: List[Tuple[Optional[int], Path]] = [(None, filename)]
+        files.extend(self._get_segments(filename))
+        start_ms = timerange.startts * 1000 if timerange and timerange.starttype == 'date' else None
+        stop_ms = timerange.stopts * 1000 if timerange and timerange.stoptype == 'date' else None
+        result = []
+        for idx, (first_ms, file) in enumerate(files):
+            next_ms = files[idx + 1][0] if idx + 1 < len(files) else None
+            if ((start_ms is None or next_ms is None or next_ms > start_ms)
+                    and (stop_ms is None or first_ms is None or first_ms <= stop_ms)):
+                result.append(file)
+        return result
+
+    def _store(self, filename: Path, table: pa.Table) -> None:
+        """
+        Store a data file, replacing appended segments.
+        """
+        self.create_dir_if_needed(filename)
+        self._write_file(filename, table)
+        shutil.rmtree(self._segments_dir(filename), ignore_errors=True)
+
+    def _append(self, filename: Path, table: pa.Table, first_ms: int) -> bool:
+        """
+        Append a segment to a data file.
+        :return: True if the segments should be merged into the data file.
+        """
+        segments_dir = self._segments_dir(filename)
+        segments_dir.mkdir(exist_ok=True)
+        self._write_file(segments_dir / f'{first_ms}.{self._get_file_extension()}', table)
+        return len(self._get_segments(filename)) >= MAX_SEGMENTS
+
+    def _ohlcv_table(self, data: DataFrame) -> pa.Table:
+        return pa.Table.from_pandas(data.reset_index(drop=True).loc[:, self._columns],
+                                    preserve_index=False)
+
+    def ohlcv_store(
+            self, pair: str, timeframe: str, data: DataFrame, candle_type: CandleType) -> None:
+        """
+        Store data, replacing all stored data (including appended segments).
+        :param pair: Pair - used to generate filename
+        :param timeframe: Timeframe - used to generate filename
+        :param data: Dataframe containing OHLCV data
+        :param candle_type: Any of the enum CandleType (must match trading mode!)
+        :return: None
+        """
+        filename = self._pair_data_filename(self._datadir, pair, timeframe, candle_type)
+        self._store(filename, self._ohlcv_table(data))
+
+    def _ohlcv_load(self, pair: str, timeframe: str,
+                    timerange: Optional[TimeRange], candle_type: CandleType
+                    ) -> DataFrame:
+        """
+        Internal method used to load data for one pair from disk.
+        Implements the loading and conversion to a Pandas dataframe.
+        Timerange trimming and dataframe validation happens outside of this method.
+        :param pair: Pair to load data
+        :param timeframe: Timeframe (e.g. "5m")
+        :param timerange: Limit data to be loaded to this timerange.
+                        Optionally implemented by subclasses to avoid loading
+                        all data where possible.
+        :param candle_type: Any of the enum CandleType (must match trading mode!)
+        :return: DataFrame with ohlcv data, or empty DataFrame
+        """
+        filename = self._ohlcv_filename(pair, timeframe, candle_type)
+        if not filename:
+            return DataFrame(columns=self._columns)
+
+        parts = [self._convert_ohlcv(self._read_file(file, timerange).to_pandas())
+                 for file in self._get_files(filename, timerange)]
+        return concat(parts, ignore_index=True) if len(parts) > 1 else parts[0]
+
+    def _ohlcv_filename(self, pair: str, timeframe: str,
+                        candle_type: CandleType) -> Optional[Path]:
+        """
+        Get the existing data file of a pair, or None.
+        """
+        filename = self._pair_data_filename(
+            self._datadir, pair, timeframe, candle_type=candle_type)
+        if not filename.exists():
+            # Fallback mode for 1M files
+            filename = self._pair_data_filename(
+                self._datadir, pair, timeframe, candle_type=candle_type, no_timeframe_modify=True)
+            if not filename.exists():
+                return None
+        return filename
+
+    def ohlcv_data_min_max(self, pair: str, timeframe: str,
+                           candle_type: CandleType) -> Tuple[datetime, datetime]:
+        """
+        Returns the min and max timestamp for the given pair and timeframe.
+        Only reads the first row of the data file, and the last row of the last file.
+        :param pair: Pair to get min/max for
+        :param timeframe: Timeframe to get min/max for
+        :param candle_type: Any of the enum CandleType (must match trading mode!)
+        :return: (min, max)
+        """
+        filename = self._ohlcv_filename(pair, timeframe, candle_type)
+        first = self._read_date_range(filename) if filename else None
+        if not filename or not first:
+            return (
+                datetime.fromtimestamp(0, tz=timezone.utc),
+                datetime.fromtimestamp(0, tz=timezone.utc)
+            )
+        last = first
+        segments = self._get_segments(filename)
+        if segments:
+            last = self._read_date_range(segments[-1][1]) or first
+        return (datetime.fromtimestamp(first[0] / 1000, tz=timezone.utc),
+                datetime.fromtimestamp(last[1] / 1000, tz=timezone.utc))
+
+    def _convert_ohlcv(self, pairdata: DataFrame) -> DataFrame:
+        pairdata.columns = self._columns
+        pairdata = pairdata.astype(dtype={'open': 'float', 'high': 'float',
+                                          'low': 'float', 'close': 'float', 'volume': 'float'})
+        pairdata['date'] = to_datetime(pairdata['date'], unit='ms', utc=True)
+        return pairdata
+
+    def ohlcv_append(
+        self,
+        pair: str,
+        timeframe: str,
+        data: DataFrame,
+        candle_type: CandleType
+    ) -> None:
+        """
+        Append data to existing data structures.
+        Only writes the new candles, as a segment next to the data file.
+        :param pair: Pair
+        :param timeframe: Timeframe this ohlcv data is for
+        :param data: Data to append - must not contain candles before the stored candles.
+        :param candle_type: Any of the enum CandleType (must match trading mode!)
+        """
+        filename = self._pair_data_filename(self._datadir, pair, timeframe, candle_type)
+        if not filename.exists():
+            self.ohlcv_store(pair, timeframe, data, candle_type)
+            return
+        if data.empty:
+            return
+        first_ms = data['date'].iloc[0].value // 1_000_000
+        if self._append(filename, self._ohlcv_table(data), first_ms):
+            logger.info(f'Merging appended candles into {filename}.')
+            # Segments may repeat the last candle of the prior file.
+            data = clean_ohlcv_dataframe(self._ohlcv_load(pair, timeframe, None, candle_type),
+                                         timeframe, pair, fill_missing=False,
+                                         drop_incomplete=False)
+            self.ohlcv_store(pair, timeframe, data, candle_type)
+
+    def ohlcv_purge(self, pair: str, timeframe: str, candle_type: CandleType) -> bool:
+        """
+        Remove data for this pair
+        :param pair: Delete data for this pair.
+        :param timeframe: Timeframe (e.g. "5m")
+        :param candle_type: Any of the enum CandleType (must match trading mode!)
+        :return: True when deleted, false if file did not exist.
+        """
+        filename = self._pair_data_filename(self._datadir, pair, timeframe, candle_type)
+        shutil.rmtree(self._segments_dir(filename), ignore_errors=True)
+        return super().ohlcv_purge(pair, timeframe, candle_type)
+
+    @staticmethod
+    def _trades_table(data: TradeList) -> pa.Table:
+        return pa.Table.from_pandas(DataFrame(data, columns=DEFAULT_TRADES_COLUMNS),
+                                    schema=TRADES_SCHEMA, preserve_index=False)
+
+    def _trades_batches(self, filename: Path) -> Iterator[pa.RecordBatch]:
+        """
+        Read all trades of a pair batch by batch - converted to TRADES_SCHEMA.
+        """
+        for file in self._get_files(filename):
+            for batch in self._iter_batches(file):
+                yield from pa.Table.from_batches([batch]).cast(TRADES_SCHEMA).to_batches()
+
+    def trades_store(self, pair: str, data: TradeList) -> None:
+        """
+        Store trades data (list of Dicts) to file, replacing all stored trades.
+        :param pair: Pair - used for filename
+        :param data: List of Lists containing trade data,
+                     column sequence as in DEFAULT_TRADES_COLUMNS
+        """
+        filename = self._pair_trades_filename(self._datadir, pair)
+        self._store(filename, self._trades_table(data))
+
+    def trades_append(self, pair: str, data: TradeList):
+        """
+        Append data to existing files.
+        Only writes the new trades, as a segment next to the data file.
+        :param pair: Pair - used for filename
+        :param data: List of Lists containing trade data,
+                     column sequence as in DEFAULT_TRADES_COLUMNS.
+                     Must only contain trades after the stored trades.
+        """
+        filename = self._pair_trades_filename(self._datadir, pair)
+        if not filename.exists():
+            self.trades_store(pair, data)
+            return
+        if not data:
+            return
+        if self._append(filename, self._trades_table(data), data[0][0]):
+            logger.info(f'Merging appended trades into {filename}.')
+            tmp_file = filename.with_name(f'{filename.name}.tmp')
+            self._write_batches(tmp_file, TRADES_SCHEMA, self._trades_batches(filename))
+            tmp_file.replace(filename)
+            shutil.rmtree(self._segments_dir(filename), ignore_errors=True)
+
+    def _trades_load(self, pair: str, timerange: Optional[TimeRange] = None) -> TradeList:
+        """
+        Load trades of a pair from file.
+        :param pair: Load trades for this pair
+        :param timerange: Timerange to load trades for
+        :return: List of trades
+        """
+        filename = self._pair_trades_filename(self._datadir, pair)
+        if not filename.exists():
+            return []
+
+        tradesdata = concat([self._read_file(file, timerange).to_pandas()
+                             for file in self._get_files(filename, timerange)],
+                            ignore_index=True)
+        if timerange:
+            if timerange.starttype == 'date':
+                tradesdata = tradesdata.loc[tradesdata['timestamp'] >= timerange.startts * 1000]
+            if timerange.stoptype == 'date':
+                tradesdata = tradesdata.loc[tradesdata['timestamp'] <= timerange.stopts * 1000]
+        return tradesdata.values.tolist()
+
+    def trades_load_chunks(self, pair: str) -> Iterator[DataFrame]:
+        """
+        Load trades of a pair chunk by chunk, to limit memory usage.
+        Chunks are sorted by timestamp, and contain about TRADES_CHUNK_SIZE trades.
+        Removes duplicates in the process.
+        :param pair: Load trades for this pair
+        :return: Iterator of DataFrames with DEFAULT_TRADES_COLUMNS as columns
+        """
+        filename = self._pair_trades_filename(self._datadir, pair)
+        if not filename.exists():
+            return
+        pending: Optional[DataFrame] = None
+        for trades in self._trades_chunks(filename):
+            if pending is not None:
+                trades = concat([pending, trades], ignore_index=True)
+            trades = trades_df_remove_duplicates(trades)
+            # Duplicates of the trades of the last timestamp may follow in the next chunk.
+            last = trades['timestamp'] == trades['timestamp'].iloc[-1]
+            pending = trades.loc[last]
+            if not last.all():
+                yield trades.loc[~last]
+        if pending is not None:
+            yield pending.reset_index(drop=True)
+
+    def _trades_chunks(self, filename: Path) -> Iterator[DataFrame]:
+        """
+        Read all trades of a pair in chunks of (at least) TRADES_CHUNK_SIZE trades.
+        """
+        chunk: List[pa.RecordBatch] = []
+        rows = 0
+        for batch in self._trades_batches(filename):
+            if not batch.num_rows:
+                continue
+            chunk.append(batch)
+            rows += batch.num_rows
+            if rows >= TRADES_CHUNK_SIZE:
+                yield pa.Table.from_batches(chunk).to_pandas()
+                chunk, rows = [], 0
+        if rows:
+            yield pa.Table.from_batches(chunk).to_pandas()
+
+    def trades_purge(self, pair: str) -> bool:
+        """
+        Remove data for this pair
+        :param pair: Delete data for this pair.
+        :return: True when deleted, false if file did not exist.
+        """
+        filename = self._pair_trades_filename(self._datadir, pair)
+        shutil.rmtree(self._segments_dir(filename), ignore_errors=True)
+        return super().trades_purge(pair)
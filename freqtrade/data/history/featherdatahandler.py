@@ -1,124 +1,87 @@
 import logging
-from typing import Optional
+from pathlib import Path
+from typing import Iterable, Iterator, Optional, Tuple
 
-from pandas import DataFrame, read_feather, to_datetime
+import pyarrow as pa
+from pyarrow import feather, ipc
 
 from freqtrade.configuration import TimeRange
-from freqtrade.constants import DEFAULT_DATAFRAME_COLUMNS, DEFAULT_TRADES_COLUMNS, TradeList
-from freqtrade.enums import CandleType
 
-from .idatahandler import IDataHandler
+from .columnardatahandler import ColumnarDataHandler, date_to_ms
 
 
 logger = logging.getLogger(__name__)
 
-
-class FeatherDataHandler(IDataHandler):
-
-    _columns = DEFAULT_DATAFRAME_COLUMNS
-
-    def ohlcv_store(
-            self, pair: str, timeframe: str, data: DataFrame, candle_type: CandleType) -> None:
+# Candles (or trades) per record batch. Batches are the unit loaded for a timerange.
+FEATHER_CHUNK_SIZE = 10_000
+
+
+class FeatherDataHandler(ColumnarDataHandler):
+
+    def _write_file(self, filename: Path, table: pa.Table) -> None:
+        feather.write_feather(table, filename, compression='lz4', compression_level=9,
+                              chunksize=FEATHER_CHUNK_SIZE)
+
+    def _write_batches(self, filename: Path, schema: pa.Schema,
+                       batches: Iterable[pa.RecordBatch]) -> None:
+        options = ipc.IpcWriteOptions(compression=pa.Codec('lz4', compression_level=9))
+        with ipc.new_file(str(filename), schema, options=options) as writer:
+            for batch in batches:
+                writer.write_batch(batch)
+
+    def _read_file(self, filename: Path, timerange: Optional[TimeRange]) -> pa.Table:
+        with pa.memory_map(str(filename)) as source:
+            # Memory-mapped, so only the record batches covering the timerange are read.
+            reader = ipc.open_file(source)
+            start, stop = self._get_batch_range(reader, timerange)
+            return pa.Table.from_batches(
+                [reader.get_batch(batch) for batch in range(start, stop)], reader.schema)
+
+    def _iter_batches(self, filename: Path) -> Iterator[pa.RecordBatch]:
+        with pa.memory_map(str(filename)) as source:
+            reader = ipc.open_file(source)
+            for batch in range(reader.num_record_batches):
+                yield reader.get_batch(batch)
+
+    def _read_date_range(self, filename: Path) -> Optional[Tuple[int, int]]:
+        with pa.memory_map(str(filename)) as source:
+            reader = ipc.open_file(source)
+            # Memory-mapped, so only the first and the last record batch are read.
+            batches = reader.num_record_batches
+            if not batches or not reader.get_batch(0).num_rows:
+                return None
+            return (date_to_ms(reader.get_batch(0).column(0)[0].as_py()),
+                    date_to_ms(reader.get_batch(batches - 1).column(0)[-1].as_py()))
+
+    @staticmethod
+    def _get_batch_range(reader: ipc.RecordBatchFileReader,
+                         timerange: Optional[TimeRange]) -> Tuple[int, int]:
         """
-        Store data in json format "values".
-            format looks as follows:
-            [[<date>,<open>,<high>,<low>,<close>]]
-        :param pair: Pair - used to generate filename
-        :param timeframe: Timeframe - used to generate filename
-        :param data: Dataframe containing OHLCV data
-        :param candle_type: Any of the enum CandleType (must match trading mode!)
-        :return: None
-        """
-        filename = self._pair_data_filename(self._datadir, pair, timeframe, candle_type)
-        self.create_dir_if_needed(filename)
-
-        data.reset_index(drop=True).loc[:, self._columns].to_feather(
-            filename, compression_level=9, compression='lz4')
-
-    def _ohlcv_load(self, pair: str, timeframe: str,
-                    timerange: Optional[TimeRange], candle_type: CandleType
-                    ) -> DataFrame:
-        """
-        Internal method used to load data for one pair from disk.
-        Implements the loading and conversion to a Pandas dataframe.
-        Timerange trimming and dataframe validation happens outside of this method.
-        :param pair: Pair to load data
-        :param timeframe: Timeframe (e.g. "5m")
-        :param timerange: Limit data to be loaded to this timerange.
-                        Optionally implemented by subclasses to avoid loading
-                        all data where possible.
-        :param candle_type: Any of the enum CandleType (must match trading mode!)
-        :return: DataFrame with ohlcv data, or empty DataFrame
-        """
-        filename = self._pair_data_filename(
-            self._datadir, pair, timeframe, candle_type=candle_type)
-        if not filename.exists():
-            # Fallback mode for 1M files
-            filename = self._pair_data_filename(
-                self._datadir, pair, timeframe, candle_type=candle_type, no_timeframe_modify=True)
-            if not filename.exists():
-                return DataFrame(columns=self._columns)
-
-        pairdata = read_feather(filename)
-        pairdata.columns = self._columns
-        pairdata = pairdata.astype(dtype={'open': 'float', 'high': 'float',
-                                          'low': 'float', 'close': 'float', 'volume': 'float'})
-        pairdata['date'] = to_datetime(pairdata['date'], unit='ms', utc=True)
-        return pairdata
-
-    def ohlcv_append(
-        self,
-        pair: str,
-        timeframe: str,
-        data: DataFrame,
-        candle_type: CandleType
-    ) -> None:
-        """
-        Append data to existing data structures
-        :param pair: Pair
-        :param timeframe: Timeframe this ohlcv data is for
-        :param data: Data to append.
-        :param candle_type: Any of the enum CandleType (must match trading mode!)
-        """
-        raise NotImplementedError()
-
-    def trades_store(self, pair: str, data: TradeList) -> None:
+        Locate the record batches containing the timerange, using binary search on the
+        first date of the batches (rows are sorted by date).
+        :return: start, stop index of the record batches to load
         """
-        Store trades data (list of Dicts) to file
-        :param pair: Pair - used for filename
-        :param data: List of Lists containing trade data,
-                     column sequence as in DEFAULT_TRADES_COLUMNS
-        """
-        filename = self._pair_trades_filename(self._datadir, pair)
-        self.create_dir_if_needed(filename)
-
-        tradesdata = DataFrame(data, columns=DEFAULT_TRADES_COLUMNS)
-        tradesdata.to_feather(filename, compression_level=9, compression='lz4')
-
-    def trades_append(self, pair: str, data: TradeList):
-        """
-        Append data to existing files
-        :param pair: Pair - used for filename
-        :param data: List of Lists containing trade data,
-                     column sequence as in DEFAULT_TRADES_COLUMNS
-        """
-        raise NotImplementedError()
-
-    def _trades_load(self, pair: str, timerange: Optional[TimeRange] = None) -> TradeList:
-        """
-        Load a pair from file, either .json.gz or .json
-        # TODO: respect timerange ...
-        :param pair: Load trades for this pair
-        :param timerange: Timerange to load trades for - currently not implemented
-        :return: List of trades
-        """
-        filename = self._pair_trades_filename(self._datadir, pair)
-        if not filename.exists():
-            return []
-
-        tradesdata = read_feather(filename)
-
-        return tradesdata.values.tolist()
+        batches = reader.num_record_batches
+        if not timerange or batches <= 1:
+            return 0, batches
+
+        def batches_starting_until(date_ms: int) -> int:
+            # Number of batches with a first date <= date_ms.
+            low, high = 0, batches
+            while low < high:
+                mid = (low + high) // 2
+                if date_to_ms(reader.get_batch(mid).column(0)[0].as_py()) <= date_ms:
+                    low = mid + 1
+                else:
+                    high = mid
+            return low
+
+        start, stop = 0, batches
+        if timerange.starttype == 'date':
+            start = max(batches_starting_until(timerange.startts * 1000) - 1, 0)
+        if timerange.stoptype == 'date':
+            stop = batches_starting_until(timerange.stopts * 1000)
+        return start, stop
 
     @classmethod
     def _get_file_extension(cls):
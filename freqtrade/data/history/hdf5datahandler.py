@@ -1,4 +1,5 @@
 import logging
+from threading import Lock
 from typing import Optional
 
 import numpy as np
@@ -13,6 +14,9 @@ from .idatahandler import IDataHandler
 
 logger = logging.getLogger(__name__)
 
+# PyTables isn't thread-safe - pairs loaded concurrently are read one at a time.
+_hdf5_lock = Lock()
+
 
 class HDF5DataHandler(IDataHandler):
 
@@ -75,7 +79,8 @@ class HDF5DataHandler(IDataHandler):
             if timerange.stoptype == 'date':
                 where.append(f"date <= Timestamp({timerange.stopts * 1e9})")
 
-        pairdata = pd.read_hdf(filename, key=key, mode="r", where=where)
+        with _hdf5_lock:
+            pairdata = pd.read_hdf(filename, key=key, mode="r", where=where)
 
         if list(pairdata.columns) != self._columns:
             raise ValueError("Wrong dataframe format")
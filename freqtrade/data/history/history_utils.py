@@ -1,15 +1,18 @@
+import asyncio
 import logging
 import operator
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from functools import partial
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 from pandas import DataFrame, concat
 
 from freqtrade.configuration import TimeRange
-from freqtrade.constants import DEFAULT_DATAFRAME_COLUMNS
+from freqtrade.constants import DEFAULT_DATAFRAME_COLUMNS, TradeList
 from freqtrade.data.converter import (clean_ohlcv_dataframe, ohlcv_to_dataframe,
-                                      trades_remove_duplicates, trades_to_ohlcv)
+                                      trades_chunks_to_ohlcv, trades_remove_duplicates)
 from freqtrade.data.history.idatahandler import IDataHandler, get_datahandler
 from freqtrade.enums import CandleType
 from freqtrade.exceptions import OperationalException
@@ -69,6 +72,7 @@ def load_data(datadir: Path,
               data_format: str = 'json',
               candle_type: CandleType = CandleType.SPOT,
               user_futures_funding_rate: Optional[int] = None,
+              workers: int = 1,
               ) -> Dict[str, DataFrame]:
     """
     Load ohlcv history data for a list of pairs.
@@ -82,6 +86,7 @@ def load_data(datadir: Path,
     :param fail_without_data: Raise OperationalException if no data is found.
     :param data_format: Data format which should be used. Defaults to json
     :param candle_type: Any of the enum CandleType (must match trading mode!)
+    :param workers: Number of threads loading pairs concurrently.
     :return: dict(<pair>:<Dataframe>)
     """
     result: Dict[str, DataFrame] = {}
@@ -90,14 +95,24 @@ def load_data(datadir: Path,
 
     data_handler = get_datahandler(datadir, data_format)
 
-    for pair in pairs:
-        hist = load_pair_history(pair=pair, timeframe=timeframe,
+    def load_pair(pair: str) -> DataFrame:
+        return load_pair_history(pair=pair, timeframe=timeframe,
                                  datadir=datadir, timerange=timerange,
                                  fill_up_missing=fill_up_missing,
                                  startup_candles=startup_candles,
                                  data_handler=data_handler,
                                  candle_type=candle_type,
                                  )
+
+    if workers > 1 and len(pairs) > 1:
+        # Reading and decompressing files, as well as most of the conversion,
+        # doesn't hold the GIL - so threads load pairs concurrently.
+        with ThreadPoolExecutor(max_workers=min(workers, len(pairs))) as executor:
+            histories = list(executor.map(load_pair, pairs))
+    else:
+        histories = [load_pair(pair) for pair in pairs]
+
+    for pair, hist in zip(pairs, histories):
         if not hist.empty:
             result[pair] = hist
         else:
@@ -163,13 +178,23 @@ def _load_cached_data_for_updating(
         if timerange.stoptype == 'date':
             end = timerange.stopdt
 
-    # Intentionally don't pass timerange in - since we need to load the full dataset.
-    data = data_handler.ohlcv_load(pair, timeframe=timeframe,
-                                   timerange=None, fill_missing=False,
-                                   drop_incomplete=True, warn_no_data=False,
-                                   candle_type=candle_type)
+    if not prepend and data_handler.supports_append:
+        # New candles are appended - so only the last stored candle is loaded.
+        first_date, last_date = data_handler.ohlcv_data_min_max(pair, timeframe, candle_type)
+        data = data_handler.ohlcv_load(pair, timeframe=timeframe,
+                                       timerange=TimeRange('date', None,
+                                                           int(last_date.timestamp())),
+                                       fill_missing=False, warn_no_data=False,
+                                       candle_type=candle_type)
+    else:
+        # Intentionally don't pass timerange in - since we need to load the full dataset.
+        data = data_handler.ohlcv_load(pair, timeframe=timeframe,
+                                       timerange=None, fill_missing=False,
+                                       drop_incomplete=True, warn_no_data=False,
+                                       candle_type=candle_type)
+        first_date = data.iloc[0]['date'] if not data.empty else None
     if not data.empty:
-        if not prepend and start and start < data.iloc[0]['date']:
+        if not prepend and start and start < first_date:
             # Earlier data than existing data requested, redownload all
             data = DataFrame(columns=DEFAULT_DATAFRAME_COLUMNS)
         else:
@@ -182,6 +207,83 @@ def _load_cached_data_for_updating(
     return data, start_ms, end_ms
 
 
+def _prepare_pair_download(pair: str, *,
+                           datadir: Path,
+                           timeframe: str,
+                           process: str,
+                           new_pairs_days: int,
+                           data_handler: IDataHandler,
+                           timerange: Optional[TimeRange],
+                           candle_type: CandleType,
+                           erase: bool,
+                           prepend: bool,
+                           ) -> Tuple[DataFrame, int, Optional[int]]:
+    """
+    Load the stored candles of a pair, and determine which candles to download.
+    :return: Stored candles, since_ms and until_ms to download
+    """
+    if erase:
+        if data_handler.ohlcv_purge(pair, timeframe, candle_type=candle_type):
+            logger.info(f'Deleting existing data for pair {pair}, {timeframe}, {candle_type}.')
+
+    data, since_ms, until_ms = _load_cached_data_for_updating(
+        pair, timeframe, timerange,
+        data_handler=data_handler,
+        candle_type=candle_type,
+        prepend=prepend)
+
+    logger.info(f'({process}) - Download history data for "{pair}", {timeframe}, '
+                f'{candle_type} and store in {datadir}. '
+                f'From {format_ms_time(since_ms) if since_ms else "start"} to '
+                f'{format_ms_time(until_ms) if until_ms else "now"}'
+                )
+
+    logger.debug("Current Start: %s",
+                 f"{data.iloc[0]['date']:DATETIME_PRINT_FORMAT}" if not data.empty else 'None')
+    logger.debug("Current End: %s",
+                 f"{data.iloc[-1]['date']:DATETIME_PRINT_FORMAT}" if not data.empty else 'None')
+
+    # Default since_ms to 30 days if nothing is given
+    if not since_ms:
+        since_ms = int((datetime.now() - timedelta(days=new_pairs_days)).timestamp()) * 1000
+    return data, since_ms, until_ms
+
+
+def _store_pair_download(pair: str, timeframe: str, data: DataFrame, new_data: List, *,
+                         data_handler: IDataHandler,
+                         candle_type: CandleType,
+                         prepend: bool,
+                         ) -> None:
+    """
+    Combine downloaded candles with the stored candles of a pair, and store them.
+    """
+    # TODO: Maybe move parsing to exchange class (?)
+    new_dataframe = ohlcv_to_dataframe(new_data, timeframe, pair,
+                                       fill_missing=False, drop_incomplete=True)
+    if data.empty:
+        data = new_dataframe
+    else:
+        if not prepend and data_handler.supports_append:
+            # Only write the new candles. The last stored candle is downloaded again, as it
+            # may have been incomplete - loading merges both versions of it.
+            data_handler.ohlcv_append(
+                pair, timeframe,
+                new_dataframe.loc[new_dataframe['date'] >= data.iloc[-1]['date']],
+                candle_type=candle_type)
+            return
+        # Run cleaning again to ensure there were no duplicate candles
+        # Especially between existing and new data.
+        data = clean_ohlcv_dataframe(concat([data, new_dataframe], axis=0), timeframe, pair,
+                                     fill_missing=False, drop_incomplete=False)
+
+    logger.debug("New  Start: %s",
+                 f"{data.iloc[0]['date']:DATETIME_PRINT_FORMAT}" if not data.empty else 'None')
+    logger.debug("New End: %s",
+                 f"{data.iloc[-1]['date']:DATETIME_PRINT_FORMAT}" if not data.empty else 'None')
+
+    data_handler.ohlcv_store(pair, timeframe, data=data, candle_type=candle_type)
+
+
 def _download_pair_history(pair: str, *,
                            datadir: Path,
                            exchange: Exchange,
@@ -210,54 +312,56 @@ def _download_pair_history(pair: str, *,
     data_handler = get_datahandler(datadir, data_handler=data_handler)
 
     try:
-        if erase:
-            if data_handler.ohlcv_purge(pair, timeframe, candle_type=candle_type):
-                logger.info(f'Deleting existing data for pair {pair}, {timeframe}, {candle_type}.')
-
-        data, since_ms, until_ms = _load_cached_data_for_updating(
-            pair, timeframe, timerange,
-            data_handler=data_handler,
-            candle_type=candle_type,
-            prepend=prepend)
-
-        logger.info(f'({process}) - Download history data for "{pair}", {timeframe}, '
-                    f'{candle_type} and store in {datadir}. '
-                    f'From {format_ms_time(since_ms) if since_ms else "start"} to '
-                    f'{format_ms_time(until_ms) if until_ms else "now"}'
-                    )
-
-        logger.debug("Current Start: %s",
-                     f"{data.iloc[0]['date']:DATETIME_PRINT_FORMAT}" if not data.empty else 'None')
-        logger.debug("Current End: %s",
-                     f"{data.iloc[-1]['date']:DATETIME_PRINT_FORMAT}" if not data.empty else 'None')
+        data, since_ms, until_ms = _prepare_pair_download(
+            pair, datadir=datadir, timeframe=timeframe, process=process,
+            new_pairs_days=new_pairs_days, data_handler=data_handler, timerange=timerange,
+            candle_type=candle_type, erase=erase, prepend=prepend)
 
-        # Default since_ms to 30 days if nothing is given
         new_data = exchange.get_historic_ohlcv(pair=pair,
                                                timeframe=timeframe,
-                                               since_ms=since_ms if since_ms else
-                                               int((datetime.now() - timedelta(days=new_pairs_days)
-                                                    ).timestamp()) * 1000,
+                                               since_ms=since_ms,
                                                is_new_pair=data.empty,
                                                candle_type=candle_type,
                                                until_ms=until_ms if until_ms else None
                                                )
-        # TODO: Maybe move parsing to exchange class (?)
-        new_dataframe = ohlcv_to_dataframe(new_data, timeframe, pair,
-                                           fill_missing=False, drop_incomplete=True)
-        if data.empty:
-            data = new_dataframe
-        else:
-            # Run cleaning again to ensure there were no duplicate candles
-            # Especially between existing and new data.
-            data = clean_ohlcv_dataframe(concat([data, new_dataframe], axis=0), timeframe, pair,
-                                         fill_missing=False, drop_incomplete=False)
+        _store_pair_download(pair, timeframe, data, new_data, data_handler=data_handler,
+                             candle_type=candle_type, prepend=prepend)
+        return True
+
+    except Exception:
+        logger.exception(
+            f'Failed to download history data for pair: "{pair}", timeframe: {timeframe}.'
+        )
+        return False
 
-        logger.debug("New  Start: %s",
-                     f"{data.iloc[0]['date']:DATETIME_PRINT_FORMAT}" if not data.empty else 'None')
-        logger.debug("New End: %s",
-                     f"{data.iloc[-1]['date']:DATETIME_PRINT_FORMAT}" if not data.empty else 'None')
 
-        data_handler.ohlcv_store(pair, timeframe, data=data, candle_type=candle_type)
+async def _async_download_pair_history(pair: str, *,
+                                       exchange: Exchange,
+                                       storage: ThreadPoolExecutor,
+                                       timeframe: str,
+                                       candle_type: CandleType,
+                                       **kwargs) -> bool:
+    """
+    Async variant of _download_pair_history().
+    Stored candles are loaded and stored in the storage thread, so other pairs are downloaded
+    in the meantime.
+    :param kwargs: Remaining arguments of _prepare_pair_download()
+    """
+    loop = asyncio.get_running_loop()
+    try:
+        data, since_ms, until_ms = await loop.run_in_executor(storage, partial(
+            _prepare_pair_download, pair, timeframe=timeframe, candle_type=candle_type,
+            **kwargs))
+
+        _, _, _, new_data, _ = await exchange._async_get_historic_ohlcv(
+            pair=pair, timeframe=timeframe, since_ms=since_ms, is_new_pair=data.empty,
+            candle_type=candle_type, until_ms=until_ms if until_ms else None)
+        logger.info(f"Downloaded data for {pair} with length {len(new_data)}.")
+
+        await loop.run_in_executor(storage, partial(
+            _store_pair_download, pair, timeframe, data, new_data,
+            data_handler=kwargs['data_handler'], candle_type=candle_type,
+            prepend=kwargs['prepend']))
         return True
 
     except Exception:
@@ -267,37 +371,58 @@ def _download_pair_history(pair: str, *,
         return False
 
 
+def _download_pairs_history(exchange: Exchange, jobs: List[Dict[str, Any]],
+                            download_jobs: int, **kwargs) -> None:
+    """
+    Download candles for multiple pairs concurrently.
+    Up to `download_jobs` pairs are downloaded at once - requests are limited to the
+    exchange's rate limit by ccxt. Stored candles are loaded and stored by a separate thread.
+    :param jobs: pair, timeframe, candle_type and process of each download
+    :param kwargs: Arguments of _prepare_pair_download() shared by all jobs
+    """
+    pending = iter(jobs)
+
+    async def worker(storage: ThreadPoolExecutor) -> None:
+        # Workers share the iterator - each job is downloaded once.
+        for job in pending:
+            logger.info(f'Downloading pair {job["pair"]}, interval {job["timeframe"]}.')
+            await _async_download_pair_history(
+                exchange=exchange, storage=storage, **job, **kwargs)
+
+    async def download() -> None:
+        with ThreadPoolExecutor(max_workers=1) as storage:
+            await asyncio.gather(*(worker(storage) for _ in range(min(download_jobs, len(jobs)))))
+
+    exchange.loop.run_until_complete(download())
+
+
 def refresh_backtest_ohlcv_data(exchange: Exchange, pairs: List[str], timeframes: List[str],
                                 datadir: Path, trading_mode: str,
                                 timerange: Optional[TimeRange] = None,
                                 new_pairs_days: int = 30, erase: bool = False,
                                 data_format: Optional[str] = None,
                                 prepend: bool = False,
+                                download_jobs: int = 1,
                                 ) -> List[str]:
     """
     Refresh stored ohlcv data for backtesting and hyperopt operations.
     Used by freqtrade download-data subcommand.
+    :param download_jobs: Number of pairs to download concurrently.
     :return: List of pairs that are not available.
     """
     pairs_not_available = []
     data_handler = get_datahandler(datadir, data_format)
     candle_type = CandleType.get_default(trading_mode)
-    process = ''
+    jobs: List[Dict[str, Any]] = []
     for idx, pair in enumerate(pairs, start=1):
         if pair not in exchange.markets:
             pairs_not_available.append(pair)
             logger.info(f"Skipping pair {pair}...")
             continue
+        process = f'{idx}/{len(pairs)}'
         for timeframe in timeframes:
-
-            logger.info(f'Downloading pair {pair}, interval {timeframe}.')
-            process = f'{idx}/{len(pairs)}'
-            _download_pair_history(pair=pair, process=process,
-                                   datadir=datadir, exchange=exchange,
-                                   timerange=timerange, data_handler=data_handler,
-                                   timeframe=str(timeframe), new_pairs_days=new_pairs_days,
-                                   candle_type=candle_type,
-                                   erase=erase, prepend=prepend)
+            jobs.append({'pair': pair, 'process': process, 'timeframe': str(timeframe),
+                         'candle_type': candle_type})
         if trading_mode == 'futures':
             # Predefined candletype (and timeframe) depending on exchange
             # Downloads what is necessary to backtest based on futures data.
@@ -306,16 +431,45 @@ def refresh_backtest_ohlcv_data(exchange: Exchange, pairs: List[str], timeframes
             # All exchanges need FundingRate for futures trading.
             # The timeframe is aligned to the mark-price timeframe.
             for funding_candle_type in (CandleType.FUNDING_RATE, fr_candle_type):
-                _download_pair_history(pair=pair, process=process,
-                                       datadir=datadir, exchange=exchange,
-                                       timerange=timerange, data_handler=data_handler,
-                                       timeframe=str(tf_mark), new_pairs_days=new_pairs_days,
-                                       candle_type=funding_candle_type,
-                                       erase=erase, prepend=prepend)
+                jobs.append({'pair': pair, 'process': process, 'timeframe': str(tf_mark),
+                             'candle_type': funding_candle_type})
+
+    kwargs: Dict[str, Any] = {
+        'datadir': datadir, 'timerange': timerange, 'data_handler': data_handler,
+        'new_pairs_days': new_pairs_days, 'erase': erase, 'prepend': prepend}
+    if download_jobs > 1 and len(jobs) > 1:
+        _download_pairs_history(exchange, jobs, download_jobs, **kwargs)
+    else:
+        for job in jobs:
+            logger.info(f'Downloading pair {job["pair"]}, interval {job["timeframe"]}.')
+            _download_pair_history(exchange=exchange, **job, **kwargs)
 
     return pairs_not_available
 
 
+def _store_new_trades(pair: str, new_trades: TradeList, *, index: Optional[Dict[str, Any]],
+                      data_handler: IDataHandler) -> Dict[str, Any]:
+    """
+    Append new trades to the stored trades (or replace them if index is None), and update
+    the trades index.
+    :return: Updated trades index
+    """
+    if index is None:
+        data_handler.trades_store(pair, data=new_trades)
+        return data_handler.trades_store_index(pair, new_trades[0], new_trades[-1],
+                                               len(new_trades))
+    first_trade = [index['first_timestamp'], index['first_id']]
+    count = index['count'] + len(new_trades)
+    try:
+        data_handler.trades_append(pair, new_trades)
+    except NotImplementedError:
+        # Formats without append support are rewritten completely.
+        trades = trades_remove_duplicates(data_handler.trades_load(pair) + new_trades)
+        data_handler.trades_store(pair, data=trades)
+        first_trade, count = trades[0], len(trades)
+    return data_handler.trades_store_index(pair, first_trade, new_trades[-1], count)
+
+
 def _download_trades_history(exchange: Exchange,
                              pair: str, *,
                              new_pairs_days: int = 30,
@@ -324,7 +478,8 @@ def _download_trades_history(exchange: Exchange,
                              ) -> bool:
     """
     Download trade history from the exchange.
-    Appends to previously downloaded trades data.
+    Appends to previously downloaded trades data - only the trades overlapping with the
+    download are loaded to remove duplicates.
     """
     try:
 
@@ -336,31 +491,28 @@ def _download_trades_history(exchange: Exchange,
             if timerange.stoptype == 'date':
                 until = timerange.stopts * 1000
 
-        trades = data_handler.trades_load(pair)
+        index = data_handler.trades_get_index(pair)
 
-        # TradesList columns are defined in constants.DEFAULT_TRADES_COLUMNS
-        # DEFAULT_TRADES_COLUMNS: 0 -> timestamp
-        # DEFAULT_TRADES_COLUMNS: 1 -> id
-
-        if trades and since < trades[0][0]:
+        if index and since < index['first_timestamp']:
             # since is before the first trade
             logger.info(f"Start earlier than available data. Redownloading trades for {pair}...")
-            trades = []
+            index = None
 
         if not since:
             since = int((datetime.now() - timedelta(days=-new_pairs_days)).timestamp()) * 1000
 
-        from_id = trades[-1][1] if trades else None
-        if trades and since < trades[-1][0]:
+        from_id = index['last_id'] if index else None
+        if index and since < index['last_timestamp']:
             # Reset since to the last available point
             # - 5 seconds (to ensure we're getting all trades)
-            since = trades[-1][0] - (5 * 1000)
+            since = index['last_timestamp'] - (5 * 1000)
             logger.info(f"Using last trade date -5s - Downloading trades for {pair} "
                         f"since: {format_ms_time(since)}.")
 
-        logger.debug(f"Current Start: {format_ms_time(trades[0][0]) if trades else 'None'}")
-        logger.debug(f"Current End: {format_ms_time(trades[-1][0]) if trades else 'None'}")
-        logger.info(f"Current Amount of trades: {len(trades)}")
+        if index:
+            logger.debug(f"Current Start: {format_ms_time(index['first_timestamp'])}")
+            logger.debug(f"Current End: {format_ms_time(index['last_timestamp'])}")
+        logger.info(f"Current Amount of trades: {index['count'] if index else 0}")
 
         # Default since_ms to 30 days if nothing is given
         new_trades = exchange.get_historic_trades(pair=pair,
@@ -368,14 +520,23 @@ def _download_trades_history(exchange: Exchange,
                                                   until=until,
                                                   from_id=from_id,
                                                   )
-        trades.extend(new_trades[1])
         # Remove duplicates to make sure we're not storing data we don't need
-        trades = trades_remove_duplicates(trades)
-        data_handler.trades_store(pair, data=trades)
-
-        logger.debug(f"New Start: {format_ms_time(trades[0][0])}")
-        logger.debug(f"New End: {format_ms_time(trades[-1][0])}")
-        logger.info(f"New Amount of trades: {len(trades)}")
+        trades = trades_remove_duplicates(new_trades[1])
+        if index:
+            # Only stored trades from "since" on can overlap with the new trades.
+            # Trades are identified by timestamp and id - other fields may be NaN.
+            stored = {(trade[0], trade[1]) for trade in data_handler.trades_load(
+                pair, timerange=TimeRange('date', None, since // 1000, 0))}
+            # Trades are appended - so they must not be older than the stored trades.
+            trades = [trade for trade in trades if trade[0] >= index['last_timestamp']
+                      and (trade[0], trade[1]) not in stored]
+        if trades:
+            index = _store_new_trades(pair, trades, index=index, data_handler=data_handler)
+
+        if index:
+            logger.debug(f"New Start: {format_ms_time(index['first_timestamp'])}")
+            logger.debug(f"New End: {format_ms_time(index['last_timestamp'])}")
+        logger.info(f"New Amount of trades: {index['count'] if index else 0}")
         return True
 
     except Exception:
@@ -431,17 +592,19 @@ def convert_trades_to_ohlcv(
     data_handler_ohlcv = get_datahandler(datadir, data_format=data_format_ohlcv)
 
     for pair in pairs:
-        trades = data_handler_trades.trades_load(pair)
-        for timeframe in timeframes:
+        try:
+            # Trades are converted chunk by chunk, so not all trades have to fit into memory.
+            ohlcv_data = trades_chunks_to_ohlcv(data_handler_trades.trades_load_chunks(pair),
+                                                timeframes)
+        except ValueError:
+            logger.exception(f'Could not convert {pair} to OHLCV.')
+            continue
+        for timeframe, ohlcv in ohlcv_data.items():
             if erase:
                 if data_handler_ohlcv.ohlcv_purge(pair, timeframe, candle_type=candle_type):
                     logger.info(f'Deleting existing data for pair {pair}, interval {timeframe}.')
-            try:
-                ohlcv = trades_to_ohlcv(trades, timeframe)
-                # Store ohlcv
-                data_handler_ohlcv.ohlcv_store(pair, timeframe, data=ohlcv, candle_type=candle_type)
-            except ValueError:
-                logger.exception(f'Could not convert {pair} to OHLCV.')
+            # Store ohlcv
+            data_handler_ohlcv.ohlcv_store(pair, timeframe, data=ohlcv, candle_type=candle_type)
 
 
 def get_timerange(data: Dict[str, DataFrame]) -> Tuple[datetime, datetime]:
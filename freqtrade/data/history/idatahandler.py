@@ -9,13 +9,13 @@ from abc import ABC, abstractmethod
 from copy import deepcopy
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import List, Optional, Tuple, Type
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Type
 
 from pandas import DataFrame
 
 from freqtrade import misc
 from freqtrade.configuration import TimeRange
-from freqtrade.constants import ListPairsWithTimeframes, TradeList
+from freqtrade.constants import DEFAULT_TRADES_COLUMNS, ListPairsWithTimeframes, TradeList
 from freqtrade.data.converter import clean_ohlcv_dataframe, trades_remove_duplicates, trim_dataframe
 from freqtrade.enums import CandleType, TradingMode
 from freqtrade.exchange import timeframe_to_seconds
@@ -27,6 +27,8 @@ logger = logging.getLogger(__name__)
 class IDataHandler(ABC):
 
     _OHLCV_REGEX = r'^([a-zA-Z_\d-]+)\-(\d+[a-zA-Z]{1,2})\-?([a-zA-Z_]*)?(?=\.)'
+    # ohlcv_append() is implemented - downloads only need to know the last stored candle.
+    supports_append = False
 
     def __init__(self, datadir: Path) -> None:
         self._datadir = datadir
@@ -203,6 +205,9 @@ class IDataHandler(ABC):
         :return: True when deleted, false if file did not exist.
         """
         filename = self._pair_trades_filename(self._datadir, pair)
+        index_filename = self._trades_index_filename(filename)
+        if index_filename.is_file():
+            index_filename.unlink()
         if filename.exists():
             filename.unlink()
             return True
@@ -218,6 +223,76 @@ class IDataHandler(ABC):
         """
         return trades_remove_duplicates(self._trades_load(pair, timerange=timerange))
 
+    def trades_load_chunks(self, pair: str) -> Iterator[DataFrame]:
+        """
+        Load trades of a pair chunk by chunk, to limit memory usage.
+        Chunks are sorted by timestamp. Loads all trades as one chunk, unless implemented by
+        subclasses.
+        :param pair: Load trades for this pair
+        :return: Iterator of DataFrames with DEFAULT_TRADES_COLUMNS as columns
+        """
+        trades = self.trades_load(pair)
+        if trades:
+            yield DataFrame(trades, columns=DEFAULT_TRADES_COLUMNS)
+
+    @staticmethod
+    def _trades_index_filename(filename: Path) -> Path:
+        return filename.with_name(f'{filename.name}.index.json')
+
+    @staticmethod
+    def _trades_file_stat(filename: Path) -> List[int]:
+        stat = filename.stat()
+        return [stat.st_size, stat.st_mtime_ns]
+
+    def trades_get_index(self, pair: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the index of the stored trades of a pair - first / last timestamp and id, and the
+        amount of trades - without loading the trades.
+        The index is rebuilt from the trades if it's missing, or if the trades file was
+        written without updating the index.
+        :param pair: Pair to get the index for
+        :return: Index dict, or None if no trades are available
+        """
+        filename = self._pair_trades_filename(self._datadir, pair)
+        if not filename.exists():
+            return None
+        index_filename = self._trades_index_filename(filename)
+        if index_filename.is_file():
+            try:
+                with index_filename.open('r') as file:
+                    index = misc.json_load(file)
+                if index.get('file_stat') == self._trades_file_stat(filename):
+                    return index
+            except (OSError, ValueError):
+                pass
+        logger.info(f'Building trades index for {pair}.')
+        trades = self.trades_load(pair)
+        if not trades:
+            return None
+        return self.trades_store_index(pair, trades[0], trades[-1], len(trades))
+
+    def trades_store_index(self, pair: str, first_trade: List, last_trade: List,
+                           count: int) -> Dict[str, Any]:
+        """
+        Store the index of the trades of a pair. Call after the trades file was written.
+        :param pair: Pair the trades belong to
+        :param first_trade: First stored trade
+        :param last_trade: Last stored trade
+        :param count: Amount of stored trades
+        :return: Index dict
+        """
+        filename = self._pair_trades_filename(self._datadir, pair)
+        index = {
+            'first_timestamp': first_trade[0],
+            'first_id': first_trade[1],
+            'last_timestamp': last_trade[0],
+            'last_id': last_trade[1],
+            'count': count,
+            'file_stat': self._trades_file_stat(filename),
+        }
+        misc.file_dump_json(self._trades_index_filename(filename), index, log=False)
+        return index
+
     @classmethod
     def create_dir_if_needed(cls, datadir: Path):
         """
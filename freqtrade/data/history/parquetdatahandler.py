@@ -1,125 +1,85 @@
 import logging
-from typing import Optional
+from pathlib import Path
+from typing import Any, Iterable, Iterator, List, Optional, Tuple
 
-from pandas import DataFrame, read_parquet, to_datetime
+import pyarrow as pa
+from pandas import Timestamp
+from pyarrow import parquet
 
 from freqtrade.configuration import TimeRange
-from freqtrade.constants import DEFAULT_DATAFRAME_COLUMNS, TradeList
-from freqtrade.enums import CandleType
 
-from .idatahandler import IDataHandler
+from .columnardatahandler import ColumnarDataHandler, date_to_ms
 
 
 logger = logging.getLogger(__name__)
 
-
-class ParquetDataHandler(IDataHandler):
-
-    _columns = DEFAULT_DATAFRAME_COLUMNS
-
-    def ohlcv_store(
-            self, pair: str, timeframe: str, data: DataFrame, candle_type: CandleType) -> None:
+# Candles (or trades) per row group. Row groups are skipped based on their date statistics when
+# loading a timerange.
+PARQUET_ROW_GROUP_SIZE = 10_000
+
+
+class ParquetDataHandler(ColumnarDataHandler):
+
+    def _write_file(self, filename: Path, table: pa.Table) -> None:
+        parquet.write_table(table, filename, row_group_size=PARQUET_ROW_GROUP_SIZE)
+
+    def _write_batches(self, filename: Path, schema: pa.Schema,
+                       batches: Iterable[pa.RecordBatch]) -> None:
+        with parquet.ParquetWriter(filename, schema) as writer:
+            row_group: List[pa.RecordBatch] = []
+            rows = 0
+            for batch in batches:
+                row_group.append(batch)
+                rows += batch.num_rows
+                if rows >= PARQUET_ROW_GROUP_SIZE:
+                    writer.write_table(pa.Table.from_batches(row_group, schema))
+                    row_group, rows = [], 0
+            if rows:
+                writer.write_table(pa.Table.from_batches(row_group, schema))
+
+    def _read_file(self, filename: Path, timerange: Optional[TimeRange]) -> pa.Table:
+        return parquet.read_table(filename, filters=self._get_date_filters(filename, timerange))
+
+    def _iter_batches(self, filename: Path) -> Iterator[pa.RecordBatch]:
+        with parquet.ParquetFile(filename) as file:
+            yield from file.iter_batches(batch_size=PARQUET_ROW_GROUP_SIZE)
+
+    def _read_date_range(self, filename: Path) -> Optional[Tuple[int, int]]:
+        metadata = parquet.read_metadata(filename)
+        if not metadata.num_rows:
+            return None
+        # Rows are sorted by date - so the statistics of the first and last row group suffice.
+        first = metadata.row_group(0).column(0).statistics
+        last = metadata.row_group(metadata.num_row_groups - 1).column(0).statistics
+        if first is None or last is None or not first.has_min_max or not last.has_min_max:
+            dates = parquet.read_table(filename, columns=[metadata.schema.column(0).name])
+            return date_to_ms(dates.column(0)[0].as_py()), date_to_ms(dates.column(0)[-1].as_py())
+        return date_to_ms(first.min), date_to_ms(last.max)
+
+    @staticmethod
+    def _get_date_filters(filename, timerange: Optional[TimeRange]
+                          ) -> Optional[List[Tuple[str, str, Any]]]:
         """
-        Store data in json format "values".
-            format looks as follows:
-            [[<date>,<open>,<high>,<low>,<close>]]
-        :param pair: Pair - used to generate filename
-        :param timeframe: Timeframe - used to generate filename
-        :param data: Dataframe containing OHLCV data
-        :param candle_type: Any of the enum CandleType (must match trading mode!)
-        :return: None
-        """
-        filename = self._pair_data_filename(self._datadir, pair, timeframe, candle_type)
-        self.create_dir_if_needed(filename)
-
-        data.reset_index(drop=True).loc[:, self._columns].to_parquet(filename)
-
-    def _ohlcv_load(self, pair: str, timeframe: str,
-                    timerange: Optional[TimeRange], candle_type: CandleType
-                    ) -> DataFrame:
-        """
-        Internal method used to load data for one pair from disk.
-        Implements the loading and conversion to a Pandas dataframe.
-        Timerange trimming and dataframe validation happens outside of this method.
-        :param pair: Pair to load data
-        :param timeframe: Timeframe (e.g. "5m")
-        :param timerange: Limit data to be loaded to this timerange.
-                        Optionally implemented by subclasses to avoid loading
-                        all data where possible.
-        :param candle_type: Any of the enum CandleType (must match trading mode!)
-        :return: DataFrame with ohlcv data, or empty DataFrame
-        """
-        filename = self._pair_data_filename(
-            self._datadir, pair, timeframe, candle_type=candle_type)
-        if not filename.exists():
-            # Fallback mode for 1M files
-            filename = self._pair_data_filename(
-                self._datadir, pair, timeframe, candle_type=candle_type, no_timeframe_modify=True)
-            if not filename.exists():
-                return DataFrame(columns=self._columns)
-
-        pairdata = read_parquet(filename)
-        pairdata.columns = self._columns
-        pairdata = pairdata.astype(dtype={'open': 'float', 'high': 'float',
-                                          'low': 'float', 'close': 'float', 'volume': 'float'})
-        pairdata['date'] = to_datetime(pairdata['date'], unit='ms', utc=True)
-        return pairdata
-
-    def ohlcv_append(
-        self,
-        pair: str,
-        timeframe: str,
-        data: DataFrame,
-        candle_type: CandleType
-    ) -> None:
-        """
-        Append data to existing data structures
-        :param pair: Pair
-        :param timeframe: Timeframe this ohlcv data is for
-        :param data: Data to append.
-        :param candle_type: Any of the enum CandleType (must match trading mode!)
-        """
-        raise NotImplementedError()
-
-    def trades_store(self, pair: str, data: TradeList) -> None:
+        Build the filters for the timerange, matching the type of the stored date column
+        (the first column - date for candles, timestamp for trades).
         """
-        Store trades data (list of Dicts) to file
-        :param pair: Pair - used for filename
-        :param data: List of Lists containing trade data,
-                     column sequence as in DEFAULT_TRADES_COLUMNS
-        """
-        # filename = self._pair_trades_filename(self._datadir, pair)
-
-        raise NotImplementedError()
-        # array = pa.array(data)
-        # array
-        # feather.write_feather(data, filename)
-
-    def trades_append(self, pair: str, data: TradeList):
-        """
-        Append data to existing files
-        :param pair: Pair - used for filename
-        :param data: List of Lists containing trade data,
-                     column sequence as in DEFAULT_TRADES_COLUMNS
-        """
-        raise NotImplementedError()
-
-    def _trades_load(self, pair: str, timerange: Optional[TimeRange] = None) -> TradeList:
-        """
-        Load a pair from file, either .json.gz or .json
-        # TODO: respect timerange ...
-        :param pair: Load trades for this pair
-        :param timerange: Timerange to load trades for - currently not implemented
-        :return: List of trades
-        """
-        raise NotImplementedError()
-        # filename = self._pair_trades_filename(self._datadir, pair)
-        # tradesdata = misc.file_load_json(filename)
-
-        # if not tradesdata:
-        #     return []
-
-        # return tradesdata
+        if not timerange or (timerange.starttype != 'date' and timerange.stoptype != 'date'):
+            return None
+        date_field = parquet.read_schema(filename).field(0)
+        date_type = date_field.type
+
+        def to_date(timestamp: int) -> Any:
+            if pa.types.is_timestamp(date_type):
+                return Timestamp(timestamp, unit='s', tz='UTC' if date_type.tz else None)
+            # Dates stored as milliseconds
+            return timestamp * 1000
+
+        filters = []
+        if timerange.starttype == 'date':
+            filters.append((date_field.name, '>=', to_date(timerange.startts)))
+        if timerange.stoptype == 'date':
+            filters.append((date_field.name, '<=', to_date(timerange.stopts)))
+        return filters
 
     @classmethod
     def _get_file_extension(cls):
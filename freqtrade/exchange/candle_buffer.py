@@ -0,0 +1,154 @@
+"""
+Fixed-capacity in-memory candle (OHLCV) store, merging new candles in place.
+"""
+from typing import Dict, Optional
+
+import numpy as np
+from pandas import DataFrame, DatetimeTZDtype
+from pandas.arrays import DatetimeArray
+
+from freqtrade.exchange.exchange_utils import timeframe_to_msecs
+
+
+class CandleBuffer:
+    """
+    Holds the last `capacity` candles of a pair in column arrays of twice the capacity.
+    New candles are written behind the buffered candles - so they stay contiguous, and are
+    handed out as read-only DataFrame views on the arrays. Only once the end of the arrays is
+    reached (at most every `capacity` candles), or a candle already handed out changes, the
+    candles are moved to new arrays.
+    """
+    COLUMNS = ['open', 'high', 'low', 'close', 'volume']
+
+    def __init__(self, timeframe: str, capacity: int) -> None:
+        self.capacity = capacity
+        self._timeframe_ns = timeframe_to_msecs(timeframe) * 1_000_000
+        self._start = 0
+        self._end = 0
+        self._dates = np.empty(0, dtype='int64')
+        self._values: Dict[str, np.ndarray] = {}
+        # Last DataFrame handed out, while the candles are unchanged
+        self._snapshot: Optional[DataFrame] = None
+        # Candles of the current arrays referenced by DataFrames handed out
+        self._shared_end = 0
+        self._allocate(0)
+
+    def __len__(self) -> int:
+        return self._end - self._start
+
+    @property
+    def last_date_ms(self) -> Optional[int]:
+        """
+        Open date of the last buffered candle, in milliseconds.
+        """
+        return int(self._dates[self._end - 1]) // 1_000_000 if len(self) else None
+
+    def _allocate(self, keep: int) -> None:
+        """
+        Move the last `keep` candles to new arrays.
+        """
+        dates = np.empty(2 * self.capacity, dtype='int64')
+        dates[:keep] = self._dates[self._end - keep:self._end]
+        values = {}
+        for column in self.COLUMNS:
+            values[column] = np.empty(2 * self.capacity, dtype='float64')
+            if keep:
+                values[column][:keep] = self._values[column][self._end - keep:self._end]
+        self._dates, self._values = dates, values
+        self._start, self._end = 0, keep
+        self._shared_end = 0
+
+    def _append(self, dates: np.ndarray, values: Dict[str, np.ndarray]) -> None:
+        count = min(len(dates), self.capacity)
+        if not count:
+            return
+        if self._end + count > len(self._dates):
+            self._allocate(min(len(self), self.capacity - count))
+        end = self._end + count
+        self._dates[self._end:end] = dates[-count:]
+        for column in self.COLUMNS:
+            self._values[column][self._end:end] = values[column][-count:]
+        self._end = end
+        self._start = max(self._start, self._end - self.capacity)
+        self._snapshot = None
+
+    def merge(self, candles: DataFrame) -> bool:
+        """
+        Merge candles into the buffer - candles already buffered are combined, missing candles
+        between the buffered and the new candles are filled up with 0 volume candles.
+        :param candles: Candles, sorted by date without gaps (as returned by ohlcv_to_dataframe)
+        :return: False if the candles start before the buffered candles (nothing was merged)
+        """
+        if candles.empty:
+            return True
+        dates = candles['date'].values.view('int64')
+        if len(self) and dates[0] < self._dates[self._start]:
+            return False
+        values = {column: candles[column].to_numpy(dtype='float64') for column in self.COLUMNS}
+        new = 0
+        if len(self):
+            last_date = self._dates[self._end - 1]
+            new = int(np.searchsorted(dates, last_date, side='right'))
+            if new:
+                self._combine(dates[:new], {col: val[:new] for col, val in values.items()})
+            if new < len(dates):
+                self._fill_up(last_date, dates[new])
+        self._append(dates[new:], {column: value[new:] for column, value in values.items()})
+        return True
+
+    def _combine(self, dates: np.ndarray, values: Dict[str, np.ndarray]) -> None:
+        """
+        Combine buffered candles with new candles of the same date.
+        """
+        buffered = self._dates[self._start:self._end]
+        pos = np.searchsorted(buffered, dates)
+        found = buffered[np.minimum(pos, len(buffered) - 1)] == dates
+        pos = pos[found] + self._start
+        combined = {
+            'high': np.maximum(self._values['high'][pos], values['high'][found]),
+            'low': np.minimum(self._values['low'][pos], values['low'][found]),
+            'close': values['close'][found],
+            'volume': np.maximum(self._values['volume'][pos], values['volume'][found]),
+        }
+        if all(np.array_equal(self._values[column][pos], value)
+               for column, value in combined.items()):
+            return
+        if len(pos) and pos[0] < self._shared_end:
+            # Candles handed out don't change - move the candles to new arrays first.
+            pos -= self._start
+            self._allocate(len(self))
+        for column, value in combined.items():
+            self._values[column][pos] = value
+        self._snapshot = None
+
+    def _fill_up(self, last_date: int, next_date: int) -> None:
+        """
+        Fill up missing candles with the previous close and 0 volume.
+        """
+        dates = np.arange(last_date + self._timeframe_ns, next_date, self._timeframe_ns,
+                          dtype='int64')
+        if len(dates):
+            close = np.full(len(dates), self._values['close'][self._end - 1])
+            self._append(dates, {
+                'open': close, 'high': close, 'low': close, 'close': close,
+                'volume': np.zeros(len(dates)),
+            })
+
+    def dataframe(self) -> DataFrame:
+        """
+        Candles as read-only DataFrame.
+        The DataFrame is a view on the buffer, and is only built again once the candles changed.
+        Merging never changes DataFrames handed out.
+        """
+        if self._snapshot is None:
+            dates = self._dates[self._start:self._end].view('M8[ns]')
+            columns = {column: self._values[column][self._start:self._end]
+                       for column in self.COLUMNS}
+            for values in [dates, *columns.values()]:
+                values.flags.writeable = False
+            self._snapshot = DataFrame({
+                'date': DatetimeArray(dates, dtype=DatetimeTZDtype(tz='UTC')),
+                **columns,
+            }, copy=False)
+            self._shared_end = self._end
+        return self._snapshot
@@ -13,6 +13,7 @@ from typing import Any, Coroutine, Dict, List, Literal, Optional, Tuple, Union
 
 import ccxt
 import ccxt.async_support as ccxt_async
+import ccxt.pro as ccxt_pro
 from cachetools import TTLCache
 from ccxt import TICK_SIZE
 from dateutil import parser
@@ -22,11 +23,12 @@ from freqtrade.constants import (DEFAULT_AMOUNT_RESERVE_PERCENT, NON_OPEN_EXCHAN
                                  BuySell, Config, EntryExit, ExchangeConfig,
                                  ListPairsWithTimeframes, MakerTaker, OBLiteral, PairWithTimeframe)
 from freqtrade.data.converter import clean_ohlcv_dataframe, ohlcv_to_dataframe, trades_dict_to_list
-from freqtrade.enums import OPTIMIZE_MODES, CandleType, MarginMode, TradingMode
+from freqtrade.enums import OPTIMIZE_MODES, TRADING_MODES, CandleType, MarginMode, TradingMode
 from freqtrade.enums.pricetype import PriceType
 from freqtrade.exceptions import (DDosProtection, ExchangeError, InsufficientFundsError,
                                   InvalidOrderException, OperationalException, PricingError,
                                   RetryableOrderError, TemporaryError)
+from freqtrade.exchange.candle_buffer import CandleBuffer
 from freqtrade.exchange.common import (API_FETCH_ORDER_RETRY_COUNT, remove_exchange_credentials,
                                        retrier, retrier_async)
 from freqtrade.exchange.exchange_utils import (ROUND, ROUND_DOWN, ROUND_UP, CcxtModuleType,
@@ -37,6 +39,7 @@ from freqtrade.exchange.exchange_utils import (ROUND, ROUND_DOWN, ROUND_UP, Ccxt
                                                timeframe_to_minutes, timeframe_to_msecs,
                                                timeframe_to_next_date, timeframe_to_prev_date,
                                                timeframe_to_seconds)
+from freqtrade.exchange.exchange_ws import ExchangeWS
 from freqtrade.exchange.types import OHLCVResponse, OrderBook, Ticker, Tickers
 from freqtrade.misc import (chunks, deep_merge_dicts, file_dump_json, file_load_json,
                             safe_value_fallback2)
@@ -102,6 +105,7 @@ class Exchange:
         """
         self._api: ccxt.Exchange
         self._api_async: ccxt_async.Exchange = None
+        self._exchange_ws: Optional[ExchangeWS] = None
         self._markets: Dict = {}
         self._trading_fees: Dict[str, Any] = {}
         self._leverage_tiers: Dict[str, List[Dict]] = {}
@@ -129,6 +133,8 @@ class Exchange:
 
         # Holds candles
         self._klines: Dict[PairWithTimeframe, DataFrame] = {}
+        # Holds the buffers the candles in _klines are stored in
+        self._klines_buffers: Dict[PairWithTimeframe, CandleBuffer] = {}
 
         # Holds all open sell orders for dry_run
         self._dry_run_open_orders: Dict[str, Any] = {}
@@ -178,6 +184,8 @@ class Exchange:
                                              ccxt_async_config)
         self._api_async = self._init_ccxt(
             exchange_conf, ccxt_async, ccxt_kwargs=ccxt_async_config)
+        if exchange_conf.get('enable_ws', False) and config.get('runmode') in TRADING_MODES:
+            self._init_exchange_ws(exchange_conf, ccxt_async_config)
 
         logger.info(f'Using Exchange "{self.name}"')
         self.required_candle_call_count = 1
@@ -205,6 +213,9 @@ class Exchange:
 
     def close(self):
         logger.debug("Exchange object destroyed, closing async loop")
+        if self._exchange_ws:
+            self._exchange_ws.cleanup()
+            self._exchange_ws = None
         if (self._api_async and inspect.iscoroutinefunction(self._api_async.close)
                 and self._api_async.session):
             logger.debug("Closing async ccxt session.")
@@ -268,6 +279,20 @@ class Exchange:
 
         return api
 
+    def _init_exchange_ws(self, exchange_config: Dict[str, Any], ccxt_kwargs: Dict) -> None:
+        """
+        Initialize the websocket candle source, if supported by ccxt for this exchange.
+        """
+        name = exchange_config['name']
+        if is_exchange_known_ccxt(name, ccxt_pro):
+            api_ws = self._init_ccxt(exchange_config, ccxt_pro, ccxt_kwargs=ccxt_kwargs)
+            if api_ws.has.get('watchOHLCV'):
+                logger.info('Using websocket candle (OHLCV) updates.')
+                self._exchange_ws = ExchangeWS(api_ws)
+                return
+        logger.warning(f'Websocket candle updates are not supported for {name}, '
+                       'using REST instead.')
+
     @property
     def _ccxt_config(self) -> Dict:
         # Parameters to add directly to ccxt sync/async initialization.
@@ -1989,6 +2014,13 @@ class Exchange:
                 logger.info(
                     f"Time jump detected. Evicting cache for {pair}, {timeframe}, {candle_type}")
                 del self._klines[(pair, timeframe, candle_type)]
+                self._klines_buffers.pop((pair, timeframe, candle_type), None)
+
+        if (self._exchange_ws and cache and not since_ms
+                and candle_type in (CandleType.SPOT, CandleType.FUTURES)):
+            self._exchange_ws.schedule_ohlcv(pair, timeframe, candle_type)
+            if (pair, timeframe, candle_type) in self._klines:
+                return self._async_get_candle_history_ws(pair, timeframe, candle_type)
 
         if (not since_ms and (self._ft_has["ohlcv_require_since"] or not_all_data)):
             # Multiple calls for one pair - to get more history
@@ -2006,6 +2038,22 @@ class Exchange:
             return self._async_get_candle_history(
                 pair, timeframe, since_ms=since_ms, candle_type=candle_type)
 
+    async def _async_get_candle_history_ws(
+            self, pair: str, timeframe: str, candle_type: CandleType) -> OHLCVResponse:
+        """
+        Get the candles since the last cached candle from the websocket candle source.
+        Falls back to REST if these candles are not up to date or have gaps.
+        """
+        klines = self._klines.get((pair, timeframe, candle_type))
+        if self._exchange_ws and klines is not None and not klines.empty:
+            last_candle = klines.iloc[-1]['date']
+            ticks = self._exchange_ws.ohlcv(pair, timeframe, candle_type,
+                                            int(last_candle.timestamp() * 1000))
+            if ticks:
+                # The last candle is the current, incomplete candle.
+                return pair, timeframe, candle_type, ticks, True
+        return await self._async_get_candle_history(pair, timeframe, candle_type)
+
     def _build_ohlcv_dl_jobs(
             self, pair_list: ListPairsWithTimeframes, since_ms: Optional[int],
             cache: bool) -> Tuple[List[Coroutine], List[Tuple[str, str, CandleType]]]:
@@ -2043,22 +2091,31 @@ class Exchange:
         if ticks and cache:
             idx = -2 if drop_incomplete and len(ticks) > 1 else -1
             self._pairs_last_refresh_time[(pair, timeframe, c_type)] = ticks[idx][0] // 1000
+        buffer = self._klines_buffers.get((pair, timeframe, c_type)) if cache else None
+        if buffer is not None and buffer.last_date_ms is not None:
+            # Only candles from the last cached candle on need to be merged.
+            start = len(ticks)
+            while start > 0 and ticks[start - 1][0] >= buffer.last_date_ms:
+                start -= 1
+            ticks = ticks[start:]
         # keeping parsed dataframe in cache
         ohlcv_df = ohlcv_to_dataframe(ticks, timeframe, pair=pair, fill_missing=True,
                                       drop_incomplete=drop_incomplete)
         if cache:
-            if (pair, timeframe, c_type) in self._klines:
-                old = self._klines[(pair, timeframe, c_type)]
-                # Reassign so we return the updated, combined df
-                ohlcv_df = clean_ohlcv_dataframe(concat([old, ohlcv_df], axis=0), timeframe, pair,
-                                                 fill_missing=True, drop_incomplete=False)
+            if buffer is None or not buffer.merge(ohlcv_df):
+                if (pair, timeframe, c_type) in self._klines:
+                    old = self._klines[(pair, timeframe, c_type)]
+                    ohlcv_df = clean_ohlcv_dataframe(concat([old, ohlcv_df], axis=0), timeframe,
+                                                     pair, fill_missing=True,
+                                                     drop_incomplete=False)
                 candle_limit = self.ohlcv_candle_limit(timeframe, self._config['candle_type_def'])
-                # Age out old candles
-                ohlcv_df = ohlcv_df.tail(candle_limit + self._startup_candle_count)
-                ohlcv_df = ohlcv_df.reset_index(drop=True)
-                self._klines[(pair, timeframe, c_type)] = ohlcv_df
-            else:
-                self._klines[(pair, timeframe, c_type)] = ohlcv_df
+                # Old candles are aged out once more candles are merged
+                buffer = CandleBuffer(timeframe, max(candle_limit + self._startup_candle_count,
+                                                     len(ohlcv_df)))
+                buffer.merge(ohlcv_df)
+                self._klines_buffers[(pair, timeframe, c_type)] = buffer
+            ohlcv_df = buffer.dataframe()
+            self._klines[(pair, timeframe, c_type)] = ohlcv_df
         return ohlcv_df
 
     def refresh_latest_ohlcv(self, pair_list: ListPairsWithTimeframes, *,
@@ -2077,6 +2134,8 @@ class Exchange:
         :return: Dict of [{(pair, timeframe): Dataframe}]
         """
         logger.debug("Refreshing candle (OHLCV) data for %d pairs", len(pair_list))
+        if self._exchange_ws:
+            self._exchange_ws.cleanup_expired()
 
         # Gather coroutines to run
         input_coroutines, cached_pairs = self._build_ohlcv_dl_jobs(pair_list, since_ms, cache)
@@ -0,0 +1,143 @@
+"""
+Streaming candle (OHLCV) source - keeps candles up to date from websocket updates (ccxt.pro).
+"""
+import asyncio
+import inspect
+import logging
+import time
+from concurrent.futures import Future
+from functools import partial
+from threading import Thread
+from typing import Any, Dict, List, Optional, Tuple
+
+from freqtrade.constants import PairWithTimeframe
+from freqtrade.enums import CandleType
+from freqtrade.exchange.exchange_utils import (timeframe_to_msecs, timeframe_to_prev_date,
+                                               timeframe_to_seconds)
+
+
+logger = logging.getLogger(__name__)
+
+
+class ExchangeWS:
+    """
+    Watches the candles of the requested pairs in a background thread, running its own
+    event loop.
+    Candles are only handed out while they are up to date and connect to the candles already
+    known to the caller - otherwise, candles have to be refreshed via REST.
+    """
+
+    def __init__(self, ccxt_object: Any) -> None:
+        self.ccxt_object = ccxt_object
+        # Timestamp of the first candle received in the current subscription, and candles
+        self._klines: Dict[PairWithTimeframe, Tuple[int, List[List]]] = {}
+        # Running watcher per pair
+        self._klines_watching: Dict[PairWithTimeframe, Future] = {}
+        self._klines_last_request: Dict[PairWithTimeframe, float] = {}
+        self._loop = asyncio.new_event_loop()
+        self._thread = Thread(name='ccxt_ws', target=self._loop.run_forever, daemon=True)
+        self._thread.start()
+
+    def cleanup(self) -> None:
+        """
+        Stop watching all candles, close the websocket connections and stop the thread.
+        """
+        logger.debug("Stopping websocket candle source.")
+        self._klines_watching.clear()
+        if self._thread.is_alive():
+            try:
+                asyncio.run_coroutine_threadsafe(self._stop(), self._loop).result(timeout=10)
+            except Exception as e:
+                logger.warning(f"Closing websocket connections failed: {e}")
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join()
+        if not self._loop.is_closed():
+            self._loop.close()
+
+    async def _stop(self) -> None:
+        tasks = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        if inspect.iscoroutinefunction(self.ccxt_object.close):
+            await self.ccxt_object.close()
+
+    def schedule_ohlcv(self, pair: str, timeframe: str, candle_type: CandleType) -> None:
+        """
+        Start watching the candles of a pair (if not watched yet).
+        Pairs are watched until they weren't requested for 3 candles.
+        """
+        paircomb = (pair, timeframe, candle_type)
+        self._klines_last_request[paircomb] = time.time()
+        if paircomb not in self._klines_watching:
+            watcher = asyncio.run_coroutine_threadsafe(self._watch_ohlcv(paircomb), self._loop)
+            self._klines_watching[paircomb] = watcher
+            watcher.add_done_callback(partial(self._watch_done, paircomb))
+
+    def cleanup_expired(self) -> None:
+        """
+        Stop watching candles which weren't requested for 3 candles.
+        """
+        now = time.time()
+        for paircomb in list(self._klines_watching):
+            timeout = timeframe_to_seconds(paircomb[1]) * 3
+            if self._klines_last_request.get(paircomb, 0) + timeout < now:
+                logger.debug(f"Stopping to watch candles of {paircomb}.")
+                watcher = self._klines_watching.pop(paircomb, None)
+                self._klines.pop(paircomb, None)
+                if watcher:
+                    watcher.cancel()
+                    if self.ccxt_object.has.get('unWatchOHLCV'):
+                        asyncio.run_coroutine_threadsafe(self._unwatch_ohlcv(paircomb),
+                                                         self._loop)
+
+    def _watch_done(self, paircomb: PairWithTimeframe, watcher: Future) -> None:
+        # A newer watcher may have been scheduled for the pair in the meantime.
+        if self._klines_watching.get(paircomb) is watcher:
+            del self._klines_watching[paircomb]
+            self._klines.pop(paircomb, None)
+
+    async def _watch_ohlcv(self, paircomb: PairWithTimeframe) -> None:
+        pair, timeframe, _ = paircomb
+        try:
+            since: Optional[int] = None
+            while True:
+                candles = await self.ccxt_object.watch_ohlcv(pair, timeframe)
+                if since is None:
+                    # Candles before the subscription may be incomplete.
+                    since = candles[-1][0]
+                self._klines[paircomb] = (since, candles)
+        except Exception as e:
+            logger.warning(f"Watching candles of {pair}, {timeframe} failed: {e}")
+
+    async def _unwatch_ohlcv(self, paircomb: PairWithTimeframe) -> None:
+        pair, timeframe, _ = paircomb
+        try:
+            await self.ccxt_object.un_watch_ohlcv(pair, timeframe)
+        except Exception as e:
+            logger.debug(f"Unsubscribing from candles of {pair}, {timeframe} failed: {e}")
+
+    def ohlcv(self, pair: str, timeframe: str, candle_type: CandleType,
+              last_candle_ms: int) -> Optional[List[List]]:
+        """
+        Get the candles received since the last known candle.
+        :param last_candle_ms: Open date (in ms) of the last candle known to the caller
+        :return: Candles, including the current (incomplete) candle. None if the candles are not
+            up to date (no update since the current candle opened), or don't connect to
+            last_candle_ms.
+        """
+        if (pair, timeframe, candle_type) not in self._klines:
+            return None
+        since, stored = self._klines[(pair, timeframe, candle_type)]
+        timeframe_ms = timeframe_to_msecs(timeframe)
+        # Copy first, stored is updated by the websocket thread.
+        candles = [candle for candle in list(stored)
+                   if candle[0] >= max(since, last_candle_ms)]
+        current_candle_ms = timeframe_to_prev_date(timeframe).timestamp() * 1000
+        if not candles or candles[-1][0] < current_candle_ms:
+            return None
+        if candles[0][0] > last_candle_ms + timeframe_ms or any(
+                candle[0] - prev[0] != timeframe_ms for prev, candle in zip(candles, candles[1:])):
+            logger.debug(f"Gap in websocket candles of {pair}, {timeframe}, {candle_type}.")
+            return None
+        return candles
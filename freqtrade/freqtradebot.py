@@ -3,6 +3,7 @@ Freqtrade is the main module of this bot. It contains the class Freqtrade()
 """
 import logging
 import traceback
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
 from datetime import datetime, time, timedelta, timezone
 from math import isclose
@@ -117,6 +118,9 @@ class FreqtradeBot(LoggingMixin):
 
         # Protect exit-logic from forcesell and vice versa
         self._exit_lock = Lock()
+        # Refreshes candles while fees of trades are updated
+        self._refresh_executor = ThreadPoolExecutor(max_workers=1,
+                                                    thread_name_prefix='candle_refresh')
         LoggingMixin.__init__(self, logger, timeframe_to_seconds(self.strategy.timeframe))
 
         self.trading_mode: TradingMode = self.config.get('trading_mode', TradingMode.SPOT)
@@ -173,6 +177,7 @@ class FreqtradeBot(LoggingMixin):
         self.rpc.cleanup()
         if self.emc:
             self.emc.shutdown()
+        self._refresh_executor.shutdown()
         self.exchange.close()
         try:
             Trade.commit()
@@ -210,16 +215,21 @@ class FreqtradeBot(LoggingMixin):
         # Check whether markets have to be reloaded and reload them when it's needed
         self.exchange.reload_markets()
 
-        self.update_trades_without_assigned_fees()
-
         # Query trades from persistence layer
         trades: List[Trade] = Trade.get_open_trades()
 
         self.active_pair_whitelist = self._refresh_active_whitelist(trades)
 
-        # Refreshing candles
-        self.dataprovider.refresh(self.pairlists.create_pair_list(self.active_pair_whitelist),
-                                  self.strategy.gather_informative_pairs())
+        # Refreshing candles - in the background, as fees of trades don't depend on candles
+        refresh = self._refresh_executor.submit(
+            self.dataprovider.refresh,
+            self.pairlists.create_pair_list(self.active_pair_whitelist),
+            self.strategy.gather_informative_pairs())
+        try:
+            self.update_trades_without_assigned_fees()
+        finally:
+            # Wait for the candles (re-raises exceptions of the refresh)
+            refresh.result()
 
         strategy_safe_wrapper(self.strategy.bot_loop_start, supress_error=True)(
             current_time=datetime.now(timezone.utc))
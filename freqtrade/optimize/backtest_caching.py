@@ -1,16 +1,17 @@
 import hashlib
 from copy import deepcopy
 from pathlib import Path
-from typing import Union
+from typing import Tuple, Union
 
 import rapidjson
 
 
-def get_strategy_run_id(strategy) -> str:
+def get_strategy_run_id(strategy, ignored_keys: Tuple[str, ...] = ()) -> str:
     """
     Generate unique identification hash for a backtest run. Identical config and strategy file will
     always return an identical hash.
     :param strategy: strategy object.
+    :param ignored_keys: Additional config keys which don't change the hash.
     :return: hex string id.
     """
     digest = hashlib.sha1()
@@ -18,7 +19,7 @@ def get_strategy_run_id(strategy) -> str:
 
     # Options that have no impact on results of individual backtest.
     not_important_keys = ('strategy_list', 'original_config', 'telegram', 'api_server')
-    for k in not_important_keys:
+    for k in not_important_keys + ignored_keys:
         if k in config:
             del config[k]
 
@@ -0,0 +1,262 @@
+"""
+Columnar candle store used by backtesting.
+
+Each pair's candles are kept as one NumPy array per column. Price columns are taken from the
+analyzed dataframe without conversion, only the signal and tag columns are shifted and copied.
+Rows are exposed through `CandleRow`, which only boxes the values that are actually accessed.
+"""
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+from pandas import DataFrame, Timestamp, isna
+
+
+# Indexes for backtest rows
+DATE_IDX = 0
+OPEN_IDX = 1
+HIGH_IDX = 2
+LOW_IDX = 3
+CLOSE_IDX = 4
+LONG_IDX = 5
+ELONG_IDX = 6  # Exit long
+SHORT_IDX = 7
+ESHORT_IDX = 8  # Exit short
+ENTER_TAG_IDX = 9
+EXIT_TAG_IDX = 10
+
+# Every change to this headers list must evaluate further usages of the resulting rows
+# and eventually change the constants for indexes at the top
+HEADERS = ['date', 'open', 'high', 'low', 'close', 'enter_long', 'exit_long',
+           'enter_short', 'exit_short', 'enter_tag', 'exit_tag']
+
+PRICE_COLUMNS = HEADERS[OPEN_IDX:LONG_IDX]
+SIGNAL_COLUMNS = HEADERS[LONG_IDX:ENTER_TAG_IDX]
+TAG_COLUMNS = HEADERS[ENTER_TAG_IDX:]
+
+
+class PairCandles:
+    """
+    Struct-of-arrays store for the backtest candles of one pair.
+    Columns follow HEADERS - dates are stored as int64 nanoseconds (UTC), tag columns are
+    object arrays.
+    """
+    __slots__ = ('columns', )
+
+    def __init__(self, columns: Tuple[np.ndarray, ...]) -> None:
+        self.columns = columns
+
+    @classmethod
+    def from_dataframe(cls, dataframe: DataFrame) -> 'PairCandles':
+        """
+        Build the store from an analyzed dataframe.
+        To avoid using data from future, signals / tags are shifted from the previous candle -
+        the first candle is dropped, as it has no signal.
+        """
+        if dataframe.empty:
+            return cls.empty()
+        return cls((*get_prices(dataframe), *get_shifted_signals(dataframe)))
+
+    @classmethod
+    def empty(cls) -> 'PairCandles':
+        return cls((np.array([], dtype=np.int64),
+                    *(np.array([], dtype=np.float64) for _ in HEADERS[OPEN_IDX:ENTER_TAG_IDX]),
+                    *(np.array([], dtype=object) for _ in TAG_COLUMNS)))
+
+    def __len__(self) -> int:
+        return len(self.columns[DATE_IDX])
+
+    def __getitem__(self, index: int) -> 'CandleRow':
+        length = len(self)
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError('Candle index out of range')
+        return CandleRow(self, index)
+
+    def __iter__(self) -> Iterator['CandleRow']:
+        return (CandleRow(self, index) for index in range(len(self)))
+
+    def date_at(self, index: int) -> Timestamp:
+        return Timestamp(self.dates.item(index), tz='UTC')
+
+    @property
+    def dates(self) -> np.ndarray:
+        return self.columns[DATE_IDX]
+
+    @property
+    def open(self) -> np.ndarray:
+        return self.columns[OPEN_IDX]
+
+    @property
+    def high(self) -> np.ndarray:
+        return self.columns[HIGH_IDX]
+
+    @property
+    def low(self) -> np.ndarray:
+        return self.columns[LOW_IDX]
+
+    @property
+    def close(self) -> np.ndarray:
+        return self.columns[CLOSE_IDX]
+
+    @property
+    def enter_long(self) -> np.ndarray:
+        return self.columns[LONG_IDX]
+
+    @property
+    def exit_long(self) -> np.ndarray:
+        return self.columns[ELONG_IDX]
+
+    @property
+    def enter_short(self) -> np.ndarray:
+        return self.columns[SHORT_IDX]
+
+    @property
+    def exit_short(self) -> np.ndarray:
+        return self.columns[ESHORT_IDX]
+
+
+class CandleRow:
+    """
+    Read-only view on one candle of a PairCandles store.
+    Supports the same `row[<IDX>]` access as the tuple rows used for detail candles.
+    """
+    __slots__ = ('_candles', '_index', '_date')
+
+    def __init__(self, candles: PairCandles, index: int) -> None:
+        self._candles = candles
+        self._index = index
+        self._date: Optional[Timestamp] = None
+
+    def __getitem__(self, idx: int) -> Any:
+        if idx == DATE_IDX:
+            if self._date is None:
+                self._date = self._candles.date_at(self._index)
+            return self._date
+        return self._candles.columns[idx].item(self._index)
+
+    def __len__(self) -> int:
+        return len(HEADERS)
+
+    def __iter__(self) -> Iterator[Any]:
+        return (self[idx] for idx in range(len(HEADERS)))
+
+    def __repr__(self) -> str:
+        return f'CandleRow({list(self)})'
+
+
+class DetailCandles:
+    """
+    Detail timeframe candles of one pair, with an offset index per main timeframe candle.
+    Allows `get_range()` to locate the detail candles of a main candle without masking.
+    """
+
+    def __init__(self, dataframe: DataFrame, timeframe_ns: int) -> None:
+        self.timeframe_ns = timeframe_ns
+        self.dates = dataframe['date'].to_numpy(dtype='datetime64[ns]').view(np.int64)
+        self.prices = tuple(dataframe[col].to_numpy(dtype=np.float64) for col in PRICE_COLUMNS)
+        if len(self.dates):
+            self.first_candle = self.dates[0] // timeframe_ns * timeframe_ns
+            candles = (self.dates[-1] - self.first_candle) // timeframe_ns + 1
+            # offsets[k]:offsets[k + 1] are the detail rows of main candle k (from first_candle)
+            self.offsets = np.searchsorted(
+                self.dates, self.first_candle + np.arange(candles + 1) * timeframe_ns)
+        else:
+            self.first_candle = 0
+            self.offsets = np.zeros(1, dtype=np.int64)
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    def get_range(self, date_ns: int) -> Tuple[int, int]:
+        """
+        Get start / end row of the detail candles of the main candle starting at date_ns.
+        """
+        candle, remainder = divmod(date_ns - self.first_candle, self.timeframe_ns)
+        if remainder:
+            # Main candle not aligned to the index (e.g. weekly candles).
+            return (int(np.searchsorted(self.dates, date_ns)),
+                    int(np.searchsorted(self.dates, date_ns + self.timeframe_ns)))
+        if not 0 <= candle < len(self.offsets) - 1:
+            return 0, 0
+        return int(self.offsets[candle]), int(self.offsets[candle + 1])
+
+    def get_rows(self, start: int, end: int, signals: List[Any]) -> Iterator[Tuple[Any, ...]]:
+        """
+        Build backtest rows for the detail candles in [start, end), using the signals of the
+        main candle.
+        """
+        open_, high, low, close = self.prices
+        for idx in range(start, end):
+            yield (Timestamp(self.dates.item(idx), tz='UTC'), open_.item(idx), high.item(idx),
+                   low.item(idx), close.item(idx), *signals)
+
+
+class PriceCache:
+    """
+    Per-process cache of the date and price columns of each pair.
+    Hyperopt epochs only differ in their signals - so hyperopt workers keep the prices from
+    their first epoch, and only derive the signal columns for following epochs.
+    """
+
+    def __init__(self) -> None:
+        self.scope: Optional[str] = None
+        self._prices: Dict[str, Tuple[Tuple[int, int, int], Tuple[np.ndarray, ...]]] = {}
+
+    def get_candles(self, scope: str, pair: str, dataframe: DataFrame) -> PairCandles:
+        """
+        Build the candle store for this pair, reusing cached prices if available.
+        :param scope: Identifies the dataset (e.g. the hyperopt run). Changing the scope
+            invalidates all cached prices.
+        """
+        if scope != self.scope:
+            self.clear()
+            self.scope = scope
+        if dataframe.empty:
+            return PairCandles.empty()
+        dates = dataframe['date']
+        key = (len(dataframe), dates.iat[0].value, dates.iat[-1].value)
+        cached = self._prices.get(pair)
+        if cached is None or cached[0] != key:
+            # Copy, so the cache doesn't keep the (per epoch) dataframe alive.
+            cached = (key, tuple(np.array(col) for col in get_prices(dataframe)))
+            self._prices[pair] = cached
+        return PairCandles((*cached[1], *get_shifted_signals(dataframe)))
+
+    def clear(self) -> None:
+        self.scope = None
+        self._prices = {}
+
+
+price_cache = PriceCache()
+
+
+def get_prices(dataframe: DataFrame) -> Tuple[np.ndarray, ...]:
+    """
+    Extract date and price columns (the first candle is dropped to align with the signals).
+    Returns views on the dataframe where possible.
+    """
+    dates = dataframe['date'].to_numpy(dtype='datetime64[ns]').view(np.int64)[1:]
+    return (dates, *(dataframe[col].to_numpy(dtype=np.float64)[1:] for col in PRICE_COLUMNS))
+
+
+def get_shifted_signals(dataframe: DataFrame) -> Tuple[np.ndarray, ...]:
+    """
+    Extract signal and tag columns, shifted by one candle (the first candle is dropped).
+    Missing signals default to 0, missing tags to None.
+    """
+    signals = []
+    for col in SIGNAL_COLUMNS:
+        if col in dataframe.columns:
+            signals.append(dataframe[col].to_numpy(dtype=np.float64, na_value=0.0)[:-1])
+        else:
+            signals.append(np.zeros(len(dataframe) - 1, dtype=np.float64))
+    tags = []
+    for col in TAG_COLUMNS:
+        if col in dataframe.columns:
+            values = dataframe[col].to_numpy(dtype=object, copy=True)[:-1]
+            values[isna(values)] = None
+            tags.append(values)
+        else:
+            tags.append(np.full(len(dataframe) - 1, None, dtype=object))
+    return (*signals, *tags)
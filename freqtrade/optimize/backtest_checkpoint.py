@@ -0,0 +1,103 @@
+"""
+Checkpoints of the backtest loop, to extend a prior backtest to a later end date.
+
+At the end of a backtest, the loop state (trades, locks and counters) is stored as it was
+before the last candle was processed - the last candle is special, as no trades are opened
+on it and trades left open are closed afterwards. Next to the state, the checkpoint stores a
+fingerprint of all candles processed up to that point.
+A backtest of the same strategy and config with a later end date resumes from the checkpoint
+if the fingerprints still match, and only simulates the new candles.
+"""
+import hashlib
+import logging
+import pickle
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+
+import numpy as np
+
+from freqtrade.persistence import LocalTrade, PairLocks
+
+
+logger = logging.getLogger(__name__)
+
+# Increase when the checkpoint content changes - older checkpoints are ignored.
+CHECKPOINT_VERSION = 1
+
+
+def get_checkpoint_filename(user_data_dir: Path, strategy_name: str) -> Path:
+    return user_data_dir / 'backtest_results' / '.checkpoints' / f'{strategy_name}.pkl'
+
+
+def get_fingerprint(columns: Iterable[np.ndarray]) -> str:
+    """
+    Hash the content of candle columns. Object columns (tags) are hashed by their repr.
+    """
+    digest = hashlib.sha1()
+    for column in columns:
+        if column.dtype == object:
+            digest.update(repr(column.tolist()).encode('utf-8'))
+        else:
+            digest.update(np.ascontiguousarray(column).tobytes())
+    return digest.hexdigest()
+
+
+def dump_loop_state(attributes: Dict[str, Any]) -> bytes:
+    """
+    Pickle trades and locks of the running backtest, together with attributes (counters) of
+    the Backtesting instance.
+    Trades are modified by the remaining backtest - so they have to be pickled right away.
+    """
+    return pickle.dumps({
+        'trades': LocalTrade.trades,
+        'trades_open': LocalTrade.trades_open,
+        # Key order matters - trades left open are closed in this order.
+        'bt_trades_open_pp': dict(LocalTrade.bt_trades_open_pp),
+        'bt_open_open_trade_count': LocalTrade.bt_open_open_trade_count,
+        'total_profit': LocalTrade.total_profit,
+        'locks': PairLocks.locks,
+        'attributes': attributes,
+    })
+
+
+def load_loop_state(state: bytes) -> Dict[str, Any]:
+    """
+    Restore trades and locks from a state created by dump_loop_state().
+    :return: The attributes stored with the state
+    """
+    loaded = pickle.loads(state)
+    LocalTrade.trades = loaded['trades']
+    LocalTrade.trades_open = loaded['trades_open']
+    LocalTrade.bt_trades_open_pp = defaultdict(list, loaded['bt_trades_open_pp'])
+    LocalTrade.bt_open_open_trade_count = loaded['bt_open_open_trade_count']
+    LocalTrade.total_profit = loaded['total_profit']
+    PairLocks.locks = loaded['locks']
+    return loaded['attributes']
+
+
+def store_checkpoint(filename: Path, checkpoint: Dict[str, Any]) -> None:
+    filename.parent.mkdir(parents=True, exist_ok=True)
+    tmp_file = filename.with_suffix('.tmp')
+    with tmp_file.open('wb') as f:
+        pickle.dump({'version': CHECKPOINT_VERSION, **checkpoint}, f)
+    # Replace at once, so an interrupted backtest doesn't leave a broken checkpoint.
+    tmp_file.replace(filename)
+
+
+def load_checkpoint(filename: Path) -> Optional[Dict[str, Any]]:
+    """
+    Load a checkpoint stored by store_checkpoint().
+    :return: The checkpoint, or None if there is no (usable) checkpoint
+    """
+    if not filename.is_file():
+        return None
+    try:
+        with filename.open('rb') as f:
+            checkpoint = pickle.load(f)
+    except Exception as e:
+        logger.warning(f'Could not load backtest checkpoint {filename}: {e}')
+        return None
+    if not isinstance(checkpoint, dict) or checkpoint.get('version') != CHECKPOINT_VERSION:
+        return None
+    return checkpoint
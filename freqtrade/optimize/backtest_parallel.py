@@ -0,0 +1,90 @@
+"""
+Helpers to run backtests in worker processes.
+"""
+import sys
+from contextlib import contextmanager
+from typing import Iterator, List, Optional
+
+import numpy as np
+from joblib.externals import cloudpickle
+from pandas import Timestamp
+
+from freqtrade.exchange import Exchange
+from freqtrade.persistence import LocalTrade
+
+
+# Exchange attributes which can't be pickled. Backtesting only needs the cached markets.
+EXCHANGE_CONNECTION_ATTRS = ('_api', '_api_async', 'loop', '_loop_lock', '_cache_lock')
+
+
+def register_pickle_by_value(bases) -> None:
+    """
+    Allow strategy inheritance across files when shipping strategies to worker processes.
+    For this to properly work, we need to register the module of the imported class
+    to pickle as value.
+    """
+    for modules in bases:
+        if modules.__name__ != 'IStrategy':
+            cloudpickle.register_pickle_by_value(sys.modules[modules.__module__])
+            register_pickle_by_value(modules.__bases__)
+
+
+@contextmanager
+def detached_exchange(exchange: Exchange) -> Iterator[None]:
+    """
+    Temporarily remove the api connections from the exchange, so it can be pickled
+    and sent to worker processes.
+    """
+    connection = {attr: getattr(exchange, attr, None) for attr in EXCHANGE_CONNECTION_ATTRS}
+    for attr in EXCHANGE_CONNECTION_ATTRS:
+        setattr(exchange, attr, None)
+    try:
+        yield
+    finally:
+        for attr, value in connection.items():
+            setattr(exchange, attr, value)
+
+
+def shared_wallet_allows(trades: List[LocalTrade], stake_amount: float, starting_balance: float,
+                         tradable_balance_ratio: float,
+                         available_capital: Optional[float] = None) -> bool:
+    """
+    Check if a shared wallet would have allowed every entry of a pair-sharded backtest.
+    Pair shards trade against their own (unlimited) wallet - their trades only match a regular
+    backtest if the stake was available in the shared wallet at the time of every entry.
+    Replicates `Wallets.get_available_stake_amount()` for dry-run wallets. Trades closing
+    at the time of an entry count as still open, but with their loss applied.
+    :param trades: Closed trades of all shards
+    :param stake_amount: Configured (fixed) stake amount
+    """
+    if not trades:
+        return True
+    open_ns = np.array([Timestamp(t.open_date_utc).value for t in trades], dtype=np.int64)
+    close_ns = np.array([Timestamp(t.close_date_utc).value for t in trades], dtype=np.int64)
+    stakes = np.array([t.stake_amount for t in trades], dtype=np.float64)
+    profits = np.array([t.close_profit_abs for t in trades], dtype=np.float64)
+
+    by_close = np.argsort(close_ns, kind='stable')
+    close_sorted = close_ns[by_close]
+    closed_profit = np.concatenate(([0.0], np.cumsum(profits[by_close])))
+    closed_loss = np.concatenate(([0.0], np.cumsum(np.minimum(profits[by_close], 0.0))))
+    closed_stake = np.concatenate(([0.0], np.cumsum(stakes[by_close])))
+    closed_before = np.searchsorted(close_sorted, open_ns, side='left')
+    closing_at = np.searchsorted(close_sorted, open_ns, side='right')
+    profit = (closed_profit[closed_before]
+              + closed_loss[closing_at] - closed_loss[closed_before])
+
+    by_open = np.argsort(open_ns, kind='stable')
+    opened_stake = np.concatenate(([0.0], np.cumsum(stakes[by_open])))
+    # Other trades entering at the same time may have been entered before this one.
+    opened = opened_stake[np.searchsorted(open_ns[by_open], open_ns, side='right')] - stakes
+    tied_up = opened - closed_stake[closed_before]
+
+    balance = starting_balance + profit
+    if available_capital is not None:
+        total_stake = available_capital + profit
+    else:
+        total_stake = balance * tradable_balance_ratio
+    available = np.minimum(total_stake - tied_up, balance - tied_up)
+    # Leave a margin for rounding differences to the sequential wallet calculation.
+    return bool(np.all(stake_amount * (1 + 1e-9) <= available))
@@ -0,0 +1,153 @@
+"""
+Vectorized helpers for the signal-only backtesting fast path.
+
+The fast path does not reimplement any trading logic. It uses NumPy scans to find the few
+candles on which something can happen (entry signals, stoploss / liquidation hits,
+trailing stop movements, ROI and exit signals) - and feeds only these candles through the
+regular `Backtesting.backtest_loop()`. All other candles are no-ops for the loop engine.
+"""
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+from pandas import Timestamp
+
+from freqtrade.optimize.backtest_candles import PairCandles
+from freqtrade.persistence import LocalTrade
+from freqtrade.strategy.interface import IStrategy
+
+
+# Callbacks which are called on every candle of an open trade.
+# Strategies overriding one of these can't use the vectorized engine.
+PER_CANDLE_CALLBACKS = ('bot_loop_start', 'custom_exit', 'custom_sell')
+
+# Tolerance used when pre-selecting ROI candles - the real check happens in the loop engine.
+ROI_TOLERANCE = 1e-6
+
+# Initial window (in candles) used when scanning for the next exit candidate.
+EXIT_SCAN_WINDOW = 32
+
+
+def is_callback_overridden(strategy: IStrategy, name: str) -> bool:
+    """
+    Check if the strategy (or an instance-level patch) replaces the IStrategy default callback.
+    """
+    method = getattr(strategy, name)
+    return getattr(method, '__func__', None) is not getattr(IStrategy, name)
+
+
+def get_processing_steps(dates: np.ndarray, start_ns: int, timeframe_ns: int) -> np.ndarray:
+    """
+    Calculate the time-step each row is processed at by the loop engine.
+    The loop engine starts at `start + timeframe` and consumes at most one row per pair and
+    time-step - as soon as the row's date is reached.
+    :param dates: Row dates as int64 nanoseconds
+    :return: Array of time-step numbers (strictly increasing), aligned with dates.
+    """
+    if len(dates) == 0:
+        return np.array([], dtype=np.int64)
+    # Ceil division - first step where step_time >= date
+    first_possible = np.maximum(-((start_ns - dates) // timeframe_ns), 1)
+    offset = np.arange(len(dates), dtype=np.int64)
+    return np.maximum.accumulate(first_possible - offset) + offset
+
+
+def get_entry_mask(candles: PairCandles, can_short: bool) -> np.ndarray:
+    """
+    Vectorized version of `Backtesting.check_for_trade_entry()`.
+    :return: boolean array, True where an entry would be attempted.
+    """
+    enter_long = candles.enter_long == 1
+    exit_long = candles.exit_long == 1
+    if can_short:
+        enter_short = candles.enter_short == 1
+        exit_short = candles.exit_short == 1
+    else:
+        enter_short = exit_short = np.zeros(len(enter_long), dtype=bool)
+    long = enter_long & ~(exit_long | enter_short)
+    short = enter_short & ~(exit_short | enter_long)
+    return long | short
+
+
+def get_roi_table(minimal_roi: Dict) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Convert the minimal_roi dict into sorted key / value lists.
+    """
+    keys = sorted(minimal_roi.keys())
+    return (np.array(keys, dtype=np.int64),
+            np.array([minimal_roi[k] for k in keys], dtype=np.float64))
+
+
+def exit_candidate_mask(candles: PairCandles, start: int, end: int, trade: LocalTrade,
+                        strategy: IStrategy, roi_table: Tuple[np.ndarray, np.ndarray]
+                        ) -> np.ndarray:
+    """
+    Flag the candles in [start, end) on which `should_exit()` may do something for this trade.
+    This may flag too many candles (they're simply processed by the loop engine) - but must never
+    miss a candle that would change the trade.
+    """
+    high = candles.high[start:end]
+    low = candles.low[start:end]
+    leverage = trade.leverage or 1.0
+    stop_loss = trade.stop_loss
+    liquidation_price = trade.liquidation_price
+    if trade.is_short:
+        mask = high >= stop_loss
+        if liquidation_price:
+            mask |= high >= liquidation_price
+        exit_signal = candles.exit_short[start:end]
+        roi_rate = low
+    else:
+        mask = low <= stop_loss
+        if liquidation_price:
+            mask |= low <= liquidation_price
+        exit_signal = candles.exit_long[start:end]
+        roi_rate = high
+
+    if strategy.trailing_stop:
+        # Candles on which the trailing stop could move.
+        stoplosses = [strategy.stoploss]
+        if strategy.trailing_stop_positive is not None:
+            stoplosses.append(strategy.trailing_stop_positive)
+        min_dist = min(abs(sl / leverage) for sl in stoplosses)
+        if trade.is_short:
+            mask |= low * (1 + min_dist) <= stop_loss
+        else:
+            mask |= high * (1 - min_dist) >= stop_loss
+
+    if strategy.use_exit_signal:
+        mask |= exit_signal == 1
+
+    roi_keys, roi_values = roi_table
+    if len(roi_keys):
+        open_ns = Timestamp(trade.open_date_utc).value
+        durations = (candles.dates[start:end] - open_ns) // 60_000_000_000
+        idx = np.searchsorted(roi_keys, durations, side='right') - 1
+        roi = np.where(idx >= 0, roi_values[np.maximum(idx, 0)], np.inf)
+        # Upper bound of the profit ratio - independent of the sign of the fees.
+        fee_open = abs(trade.fee_open or 0.0)
+        fee_close = abs(trade.fee_close or 0.0)
+        if trade.is_short:
+            profit = (1 - roi_rate * (1 - fee_close) / (trade.open_rate * (1 + fee_open)))
+        else:
+            profit = (roi_rate * (1 + fee_close) / (trade.open_rate * (1 - fee_open))) - 1
+        mask |= profit * leverage >= roi - ROI_TOLERANCE
+
+    return mask
+
+
+def find_exit_candidate(candles: PairCandles, start: int, end: int, trade: LocalTrade,
+                        strategy: IStrategy, roi_table: Tuple[np.ndarray, np.ndarray]
+                        ) -> Optional[int]:
+    """
+    Find the first candle in [start, end) that needs processing for this trade.
+    Scans in growing windows, so the cost is proportional to the trade duration.
+    """
+    window = EXIT_SCAN_WINDOW
+    while start < end:
+        stop = min(start + window, end)
+        hits = np.flatnonzero(exit_candidate_mask(candles, start, stop, trade, strategy, roi_table))
+        if len(hits):
+            return start + int(hits[0])
+        start = stop
+        window *= 4
+    return None
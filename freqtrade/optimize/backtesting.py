@@ -5,12 +5,16 @@ This module contains the backtesting logic
 """
 import logging
 from collections import defaultdict
-from copy import deepcopy
+from copy import copy, deepcopy
 from datetime import datetime, timedelta, timezone
+from heapq import heappop, heappush
+from pathlib import Path
+from tempfile import TemporaryDirectory
 from typing import Any, Dict, List, Optional, Tuple
 
-from numpy import nan
-from pandas import DataFrame
+import numpy as np
+from joblib import Parallel, delayed, dump, load, wrap_non_picklable_objects
+from pandas import DataFrame, Timestamp
 
 from freqtrade import constants
 from freqtrade.configuration import TimeRange, validate_config_consistency
@@ -26,7 +30,20 @@ from freqtrade.exchange import (amount_to_contract_precision, price_to_precision
                                 timeframe_to_minutes, timeframe_to_seconds)
 from freqtrade.mixins import LoggingMixin
 from freqtrade.optimize.backtest_caching import get_strategy_run_id
+from freqtrade.optimize.backtest_candles import (CLOSE_IDX, DATE_IDX, ELONG_IDX, ENTER_TAG_IDX,
+                                                 ESHORT_IDX, EXIT_TAG_IDX, HIGH_IDX, LONG_IDX,
+                                                 LOW_IDX, OPEN_IDX, SHORT_IDX, DetailCandles,
+                                                 PairCandles, price_cache)
+from freqtrade.optimize.backtest_checkpoint import (dump_loop_state, get_checkpoint_filename,
+                                                    get_fingerprint, load_checkpoint,
+                                                    load_loop_state, store_checkpoint)
+from freqtrade.optimize.backtest_parallel import (detached_exchange, register_pickle_by_value,
+                                                  shared_wallet_allows)
+from freqtrade.optimize.backtest_vectorized import (PER_CANDLE_CALLBACKS, find_exit_candidate,
+                                                    get_entry_mask, get_processing_steps,
+                                                    get_roi_table, is_callback_overridden)
 from freqtrade.optimize.bt_progress import BTProgress
+from freqtrade.optimize.indicator_cache import IndicatorCache
 from freqtrade.optimize.optimize_reports import (generate_backtest_stats, generate_rejected_signals,
                                                  generate_trade_signal_candles,
                                                  show_backtest_results,
@@ -44,23 +61,17 @@ from freqtrade.wallets import Wallets
 
 logger = logging.getLogger(__name__)
 
-# Indexes for backtest tuples
-DATE_IDX = 0
-OPEN_IDX = 1
-HIGH_IDX = 2
-LOW_IDX = 3
-CLOSE_IDX = 4
-LONG_IDX = 5
-ELONG_IDX = 6  # Exit long
-SHORT_IDX = 7
-ESHORT_IDX = 8  # Exit short
-ENTER_TAG_IDX = 9
-EXIT_TAG_IDX = 10
-
-# Every change to this headers list must evaluate further usages of the resulting tuple
-# and eventually change the constants for indexes at the top
-HEADERS = ['date', 'open', 'high', 'low', 'close', 'enter_long', 'exit_long',
-           'enter_short', 'exit_short', 'enter_tag', 'exit_tag']
+# Counters of a backtest - combined over the shards of a pair-sharded backtest.
+BACKTEST_COUNTERS = ('rejected_trades', 'timedout_entry_orders', 'timedout_exit_orders',
+                     'canceled_trade_entries', 'canceled_entry_orders', 'replaced_entry_orders')
+# Callbacks called while backtesting - they may read the wallet, which pair shards don't share.
+# adjust_trade_position() is only called with position adjustment (no sharding either),
+# leverage() only outside of spot markets.
+WALLET_CALLBACKS = ('bot_loop_start', 'check_buy_timeout', 'check_entry_timeout',
+                    'check_sell_timeout', 'check_exit_timeout', 'confirm_trade_entry',
+                    'confirm_trade_exit', 'custom_stoploss', 'custom_entry_price',
+                    'custom_exit_price', 'custom_sell', 'custom_exit', 'custom_stake_amount',
+                    'adjust_entry_price')
 
 
 class Backtesting:
@@ -160,6 +171,13 @@ class Backtesting:
         self._can_short = self.trading_mode != TradingMode.SPOT
         self._position_stacking: bool = self.config.get('position_stacking', False)
         self.enable_protections: bool = self.config.get('enable_protections', False)
+        # Set by hyperopt - enables reuse of converted prices across epochs.
+        self.price_cache_scope: Optional[str] = None
+        self.backtest_jobs: int = self.config.get('backtest_jobs', 1)
+        # Set per strategy by backtest_one_strategy() when --backtest-checkpoint is used.
+        self.checkpoint_file: Optional[Path] = None
+        self.checkpoint_id = ''
+        self.indicator_cache = self._init_indicator_cache()
         migrate_binance_futures_data(config)
 
         self.init_backtest()
@@ -167,6 +185,7 @@ class Backtesting:
     @staticmethod
     def cleanup():
         LoggingMixin.show_output = True
+        price_cache.clear()
         PairLocks.use_db = True
         Trade.use_db = True
 
@@ -182,8 +201,18 @@ class Backtesting:
         else:
             self.timeframe_detail_min = 0
         self.detail_data: Dict[str, DataFrame] = {}
+        # Offset index of detail_data, built from the dataframe it's stored with.
+        self._detail_candles: Dict[str, Tuple[DataFrame, DetailCandles]] = {}
         self.futures_data: Dict[str, DataFrame] = {}
 
+    def _init_indicator_cache(self) -> Optional[IndicatorCache]:
+        if not self.config.get('indicator_cache', False):
+            return None
+        if self.config.get('freqai', {}).get('enabled', False):
+            logger.warning('Indicator cache is not supported with FreqAI, ignoring it.')
+            return None
+        return IndicatorCache(self.config['user_data_dir'] / 'backtest_results' / '.indicators')
+
     def init_backtest(self):
 
         self.prepare_backtest(False)
@@ -233,7 +262,8 @@ class Backtesting:
             startup_candles=self.config['startup_candle_count'],
             fail_without_data=True,
             data_format=self.config.get('dataformat_ohlcv', 'json'),
-            candle_type=self.config.get('candle_type_def', CandleType.SPOT)
+            candle_type=self.config.get('candle_type_def', CandleType.SPOT),
+            workers=self.config.get('data_load_workers', 1),
         )
 
         min_date, max_date = history.get_timerange(data)
@@ -262,8 +292,11 @@ class Backtesting:
                 startup_candles=0,
                 fail_without_data=True,
                 data_format=self.config.get('dataformat_ohlcv', 'json'),
-                candle_type=self.config.get('candle_type_def', CandleType.SPOT)
+                candle_type=self.config.get('candle_type_def', CandleType.SPOT),
+                workers=self.config.get('data_load_workers', 1),
             )
+            for pair in self.detail_data:
+                self._get_detail_candles(pair)
         else:
             self.detail_data = {}
         if self.trading_mode == TradingMode.FUTURES:
@@ -276,7 +309,8 @@ class Backtesting:
                 startup_candles=0,
                 fail_without_data=True,
                 data_format=self.config.get('dataformat_ohlcv', 'json'),
-                candle_type=CandleType.FUNDING_RATE
+                candle_type=CandleType.FUNDING_RATE,
+                workers=self.config.get('data_load_workers', 1),
             )
 
             # For simplicity, assign to CandleType.Mark (might contian index candles!)
@@ -288,7 +322,8 @@ class Backtesting:
                 startup_candles=0,
                 fail_without_data=True,
                 data_format=self.config.get('dataformat_ohlcv', 'json'),
-                candle_type=CandleType.from_string(self.exchange.get_option("mark_ohlcv_price"))
+                candle_type=CandleType.from_string(self.exchange.get_option("mark_ohlcv_price")),
+                workers=self.config.get('data_load_workers', 1),
             )
             # Combine data to avoid combining the data per trade.
             unavailable_pairs = []
@@ -310,10 +345,32 @@ class Backtesting:
         else:
             self.futures_data = {}
 
+    def _get_detail_candles(self, pair: str) -> DetailCandles:
+        """
+        Get the indexed detail candles for this pair - (re)building the index if detail_data
+        changed.
+        """
+        detail_data = self.detail_data[pair]
+        cached = self._detail_candles.get(pair)
+        if cached is None or cached[0] is not detail_data:
+            cached = (detail_data, DetailCandles(
+                detail_data, timeframe_to_seconds(self.timeframe) * 1_000_000_000))
+            self._detail_candles[pair] = cached
+        return cached[1]
+
     def prepare_backtest(self, enable_protections):
         """
         Backtesting setup method - called once for every call to "backtest()".
         """
+        self._reset_backtest_state()
+        self.dataprovider.clear_cache()
+        if enable_protections:
+            self._load_protections(self.strategy)
+
+    def _reset_backtest_state(self) -> None:
+        """
+        Reset trades, locks and counters of a prior backtest.
+        """
         PairLocks.use_db = False
         PairLocks.timeframe = self.config['timeframe']
         Trade.use_db = False
@@ -325,9 +382,6 @@ class Backtesting:
         self.canceled_trade_entries = 0
         self.canceled_entry_orders = 0
         self.replaced_entry_orders = 0
-        self.dataprovider.clear_cache()
-        if enable_protections:
-            self._load_protections(self.strategy)
 
     def check_abort(self):
         """
@@ -338,9 +392,9 @@ class Backtesting:
             self.abort = False
             raise DependencyException("Stop requested")
 
-    def _get_ohlcv_as_lists(self, processed: Dict[str, DataFrame]) -> Dict[str, Tuple]:
+    def _get_ohlcv_as_candles(self, processed: Dict[str, DataFrame]) -> Dict[str, PairCandles]:
         """
-        Helper function to convert a processed dataframes into lists for performance reasons.
+        Helper function to convert a processed dataframes into columnar candle stores.
 
         Used by backtest() - so keep this optimized for performance.
 
@@ -348,7 +402,7 @@ class Backtesting:
         optimize memory usage!
         """
 
-        data: Dict = {}
+        data: Dict[str, PairCandles] = {}
         self.progress.init_step(BacktestState.CONVERT, len(processed))
 
         # Create dict with data
@@ -357,14 +411,14 @@ class Backtesting:
             self.check_abort()
             self.progress.increment()
 
-            if not pair_data.empty:
-                # Cleanup from prior runs
-                pair_data.drop(HEADERS[5:] + ['buy', 'sell'], axis=1, errors='ignore')
-
             df_analyzed = self.strategy.advise_exit(
                 self.strategy.advise_entry(pair_data, {'pair': pair}),
                 {'pair': pair}
-            ).copy()
+            )
+            if not self.price_cache_scope:
+                # Hyperopt loads a fresh copy-on-write memory map for every epoch, so changes
+                # don't leak into other epochs, and the copy can be skipped there.
+                df_analyzed = df_analyzed.copy()
             # Trim startup period from analyzed dataframe
             df_analyzed = processed[pair] = pair_data = trim_dataframe(
                 df_analyzed, self.timerange, startup_candles=self.required_startup)
@@ -372,25 +426,13 @@ class Backtesting:
             self.dataprovider._set_cached_df(
                 pair, self.timeframe, df_analyzed, self.config['candle_type_def'])
 
-            # Create a copy of the dataframe before shifting, that way the entry signal/tag
-            # remains on the correct candle for callbacks.
-            df_analyzed = df_analyzed.copy()
-
-            # To avoid using data from future, we use entry/exit signals shifted
-            # from the previous candle
-            for col in HEADERS[5:]:
-                tag_col = col in ('enter_tag', 'exit_tag')
-                if col in df_analyzed.columns:
-                    df_analyzed[col] = df_analyzed.loc[:, col].replace(
-                        [nan], [0 if not tag_col else None]).shift(1)
-                elif not df_analyzed.empty:
-                    df_analyzed[col] = 0 if not tag_col else None
-
-            df_analyzed = df_analyzed.drop(df_analyzed.head(1).index)
-
-            # Convert from Pandas to list for performance reasons
-            # (Looping Pandas is slow.)
-            data[pair] = df_analyzed[HEADERS].values.tolist() if not df_analyzed.empty else []
+            # Prices are used as they are, only signals / tags are shifted by one candle
+            # (to avoid using data from future). The dataframe itself remains unchanged, so
+            # the entry signal/tag remains on the correct candle for callbacks.
+            if self.price_cache_scope:
+                data[pair] = price_cache.get_candles(self.price_cache_scope, pair, df_analyzed)
+            else:
+                data[pair] = PairCandles.from_dataframe(df_analyzed)
         return data
 
     def _get_close_rate(self, row: Tuple, trade: LocalTrade, exit: ExitCheckTuple,
@@ -906,7 +948,7 @@ class Backtesting:
         return trade
 
     def handle_left_open(self, open_trades: Dict[str, List[LocalTrade]],
-                         data: Dict[str, List[Tuple]]) -> None:
+                         data: Dict) -> None:
         """
         Handling of left open trades at the end of backtesting
         """
@@ -1161,18 +1203,231 @@ class Backtesting:
         self.prepare_backtest(self.enable_protections)
         # Ensure wallets are uptodate (important for --strategy-list)
         self.wallets.update()
-        # Use dict of lists with data for performance
-        # (looping lists is a lot faster than pandas DataFrames)
-        data: Dict = self._get_ohlcv_as_lists(processed)
+        # Use dict of columnar candle stores for performance
+        # (looping these is a lot faster than pandas DataFrames)
+        data: Dict = self._get_ohlcv_as_candles(processed)
+
+        self.progress.init_step(BacktestState.BACKTEST, int(
+            (end_date - start_date) / timedelta(minutes=self.timeframe_min)))
+        resume_step = self._resume_checkpoint(data, start_date, end_date)
+        if not (self.pair_sharding_supported(data)
+                and self._backtest_pair_shards(data, start_date, end_date)):
+            self._backtest_pairs(data, start_date, end_date, resume_step)
+        self.wallets.update()
 
+        results = trade_list_to_dataframe(LocalTrade.trades)
+        return {
+            'results': results,
+            'config': self.strategy.config,
+            'locks': PairLocks.get_all_locks(),
+            'rejected_signals': self.rejected_trades,
+            'timedout_entry_orders': self.timedout_entry_orders,
+            'timedout_exit_orders': self.timedout_exit_orders,
+            'canceled_trade_entries': self.canceled_trade_entries,
+            'canceled_entry_orders': self.canceled_entry_orders,
+            'replaced_entry_orders': self.replaced_entry_orders,
+            'final_balance': self.wallets.get_total(self.strategy.config['stake_currency']),
+        }
+
+    def _backtest_pairs(self, data: Dict, start_date: datetime, end_date: datetime,
+                        resume_step: int = 0) -> None:
+        """
+        Backtest all pairs in data together - and close trades left open at the end.
+        :param resume_step: Time-step to start at - with the state restored from a checkpoint.
+        """
+        if self.vectorized_backtest_supported():
+            self._backtest_vectorized(data, start_date, end_date, resume_step)
+        else:
+            self._backtest_candles(data, start_date, end_date, resume_step)
+        self.handle_left_open(LocalTrade.bt_trades_open_pp, data=data)
+
+    def pair_sharding_supported(self, data: Dict) -> bool:
+        """
+        Pairs can be backtested independently (in parallel) if they don't compete for trade
+        slots, aren't locked by protections and use a fixed stake amount - and the strategy
+        implements no callbacks which could depend on the wallet balance.
+        Whether the shared wallet limited any entry is only known afterwards - see
+        `_backtest_pair_shards()`.
+        """
+        if self.backtest_jobs == 1 or len(data) < 2 or self.enable_protections:
+            return False
+        if self.checkpoint_file:
+            # Checkpoints capture the state of all pairs at the same time-step.
+            return False
+        max_open_trades: IntOrInf = self.config['max_open_trades']
+        if 0 < max_open_trades < float('inf'):
+            return False
+        if (self.config['stake_amount'] == constants.UNLIMITED_STAKE_AMOUNT
+                or self.strategy.position_adjustment_enable):
+            return False
+        # Each shard starts with an unlimited wallet.
+        callbacks = list(WALLET_CALLBACKS)
+        if self.trading_mode != TradingMode.SPOT:
+            callbacks.append('leverage')
+        return not any(is_callback_overridden(self.strategy, callback)
+                       for callback in callbacks)
+
+    def _backtest_pair_shards(self, data: Dict[str, PairCandles],
+                              start_date: datetime, end_date: datetime) -> bool:
+        """
+        Backtest groups of pairs in worker processes, and combine their trades in the order
+        a regular backtest produces them.
+        :return: False if the shards may have influenced each other (through the wallet,
+            timed out entries or pair locks). Nothing is changed in this case, and the pairs
+            have to be backtested together.
+        """
+        register_pickle_by_value(self.strategy.__class__.__bases__)
+        pairs = list(data.keys())
+        with detached_exchange(self.exchange), \
+                Parallel(n_jobs=self.backtest_jobs, mmap_mode='c') as parallel:
+            jobs = min(parallel._effective_n_jobs(), len(pairs))
+            if jobs < 2:
+                # A single shard would run in this process.
+                return False
+            shards = [pairs[shard::jobs] for shard in range(jobs)]
+            results = parallel(
+                delayed(self._pair_shard_job_instance(shard)._backtest_pair_shard_job)(
+                    {pair: data[pair] for pair in shard}, start_date, end_date)
+                for shard in shards)
+
+        timeframe_ns = self.timeframe_min * 60 * 1_000_000_000
+        start_ns = Timestamp(start_date).value
+        steps = {pair: get_processing_steps(candles.dates, start_ns, timeframe_ns)
+                 for pair, candles in data.items()}
+        pair_pos = {pair: pos for pos, pair in enumerate(pairs)}
+        trades: List[Tuple[Tuple, LocalTrade]] = []
+        locks: List[Tuple[Tuple, Any]] = []
+        counters = dict.fromkeys(BACKTEST_COUNTERS, 0)
+        for shard, (shard_trades, open_trades, shard_locks, shard_counters, ids_used) \
+                in zip(shards, results):
+            if (open_trades or shard_counters['timedout_entry_orders']
+                    or shard_counters['canceled_trade_entries']
+                    or any(lock.pair not in shard for lock in shard_locks)
+                    or ids_used != (len(shard_trades),
+                                    sum(len(trade.orders) for trade in shard_trades))):
+                # Stake of open or deleted trades isn't visible to shared_wallet_allows(),
+                # and trade / order ids can only be renumbered if no id was skipped.
+                return False
+            for idx, trade in enumerate(shard_trades):
+                if trade.exit_reason == ExitType.FORCE_EXIT.value:
+                    # Trades left open are closed in the order the pairs were first processed.
+                    key: Tuple = (1, int(steps[trade.pair][0]), pair_pos[trade.pair], idx)
+                else:
+                    # Trades are closed at the time of the processed time-step.
+                    close_step = (Timestamp(trade.close_date_utc).value - start_ns) // timeframe_ns
+                    key = (0, close_step, pair_pos[trade.pair], idx)
+                trades.append((key, trade))
+            locks.extend(((lock.lock_time, pair_pos[lock.pair], idx), lock)
+                         for idx, lock in enumerate(shard_locks))
+            for counter in BACKTEST_COUNTERS:
+                counters[counter] += shard_counters[counter]
+
+        closed_trades = [trade for _, trade in sorted(trades, key=lambda t: t[0])]
+        if not shared_wallet_allows(
+                closed_trades, self.config['stake_amount'], self.wallets.start_cap,
+                self.config['tradable_balance_ratio'], self.config.get('available_capital')):
+            logger.info('Wallet limited the pair shards - backtesting pairs together.')
+            return False
+
+        self._renumber_shard_trades(closed_trades, data, steps, pair_pos)
+        LocalTrade.trades = closed_trades
+        LocalTrade.total_profit = sum(trade.close_profit_abs or 0.0 for trade in closed_trades)
+        PairLocks.locks = [lock for _, lock in sorted(locks, key=lambda lock: lock[0])]
+        for counter, value in counters.items():
+            setattr(self, counter, value)
+        self.progress.set_new_value((Timestamp(end_date).value - start_ns) // timeframe_ns)
+        return True
+
+    def _renumber_shard_trades(self, trades: List[LocalTrade], data: Dict[str, PairCandles],
+                               steps: Dict[str, np.ndarray], pair_pos: Dict[str, int]) -> None:
+        """
+        Assign trade and order ids in the order a regular backtest creates trades and orders:
+        by the time-step the candle is processed at, then by pair. Exit orders of trades left
+        open are created after the last time-step, in the order the trades are closed.
+        Ids of every shard start at the same counters - so they collide before renumbering.
+        """
+        def step_of(pair: str, date: datetime) -> int:
+            # Time-step the (main timeframe) candle containing date is processed at
+            row = np.searchsorted(data[pair].dates, Timestamp(date).value, side='right') - 1
+            return int(steps[pair][max(row, 0)])
+
+        trade_keys = []
+        order_keys = []
+        for close_pos, trade in enumerate(trades):
+            pos = pair_pos[trade.pair]
+            trade_keys.append(((step_of(trade.pair, trade.open_date), pos, trade.id), trade))
+            for order in trade.orders:
+                if (trade.exit_reason == ExitType.FORCE_EXIT.value and order is trade.orders[-1]
+                        and order.ft_order_side == trade.exit_side):
+                    key: Tuple = (1, close_pos)
+                else:
+                    key = (0, step_of(trade.pair, order.order_date), pos, order.id)
+                order_keys.append((key, order))
+        for _, trade in sorted(trade_keys, key=lambda t: t[0]):
+            self.trade_id_counter += 1
+            trade.id = self.trade_id_counter
+        for _, order in sorted(order_keys, key=lambda o: o[0]):
+            self.order_id_counter += 1
+            order.id = self.order_id_counter
+            order.order_id = str(self.order_id_counter)
+        for trade in trades:
+            for order in trade.orders:
+                order.ft_trade_id = trade.id
+
+    def _pair_shard_job_instance(self, pairs: List[str]) -> 'Backtesting':
+        """
+        Shallow copy of this instance for a shard of pairs - only holding the current
+        strategy, and the cached (analyzed) dataframes and detail data of these pairs.
+        """
+        backtesting = copy(self)
+        backtesting.detail_data = {
+            pair: detail for pair, detail in self.detail_data.items() if pair in pairs}
+        backtesting.results = {}
+        backtesting.all_results = {}
+        backtesting.processed_dfs = {}
+        backtesting.rejected_df = {}
+        backtesting.dataprovider = self.dataprovider._copy_for_pairs(pairs)
+        backtesting.strategy = copy(self.strategy)
+        backtesting.strategy.dp = backtesting.dataprovider
+        backtesting.strategylist = [backtesting.strategy]
+        return backtesting
+
+    def _backtest_pair_shard_job(self, data: Dict[str, PairCandles],
+                                 start_date: datetime, end_date: datetime) -> Tuple:
+        """
+        Worker part of _backtest_pair_shards(), running on an instance created by
+        _pair_shard_job_instance().
+        """
+        # Keep the dataprovider cache - callbacks may use the analyzed dataframes.
+        self._reset_backtest_state()
+        # Shards don't share their wallet. Trade against an unlimited balance, so no entry
+        # is limited by the wallet - the combined trades are checked against the real wallet.
+        self.wallets.start_cap = float('inf')
+        self.config.pop('available_capital', None)
+        self.wallets.update()
+        trade_id_start, order_id_start = self.trade_id_counter, self.order_id_counter
+        self._backtest_pairs(data, start_date, end_date)
+        return (LocalTrade.trades, LocalTrade.bt_open_open_trade_count, PairLocks.get_all_locks(),
+                {counter: getattr(self, counter) for counter in BACKTEST_COUNTERS},
+                (self.trade_id_counter - trade_id_start, self.order_id_counter - order_id_start))
+
+    def _backtest_candles(self, data: Dict, start_date: datetime, end_date: datetime,
+                          resume_step: int = 0) -> None:
+        """
+        Loop engine - processes every candle of every pair.
+        """
         # Indexes per pair, so some pairs are allowed to have a missing start.
         indexes: Dict = defaultdict(int)
-        current_time = start_date + timedelta(minutes=self.timeframe_min)
+        timeframe = timedelta(minutes=self.timeframe_min)
+        current_time = start_date + timeframe
+        if resume_step:
+            indexes.update(self._get_consumed_rows(data, start_date, resume_step))
+            current_time = start_date + timeframe * resume_step
 
-        self.progress.init_step(BacktestState.BACKTEST, int(
-            (end_date - start_date) / timedelta(minutes=self.timeframe_min)))
         # Loop timerange and get candle for each pair at that point in time
         while current_time <= end_date:
+            if current_time + timeframe > end_date:
+                self._store_checkpoint(data, start_date, (current_time - start_date) // timeframe)
             open_trade_count_start = LocalTrade.bt_open_open_trade_count
             self.check_abort()
             strategy_safe_wrapper(self.strategy.bot_loop_start, supress_error=True)(
@@ -1186,7 +1441,6 @@ class Backtesting:
                 row_index += 1
                 indexes[pair] = row_index
                 self.dataprovider._set_dataframe_max_index(row_index)
-                current_detail_time: datetime = row[DATE_IDX].to_pydatetime()
                 trade_dir: Optional[LongShort] = self.check_for_trade_entry(row)
 
                 if (
@@ -1196,28 +1450,18 @@ class Backtesting:
                     # Spread out into detail timeframe.
                     # Should only happen when we are either in a trade for this pair
                     # or when we got the signal for a new trade.
-                    exit_candle_end = current_detail_time + timedelta(minutes=self.timeframe_min)
-
-                    detail_data = self.detail_data[pair]
-                    detail_data = detail_data.loc[
-                        (detail_data['date'] >= current_detail_time) &
-                        (detail_data['date'] < exit_candle_end)
-                    ].copy()
-                    if len(detail_data) == 0:
+                    detail_candles = self._get_detail_candles(pair)
+                    det_start, det_end = detail_candles.get_range(row[DATE_IDX].value)
+                    if det_start == det_end:
                         # Fall back to "regular" data if no detail data was found for this candle
                         open_trade_count_start = self.backtest_loop(
                             row, pair, current_time, end_date,
                             open_trade_count_start, trade_dir)
                         continue
-                    detail_data.loc[:, 'enter_long'] = row[LONG_IDX]
-                    detail_data.loc[:, 'exit_long'] = row[ELONG_IDX]
-                    detail_data.loc[:, 'enter_short'] = row[SHORT_IDX]
-                    detail_data.loc[:, 'exit_short'] = row[ESHORT_IDX]
-                    detail_data.loc[:, 'enter_tag'] = row[ENTER_TAG_IDX]
-                    detail_data.loc[:, 'exit_tag'] = row[EXIT_TAG_IDX]
+                    signals = [row[idx] for idx in range(LONG_IDX, EXIT_TAG_IDX + 1)]
                     is_first = True
                     current_time_det = current_time
-                    for det_row in detail_data[HEADERS].values.tolist():
+                    for det_row in detail_candles.get_rows(det_start, det_end, signals):
                         open_trade_count_start = self.backtest_loop(
                             det_row, pair, current_time_det, end_date,
                             open_trade_count_start, trade_dir, is_first)
@@ -1230,24 +1474,238 @@ class Backtesting:
 
             # Move time one configured time_interval ahead.
             self.progress.increment()
-            current_time += timedelta(minutes=self.timeframe_min)
+            current_time += timeframe
 
-        self.handle_left_open(LocalTrade.bt_trades_open_pp, data=data)
+    def _get_consumed_rows(self, data: Dict[str, PairCandles], start_date: datetime,
+                           step: int) -> Dict[str, int]:
+        """
+        Get the number of rows per pair the loop engine processed before the given time-step.
+        """
+        if step <= 1:
+            # Processing starts at time-step 1.
+            return dict.fromkeys(data, 0)
+        timeframe_ns = self.timeframe_min * 60 * 1_000_000_000
+        start_ns = Timestamp(start_date).value
+        return {pair: int(np.searchsorted(
+                    get_processing_steps(candles.dates, start_ns, timeframe_ns), step))
+                for pair, candles in data.items()}
+
+    def _get_checkpoint_fingerprints(self, data: Dict[str, PairCandles], start_date: datetime,
+                                     step: int) -> Dict[str, Tuple[int, str]]:
+        """
+        Fingerprint all candles processed before the given time-step, per pair.
+        """
+        rows = self._get_consumed_rows(data, start_date, step)
+        fingerprints = {
+            pair: (rows[pair], get_fingerprint(column[:rows[pair]] for column in candles.columns))
+            for pair, candles in data.items()
+        }
+        if self.timeframe_detail:
+            end_ns = Timestamp(start_date + timedelta(minutes=self.timeframe_min * step)).value
+            for pair in data:
+                if pair in self.detail_data:
+                    detail = self._get_detail_candles(pair)
+                    end = int(np.searchsorted(detail.dates, end_ns))
+                    fingerprints[f'{pair} {self.timeframe_detail}'] = (end, get_fingerprint(
+                        column[:end] for column in (detail.dates, *detail.prices)))
+        return fingerprints
+
+    def _store_checkpoint(self, data: Dict[str, PairCandles], start_date: datetime,
+                          step: int) -> None:
+        """
+        Store the loop state, before the given (last) time-step is processed.
+        """
+        if not self.checkpoint_file:
+            return
+        attributes = {attr: getattr(self, attr) for attr in (
+            *BACKTEST_COUNTERS, 'trade_id_counter', 'order_id_counter', 'rejected_dict')}
+        store_checkpoint(self.checkpoint_file, {
+            'run_id': self.checkpoint_id,
+            'start_date': Timestamp(start_date).value,
+            'step': step,
+            'fingerprints': self._get_checkpoint_fingerprints(data, start_date, step),
+            'state': dump_loop_state(attributes),
+        })
+
+    def _resume_checkpoint(self, data: Dict[str, PairCandles], start_date: datetime,
+                           end_date: datetime) -> int:
+        """
+        Restore the loop state of a prior backtest, if this backtest extends it.
+        :return: Time-step to resume at, 0 if there is no matching checkpoint.
+        """
+        if not self.checkpoint_file:
+            return 0
+        checkpoint = load_checkpoint(self.checkpoint_file)
+        if checkpoint is None:
+            return 0
+        step = checkpoint['step']
+        if (checkpoint['run_id'] != self.checkpoint_id
+                or checkpoint['start_date'] != Timestamp(start_date).value
+                or start_date + timedelta(minutes=self.timeframe_min * step) > end_date):
+            logger.info('Backtest checkpoint does not match this backtest, '
+                        'running the full backtest.')
+            return 0
+        fingerprints = self._get_checkpoint_fingerprints(data, start_date, step)
+        if list(fingerprints.items()) != list(checkpoint['fingerprints'].items()):
+            logger.info('Candles changed since the backtest checkpoint, '
+                        'running the full backtest.')
+            return 0
+
+        for attr, value in load_loop_state(checkpoint['state']).items():
+            setattr(self, attr, value)
         self.wallets.update()
+        self.progress.set_new_value(step - 1)
+        resume_date = start_date + timedelta(minutes=self.timeframe_min * step)
+        logger.info('Resuming backtest from checkpoint at '
+                    f'{resume_date.strftime(DATETIME_PRINT_FORMAT)}.')
+        return step
 
-        results = trade_list_to_dataframe(LocalTrade.trades)
-        return {
-            'results': results,
-            'config': self.strategy.config,
-            'locks': PairLocks.get_all_locks(),
-            'rejected_signals': self.rejected_trades,
-            'timedout_entry_orders': self.timedout_entry_orders,
-            'timedout_exit_orders': self.timedout_exit_orders,
-            'canceled_trade_entries': self.canceled_trade_entries,
-            'canceled_entry_orders': self.canceled_entry_orders,
-            'replaced_entry_orders': self.replaced_entry_orders,
-            'final_balance': self.wallets.get_total(self.strategy.config['stake_currency']),
-        }
+    def vectorized_backtest_supported(self) -> bool:
+        """
+        The vectorized engine only skips candles on which the loop engine does nothing.
+        This holds as long as the strategy doesn't need a callback on every candle.
+        """
+        if self.timeframe_detail or self.trading_mode == TradingMode.FUTURES:
+            return False
+        if self.strategy.position_adjustment_enable or self.strategy.use_custom_stoploss:
+            return False
+        return not any(is_callback_overridden(self.strategy, callback)
+                       for callback in PER_CANDLE_CALLBACKS)
+
+    def _backtest_vectorized(self, data: Dict, start_date: datetime, end_date: datetime,
+                             resume_step: int = 0) -> None:
+        """
+        Vectorized engine - produces the same trades as `_backtest_candles()`.
+        Entries and exit candidates are located with NumPy scans, and only these candles
+        are processed by `backtest_loop()` - in the same (time, pair) order as the loop engine.
+        """
+        timeframe_ns = self.timeframe_min * 60 * 1_000_000_000
+        start_ns = Timestamp(start_date).value
+        last_step = (Timestamp(end_date).value - start_ns) // timeframe_ns
+        roi_table = get_roi_table(self.strategy.minimal_roi)
+
+        pairs = list(data.keys())
+        steps: Dict[str, np.ndarray] = {}
+        entry_rows: Dict[str, np.ndarray] = {}
+        for pair in pairs:
+            pair_steps = get_processing_steps(data[pair].dates, start_ns, timeframe_ns)
+            # Rows after the end date are never processed.
+            steps[pair] = pair_steps[:np.searchsorted(pair_steps, last_step, side='right')]
+            entry_mask = get_entry_mask(data[pair], self._can_short)[:len(steps[pair])]
+            # No trades are opened on the last candle
+            entry_rows[pair] = np.flatnonzero(entry_mask & (steps[pair] != last_step))
+
+        events: List[Tuple[int, int, int]] = []
+        last_row: Dict[str, int] = {
+            pair: rows - 1
+            for pair, rows in self._get_consumed_rows(data, start_date, resume_step).items()}
+
+        def schedule(pair_pos: int, pair: str, row_index: int) -> None:
+            candidate = self._next_vectorized_candle(
+                pair, row_index, len(steps[pair]), data[pair], entry_rows[pair], roi_table)
+            if candidate is not None:
+                heappush(events, (int(steps[pair][candidate]), pair_pos, candidate))
+
+        # Register pairs in the order the loop engine sees them first (affects exit order
+        # of trades left open at the end).
+        first_rows = sorted((int(steps[pair][0]), pair_pos, pair)
+                            for pair_pos, pair in enumerate(pairs) if len(steps[pair]))
+        for _, _, pair in first_rows:
+            LocalTrade.bt_trades_open_pp.setdefault(pair, [])
+        for pair_pos, pair in enumerate(pairs):
+            schedule(pair_pos, pair, last_row[pair] + 1)
+
+        checkpoint_pending = self.checkpoint_file is not None
+        current_step = 0
+        open_trade_count_start = 0
+        while events:
+            step, pair_pos, row_index = heappop(events)
+            pair = pairs[pair_pos]
+            if step != current_step:
+                current_step = step
+                open_trade_count_start = LocalTrade.bt_open_open_trade_count
+                self.check_abort()
+                self.progress.set_new_value(step)
+                if step == last_step and checkpoint_pending:
+                    self._store_vectorized_checkpoint(data, start_date, last_step, last_row)
+                    checkpoint_pending = False
+
+            self._apply_skipped_candles(pair, data[pair], last_row[pair] + 1, row_index)
+            row = data[pair][row_index]
+            self.dataprovider._set_dataframe_max_index(row_index + 1)
+            open_trade_count_start = self.backtest_loop(
+                row, pair, start_date + timedelta(minutes=self.timeframe_min * step), end_date,
+                open_trade_count_start, self.check_for_trade_entry(row))
+            last_row[pair] = row_index
+            schedule(pair_pos, pair, row_index + 1)
+
+        if checkpoint_pending:
+            self._store_vectorized_checkpoint(data, start_date, last_step, last_row)
+        for pair in pairs:
+            self._apply_skipped_candles(pair, data[pair], last_row[pair] + 1, len(steps[pair]))
+        # Leave the dataprovider in the state the loop engine leaves it in (last processed row).
+        last_processed = max(((int(steps[pair][-1]), pair_pos, len(steps[pair]))
+                              for pair_pos, pair in enumerate(pairs) if len(steps[pair])),
+                             default=None)
+        if last_processed:
+            self.dataprovider._set_dataframe_max_index(last_processed[2])
+        self.progress.set_new_value(last_step)
+
+    def _store_vectorized_checkpoint(self, data: Dict[str, PairCandles], start_date: datetime,
+                                     last_step: int, last_row: Dict[str, int]) -> None:
+        """
+        Store the checkpoint of the vectorized engine - after applying the candles skipped
+        before the last step, so trades match the state of the loop engine.
+        """
+        for pair, rows in self._get_consumed_rows(data, start_date, last_step).items():
+            self._apply_skipped_candles(pair, data[pair], last_row[pair] + 1, rows)
+            last_row[pair] = max(last_row[pair], rows - 1)
+        self._store_checkpoint(data, start_date, last_step)
+
+    def _next_vectorized_candle(self, pair: str, row_index: int, end_row: int,
+                                candles: PairCandles, entry_rows: np.ndarray,
+                                roi_table: Tuple[np.ndarray, np.ndarray]) -> Optional[int]:
+        """
+        Find the next candle (starting at row_index) which needs processing for this pair.
+        """
+        candidate: Optional[int] = None
+        trades = LocalTrade.bt_trades_open_pp.get(pair, [])
+        if self._position_stacking or not trades:
+            pos = np.searchsorted(entry_rows, row_index)
+            if pos < len(entry_rows):
+                candidate = int(entry_rows[pos])
+        for trade in trades:
+            if trade.open_order_id or any(o.ft_is_open for o in trade.orders):
+                # Open orders need processing on every candle.
+                return row_index if row_index < end_row else None
+            exit_row = find_exit_candidate(
+                candles, row_index, candidate if candidate is not None else end_row,
+                trade, self.strategy, roi_table)
+            if exit_row is not None:
+                candidate = exit_row
+        if candidate is not None and candidate < end_row:
+            return candidate
+        return None
+
+    def _apply_skipped_candles(self, pair: str, candles: PairCandles, start: int, end: int
+                               ) -> None:
+        """
+        Update min / max rates of open trades with the candles skipped by the vectorized engine.
+        """
+        if start >= end:
+            return
+        high = float(candles.high[start:end].max())
+        low = float(candles.low[start:end].min())
+        for trade in LocalTrade.bt_trades_open_pp[pair]:
+            trade.adjust_min_max_rates(high, low)
+
+    def advise_all_indicators(self, data: Dict[str, DataFrame]) -> Dict[str, DataFrame]:
+        """
+        Populate indicators for all pairs - using the indicator cache if enabled.
+        """
+        if self.indicator_cache:
+            return self.indicator_cache.advise_all_indicators(self.strategy, data)
+        return self.strategy.advise_all_indicators(data)
 
     def backtest_one_strategy(self, strat: IStrategy, data: Dict[str, DataFrame],
                               timerange: TimeRange):
@@ -1264,8 +1722,14 @@ class Backtesting:
             self.strategy.max_open_trades = float('inf')
             self.config.update({'max_open_trades': self.strategy.max_open_trades})
 
+        if self.config.get('backtest_checkpoint', False):
+            self.checkpoint_file = get_checkpoint_filename(self.config['user_data_dir'],
+                                                           strategy_name)
+            # The timerange may change - the checkpoint is only used if its candles match.
+            self.checkpoint_id = get_strategy_run_id(self.strategy, ignored_keys=('timerange', ))
+
         # need to reprocess data every time to populate signals
-        preprocessed = self.strategy.advise_all_indicators(data)
+        preprocessed = self.advise_all_indicators(data)
 
         # Trim startup period from analyzed dataframe
         preprocessed_tmp = trim_dataframes(preprocessed, timerange, self.required_startup)
@@ -1303,6 +1767,68 @@ class Backtesting:
 
         return min_date, max_date
 
+    def backtest_strategies_parallel(self, strategies: List[IStrategy], data: Dict[str, DataFrame],
+                                     timerange: TimeRange, jobs: int):
+        """
+        Run backtest_one_strategy() for each strategy in its own worker process.
+        Candle data is handed to the workers through a memory-mapped file, so it's shared
+        instead of being copied into each task.
+        """
+        for strat in strategies:
+            register_pickle_by_value(strat.__class__.__bases__)
+        with TemporaryDirectory() as tmpdir:
+            data_file = Path(tmpdir) / 'backtest_data.pkl'
+            dump((data, self.detail_data), data_file)
+            with detached_exchange(self.exchange), Parallel(n_jobs=jobs) as parallel:
+                logger.info(f'Backtesting {len(strategies)} strategies using '
+                            f'{parallel._effective_n_jobs()} parallel jobs.')
+                results = parallel(
+                    delayed(wrap_non_picklable_objects(
+                        self._strategy_job_instance(strat)._backtest_strategy_job))(
+                            data_file, timerange)
+                    for strat in strategies)
+
+        for strategy_name, strat_results, processed_df, rejected_df, min_date, max_date \
+                in results:
+            self.all_results[strategy_name] = strat_results
+            if processed_df is not None:
+                self.processed_dfs[strategy_name] = processed_df
+                self.rejected_df[strategy_name] = rejected_df
+        return min_date, max_date
+
+    def _strategy_job_instance(self, strategy: IStrategy) -> 'Backtesting':
+        """
+        Shallow copy of this instance, holding only the given strategy - so each task of
+        backtest_strategies_parallel() only ships the strategy it runs.
+        Candle data is part of the data file, and not pickled with the task.
+        """
+        backtesting = copy(self)
+        backtesting.strategylist = [strategy]
+        backtesting.strategy = strategy
+        backtesting.detail_data = {}
+        backtesting.results = {}
+        backtesting.all_results = {}
+        backtesting.processed_dfs = {}
+        backtesting.rejected_df = {}
+        # Strategies are already backtested in parallel.
+        backtesting.backtest_jobs = 1
+        return backtesting
+
+    def _backtest_strategy_job(self, data_file: Path, timerange: TimeRange) -> Tuple:
+        """
+        Worker part of backtest_strategies_parallel(), running on an instance created by
+        _strategy_job_instance().
+        """
+        # Memory-mapped copy on write - shared between workers, as long as strategies
+        # don't modify the data in place.
+        data, self.detail_data = load(data_file, mmap_mode='c')
+        strat = self.strategylist[0]
+        strategy_name = strat.get_strategy_name()
+        min_date, max_date = self.backtest_one_strategy(strat, data, timerange)
+        return (strategy_name, self.all_results[strategy_name],
+                self.processed_dfs.get(strategy_name), self.rejected_df.get(strategy_name),
+                min_date, max_date)
+
     def _get_min_cached_backtest_date(self):
         min_backtest_date = None
         backtest_cache_age = self.config.get('backtest_cache', constants.BACKTEST_CACHE_DEFAULT)
@@ -1342,12 +1868,20 @@ class Backtesting:
 
         self.load_prior_backtest()
 
+        strategies = []
         for strat in self.strategylist:
             if self.results and strat.get_strategy_name() in self.results['strategy']:
                 # When previous result hash matches - reuse that result and skip backtesting.
                 logger.info(f'Reusing result of previous backtest for {strat.get_strategy_name()}')
                 continue
-            min_date, max_date = self.backtest_one_strategy(strat, data, timerange)
+            strategies.append(strat)
+
+        if self.backtest_jobs != 1 and len(strategies) > 1:
+            min_date, max_date = self.backtest_strategies_parallel(
+                strategies, data, timerange, self.backtest_jobs)
+        else:
+            for strat in strategies:
+                min_date, max_date = self.backtest_one_strategy(strat, data, timerange)
 
         # Update old results with new ones.
         if len(self.all_results) > 0:
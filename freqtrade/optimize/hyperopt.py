@@ -6,16 +6,19 @@ This module contains the hyperopt logic
 
 import logging
 import random
-import sys
 import warnings
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
 from datetime import datetime, timezone
-from math import ceil
+from multiprocessing import get_context
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from tempfile import TemporaryDirectory
+from typing import Any, Callable, Deque, Dict, List, Optional, Sequence, Set, Tuple
+from uuid import uuid4
 
 import rapidjson
 from colorama import init as colorama_init
-from joblib import Parallel, cpu_count, delayed, dump, load, wrap_non_picklable_objects
+from joblib import cpu_count, dump, effective_n_jobs, load
 from joblib.externals import cloudpickle
 from pandas import DataFrame
 from rich.progress import (BarColumn, MofNCompleteColumn, Progress, TaskProgressColumn, TextColumn,
@@ -28,13 +31,16 @@ from freqtrade.data.metrics import calculate_market_change
 from freqtrade.enums import HyperoptState
 from freqtrade.exceptions import OperationalException
 from freqtrade.misc import deep_merge_dicts, file_dump_json, plural
+from freqtrade.optimize.backtest_parallel import register_pickle_by_value
 from freqtrade.optimize.backtesting import Backtesting
 # Import IHyperOpt and IHyperOptLoss to allow unpickling classes from these modules
 from freqtrade.optimize.hyperopt_auto import HyperOptAuto
 from freqtrade.optimize.hyperopt_loss_interface import IHyperOptLoss
+from freqtrade.optimize.hyperopt_results_index import append_index_record, get_index_filename
 from freqtrade.optimize.hyperopt_tools import (HyperoptStateContainer, HyperoptTools,
                                                hyperopt_serializer)
-from freqtrade.optimize.optimize_reports import generate_strategy_stats
+from freqtrade.optimize.hyperopt_worker import run_epoch
+from freqtrade.optimize.optimize_reports import complete_strategy_stats, generate_strategy_stats
 from freqtrade.resolvers.hyperopt_resolver import HyperOptLossResolver
 
 
@@ -105,6 +111,14 @@ class Hyperopt:
                                    f'strategy_{strategy}_{time_now}.fthypt')
         self.data_pickle_file = (self.config['user_data_dir'] /
                                  'hyperopt_results' / 'hyperopt_tickerdata.pkl')
+        # Hyperopt instance for the worker processes - set while hyperopt is running.
+        self.worker_file: Optional[Path] = None
+        # Points told to the optimizer, as hashable tuples.
+        self.evaluated_points: Set[Tuple[Any, ...]] = set()
+        # Prices are identical for all epochs of this run - workers convert them only once.
+        self.backtesting.price_cache_scope = uuid4().hex
+        # Epochs run in parallel already.
+        self.backtesting.backtest_jobs = 1
         self.total_epochs = config.get('epochs', 0)
 
         self.current_best_loss = 100
@@ -130,6 +144,13 @@ class Hyperopt:
         self.print_colorized = self.config.get('print_colorized', False)
         self.print_json = self.config.get('print_json', False)
 
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        # The optimizer is only used in the main process.
+        state.pop('opt', None)
+        state.pop('evaluated_points', None)
+        return state
+
     @staticmethod
     def get_lock_filename(config: Config) -> str:
 
@@ -139,7 +160,8 @@ class Hyperopt:
         """
         Remove hyperopt pickle files to restart hyperopt.
         """
-        for f in [self.data_pickle_file, self.results_file]:
+        for f in [self.data_pickle_file, self.results_file,
+                  get_index_filename(self.results_file)]:
             p = Path(f)
             if p.is_file():
                 logger.info(f"Removing `{p}`.")
@@ -151,10 +173,7 @@ class Hyperopt:
         For this to properly work, we need to register the module of the imported class
         to pickle as value.
         """
-        for modules in bases:
-            if modules.__name__ != 'IStrategy':
-                cloudpickle.register_pickle_by_value(sys.modules[modules.__module__])
-                self.hyperopt_pickle_magic(modules.__bases__)
+        register_pickle_by_value(bases)
 
     def _get_params_dict(self, dimensions: List[Dimension], raw_params: List[Any]) -> Dict:
 
@@ -175,10 +194,13 @@ class Hyperopt:
         :param epoch: result dictionary for this epoch.
         """
         epoch[FTHYPT_FILEVERSION] = 2
-        with self.results_file.open('a') as f:
-            rapidjson.dump(epoch, f, default=hyperopt_serializer,
-                           number_mode=rapidjson.NM_NATIVE | rapidjson.NM_NAN)
-            f.write("\n")
+        line = rapidjson.dumps(epoch, default=hyperopt_serializer,
+                               number_mode=rapidjson.NM_NATIVE | rapidjson.NM_NAN) + "\n"
+        data = line.encode('utf-8')
+        with self.results_file.open('ab') as f:
+            offset = f.tell()
+            f.write(data)
+        append_index_record(self.results_file, offset, len(data), epoch)
 
         self.num_epochs_saved += 1
         logger.debug(f"{self.num_epochs_saved} {plural(self.num_epochs_saved, 'epoch')} "
@@ -351,11 +373,12 @@ class Hyperopt:
 
             self.backtesting.strategy.max_open_trades = updated_max_open_trades
 
-        with self.data_pickle_file.open('rb') as f:
-            processed = load(f, mmap_mode='r')
-            if self.analyze_per_epoch:
-                # Data is not yet analyzed, rerun populate_indicators.
-                processed = self.advise_and_trim(processed)
+        # Loaded by path, so the candles are memory-mapped (and shared between the workers).
+        # Copy-on-write, so changes by the strategy stay private to this epoch.
+        processed = load(self.data_pickle_file, mmap_mode='c')
+        if self.analyze_per_epoch:
+            # Data is not yet analyzed, rerun populate_indicators.
+            processed = self.advise_and_trim(processed)
 
         bt_results = self.backtesting.backtest(
             processed=processed,
@@ -380,7 +403,7 @@ class Hyperopt:
         strat_stats = generate_strategy_stats(
             self.pairlist, self.backtesting.strategy.get_strategy_name(),
             backtesting_results, min_date, max_date, market_change=self.market_change,
-            is_hyperopt=True,
+            is_hyperopt=True, stats=self.custom_hyperoptloss.backtest_stats_required,
         )
         results_explanation = HyperoptTools.format_results_explanation_string(
             strat_stats, self.config['stake_currency'])
@@ -433,17 +456,82 @@ class Hyperopt:
             model_queue_size=SKOPT_MODEL_QUEUE_SIZE,
         )
 
-    def run_optimizer_parallel(
-            self, parallel: Parallel, asked: List[List]) -> List[Dict[str, Any]]:
-        """ Start optimizer in a parallel way """
-        return parallel(delayed(
-                        wrap_non_picklable_objects(self.generate_optimizer))(v) for v in asked)
+    def run_optimizer_serial(self, start: int, epoch_done: Callable[[], None]) -> None:
+        """
+        Run epochs one after the other in this process.
+        :param start: Number of epochs already evaluated
+        :param epoch_done: Called after each evaluated epoch
+        """
+        for current in range(start + 1, self.total_epochs + 1):
+            asked, is_random = self.get_asked_points(n_points=1)
+            val = self.generate_optimizer(asked[0])
+            self.tell_results(asked, [val['loss']])
+            # Use human-friendly indexes here (starting from 1)
+            self.evaluate_result(val, current, is_random[0])
+            epoch_done()
+
+    def get_worker_file(self) -> Path:
+        """
+        Store this instance for the worker processes.
+        Stored on first use, to include state of epochs run in this process.
+        """
+        if not self.worker_file:
+            raise OperationalException('Hyperopt is not running.')
+        if not self.worker_file.is_file():
+            with self.worker_file.open('wb') as f:
+                cloudpickle.dump(self, f)
+        return self.worker_file
+
+    def run_optimizer_async(self, jobs: int, start: int, epoch_done: Callable[[], None]) -> None:
+        """
+        Run epochs in worker processes without waiting for batches of epochs to complete.
+        Up to `2 * jobs` epochs are queued, so workers don't idle while an epoch takes longer.
+        Results are told to the optimizer in epoch order, and the next point is asked right
+        after each result - so the asked points don't depend on the timing of the workers,
+        and runs stay reproducible with a fixed random state.
+        :param start: Number of epochs already evaluated
+        :param epoch_done: Called after each evaluated epoch
+        """
+        worker_file = self.get_worker_file()
+        pending: Deque[Tuple[List[Any], bool, Future]] = deque()
+        # Spawn workers - forking while other threads (e.g. the progressbar) hold locks
+        # could deadlock the workers.
+        executor = ProcessPoolExecutor(max_workers=jobs, mp_context=get_context('spawn'))
+
+        def submit(n_points: int) -> None:
+            asked, is_random = self.get_asked_points(
+                n_points=n_points, pending=[params for params, _, _ in pending])
+            for params, random_point in zip(asked, is_random):
+                pending.append(
+                    (params, random_point, executor.submit(run_epoch, worker_file, params)))
+
+        try:
+            asked_epochs = start + min(2 * jobs, self.total_epochs - start)
+            submit(asked_epochs - start)
+            for current in range(start + 1, self.total_epochs + 1):
+                params, random_point, future = pending.popleft()
+                val = future.result()
+                self.tell_results([params], [val['loss']])
+                # Use human-friendly indexes here (starting from 1)
+                self.evaluate_result(val, current, random_point)
+                epoch_done()
+                if asked_epochs < self.total_epochs:
+                    submit(1)
+                    asked_epochs += 1
+        finally:
+            for _, _, future in pending:
+                future.cancel()
+            executor.shutdown()
 
     def _set_random_state(self, random_state: Optional[int]) -> int:
         return random_state or random.randint(1, 2**16 - 1)
 
     def advise_and_trim(self, data: Dict[str, DataFrame]) -> Dict[str, DataFrame]:
-        preprocessed = self.backtesting.strategy.advise_all_indicators(data)
+        if self.analyze_per_epoch:
+            # Indicators depend on the parameters of the epoch - don't cache them.
+            preprocessed = self.backtesting.strategy.advise_all_indicators(data)
+        else:
+            preprocessed = self.backtesting.advise_all_indicators(data)
 
         # Trim startup period from analyzed dataframe to get correct dates for output.
         trimmed = trim_dataframes(preprocessed, self.timerange, self.backtesting.required_startup)
@@ -474,41 +562,38 @@ class Hyperopt:
         else:
             dump(data, self.data_pickle_file)
 
-    def get_asked_points(self, n_points: int) -> Tuple[List[List[Any]], List[bool]]:
+    def get_asked_points(self, n_points: int, pending: Sequence[List[Any]] = ()
+                         ) -> Tuple[List[List[Any]], List[bool]]:
         """
         Enforce points returned from `self.opt.ask` have not been already evaluated
 
         Steps:
         1. Try to get points using `self.opt.ask` first
-        2. Discard the points that have already been evaluated
+        2. Discard the points that have already been evaluated (or are pending)
         3. Retry using `self.opt.ask` up to 3 times
         4. If still some points are missing in respect to `n_points`, random sample some points
         5. Repeat until at least `n_points` points in the `asked_non_tried` list
         6. Return a list with length truncated at `n_points`
+        :param pending: Points currently being evaluated - which are skipped as well
         """
-        def unique_list(a_list):
-            new_list = []
-            for item in a_list:
-                if item not in new_list:
-                    new_list.append(item)
-            return new_list
+        skipped = {tuple(x) for x in pending}
         i = 0
         asked_non_tried: List[List[Any]] = []
         is_random_non_tried: List[bool] = []
         while i < 5 and len(asked_non_tried) < n_points:
             if i < 3:
                 self.opt.cache_ = {}
-                asked = unique_list(self.opt.ask(n_points=n_points * 5))
-                is_random = [False for _ in range(len(asked))]
+                asked = self.opt.ask(n_points=n_points * 5)
+                is_random = False
             else:
-                asked = unique_list(self.opt.space.rvs(n_samples=n_points * 5))
-                is_random = [True for _ in range(len(asked))]
-            is_random_non_tried += [rand for x, rand in zip(asked, is_random)
-                                    if x not in self.opt.Xi
-                                    and x not in asked_non_tried]
-            asked_non_tried += [x for x in asked
-                                if x not in self.opt.Xi
-                                and x not in asked_non_tried]
+                asked = self.opt.space.rvs(n_samples=n_points * 5)
+                is_random = True
+            for x in asked:
+                point = tuple(x)
+                if point not in self.evaluated_points and point not in skipped:
+                    skipped.add(point)
+                    asked_non_tried.append(x)
+                    is_random_non_tried.append(is_random)
             i += 1
 
         if asked_non_tried:
@@ -519,6 +604,15 @@ class Hyperopt:
         else:
             return self.opt.ask(n_points=n_points), [False for _ in range(n_points)]
 
+    def tell_results(self, asked: List[List[Any]], losses: List[float]) -> None:
+        """
+        Tell results to the optimizer, and index the points as evaluated.
+        Points are indexed as tuples - dimension values (numbers, strings and booleans for
+        categorical dimensions) hash by value, so lookups don't depend on the number of epochs.
+        """
+        self.opt.tell(asked, losses)
+        self.evaluated_points.update(tuple(x) for x in asked)
+
     def evaluate_result(self, val: Dict[str, Any], current: int, is_random: bool):
         """
         Evaluate results returned from generate_optimizer
@@ -535,6 +629,9 @@ class Hyperopt:
         # order they will be shown to the user.
         val['is_best'] = is_best
         val['is_random'] = is_random
+        if is_best:
+            # Epochs only come with the stats required by the loss function.
+            val['results_metrics'] = complete_strategy_stats(val['results_metrics'])
         self.print_results(val)
 
         if is_best:
@@ -568,14 +665,16 @@ class Hyperopt:
         logger.info(f'Number of parallel jobs set as: {config_jobs}')
 
         self.opt = self.get_optimizer(self.dimensions, config_jobs)
+        self.evaluated_points = set()
 
         if self.print_colorized:
             colorama_init(autoreset=True)
 
+        jobs = effective_n_jobs(config_jobs)
+        logger.info(f'Effective number of parallel workers used: {jobs}')
         try:
-            with Parallel(n_jobs=config_jobs) as parallel:
-                jobs = parallel._effective_n_jobs()
-                logger.info(f'Effective number of parallel workers used: {jobs}')
+            with TemporaryDirectory() as tmpdir:
+                self.worker_file = Path(tmpdir) / 'hyperopt_worker.pkl'
 
                 # Define progressbar
                 with Progress(
@@ -598,31 +697,23 @@ class Hyperopt:
                         # This allows dataprovider to load it's informative cache.
                         asked, is_random = self.get_asked_points(n_points=1)
                         f_val0 = self.generate_optimizer(asked[0])
-                        self.opt.tell(asked, [f_val0['loss']])
+                        self.tell_results(asked, [f_val0['loss']])
                         self.evaluate_result(f_val0, 1, is_random[0])
                         pbar.update(task, advance=1)
                         start += 1
 
-                    evals = ceil((self.total_epochs - start) / jobs)
-                    for i in range(evals):
-                        # Correct the number of epochs to be processed for the last
-                        # iteration (should not exceed self.total_epochs in total)
-                        n_rest = (i + 1) * jobs - (self.total_epochs - start)
-                        current_jobs = jobs - n_rest if n_rest > 0 else jobs
-
-                        asked, is_random = self.get_asked_points(n_points=current_jobs)
-                        f_val = self.run_optimizer_parallel(parallel, asked)
-                        self.opt.tell(asked, [v['loss'] for v in f_val])
-
-                        for j, val in enumerate(f_val):
-                            # Use human-friendly indexes here (starting from 1)
-                            current = i * jobs + j + 1 + start
+                    def epoch_done() -> None:
+                        pbar.update(task, advance=1)
 
-                            self.evaluate_result(val, current, is_random[j])
-                            pbar.update(task, advance=1)
+                    if jobs > 1:
+                        self.run_optimizer_async(jobs, start, epoch_done)
+                    else:
+                        self.run_optimizer_serial(start, epoch_done)
 
         except KeyboardInterrupt:
             print('User interrupted..')
+        finally:
+            self.worker_file = None
 
         logger.info(f"{self.num_epochs_saved} {plural(self.num_epochs_saved, 'epoch')} "
                     f"saved to '{self.results_file}'.")
@@ -20,6 +20,8 @@ class CalmarHyperOptLoss(IHyperOptLoss):
     This implementation uses the Calmar Ratio calculation.
     """
 
+    backtest_stats_required = []
+
     @staticmethod
     def hyperopt_loss_function(results: DataFrame, trade_count: int,
                                min_date: datetime, max_date: datetime,
@@ -21,6 +21,8 @@ class MaxDrawDownHyperOptLoss(IHyperOptLoss):
     Less max drawdown more profit -> Lower return value
     """
 
+    backtest_stats_required = []
+
     @staticmethod
     def hyperopt_loss_function(results: DataFrame, trade_count: int,
                                min_date: datetime, max_date: datetime,
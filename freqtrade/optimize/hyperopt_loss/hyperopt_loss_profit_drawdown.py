@@ -18,6 +18,8 @@ DRAWDOWN_MULT = 0.075
 
 
 class ProfitDrawDownHyperOptLoss(IHyperOptLoss):
+    backtest_stats_required = []
+
     @staticmethod
     def hyperopt_loss_function(results: DataFrame, trade_count: int, *args, **kwargs) -> float:
         total_profit = results["profit_abs"].sum()
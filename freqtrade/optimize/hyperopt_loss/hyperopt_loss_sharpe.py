@@ -20,6 +20,8 @@ class SharpeHyperOptLoss(IHyperOptLoss):
     This implementation uses the Sharpe Ratio calculation.
     """
 
+    backtest_stats_required = []
+
     @staticmethod
     def hyperopt_loss_function(results: DataFrame, trade_count: int,
                                min_date: datetime, max_date: datetime,
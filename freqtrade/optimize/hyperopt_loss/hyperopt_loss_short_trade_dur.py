@@ -31,6 +31,8 @@ class ShortTradeDurHyperOptLoss(IHyperOptLoss):
     Defines the default loss function for hyperopt
     """
 
+    backtest_stats_required = []
+
     @staticmethod
     def hyperopt_loss_function(results: DataFrame, trade_count: int,
                                *args, **kwargs) -> float:
@@ -5,7 +5,7 @@ This module defines the interface for the loss-function for hyperopt
 
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional
 
 from pandas import DataFrame
 
@@ -18,6 +18,10 @@ class IHyperOptLoss(ABC):
     Defines the custom loss function (`hyperopt_loss_function()` which is evaluated every epoch.)
     """
     timeframe: str
+    # Report sections of `backtest_stats` used by the loss function (e.g. ['sharpe']).
+    # Summary metrics (trade counts, profits, durations, drawdowns) are always available.
+    # None (the default) generates the full backtest report for every epoch.
+    backtest_stats_required: Optional[List[str]] = None
 
     @staticmethod
     @abstractmethod
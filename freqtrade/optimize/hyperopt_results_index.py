@@ -0,0 +1,125 @@
+"""
+Index for hyperopt results files.
+
+Hyperopt results files (.fthypt) store one json line per epoch, including all metrics.
+Next to the results file, hyperopt stores an index with one fixed-size record per epoch:
+the position of the epoch in the results file, and the summary values epochs are filtered on.
+`hyperopt-list` and `hyperopt-show` filter on the index, and only parse the epochs they need.
+"""
+import logging
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Union, overload
+
+import numpy as np
+import rapidjson
+
+
+logger = logging.getLogger(__name__)
+
+# Metrics from `results_metrics` which are stored in the index (NaN if not available).
+INDEX_METRICS = ['total_trades', 'profit_mean', 'profit_total', 'profit_total_abs',
+                 'holding_avg_s', 'max_drawdown_account']
+
+INDEX_DTYPE = np.dtype([
+    ('offset', '<i8'),
+    ('length', '<i8'),
+    ('is_best', '?'),
+    ('loss', '<f8'),
+    *((metric, '<f8') for metric in INDEX_METRICS),
+])
+
+
+def get_index_filename(results_file: Path) -> Path:
+    return results_file.with_name(f'{results_file.name}.idx')
+
+
+def append_index_record(results_file: Path, offset: int, length: int, epoch: Dict) -> None:
+    """
+    Append the index record of one epoch.
+    :param offset: Position of the epoch in the results file
+    :param length: Length (in bytes) of the epoch in the results file
+    :param epoch: The epoch, as stored in the results file
+    """
+    record = np.zeros(1, dtype=INDEX_DTYPE)
+    record['offset'] = offset
+    record['length'] = length
+    record['is_best'] = bool(epoch.get('is_best'))
+    record['loss'] = epoch['loss']
+    metrics = epoch.get('results_metrics', {})
+    for metric in INDEX_METRICS:
+        value = metrics.get(metric)
+        record[metric] = value if isinstance(value, (int, float)) else np.nan
+    with get_index_filename(results_file).open('ab') as f:
+        record.tofile(f)
+
+
+def load_index(results_file: Path) -> Optional[np.ndarray]:
+    """
+    Load the index of a results file.
+    :return: Index records, or None if there is no index matching the results file
+        (e.g. for results of older versions, or interrupted writes).
+    """
+    index_file = get_index_filename(results_file)
+    if not index_file.is_file() or index_file.stat().st_size % INDEX_DTYPE.itemsize:
+        return None
+    index = np.fromfile(index_file, dtype=INDEX_DTYPE)
+    end = int(index['offset'][-1] + index['length'][-1]) if len(index) else 0
+    if end != results_file.stat().st_size:
+        logger.info(f"Index '{index_file}' does not match the results file, ignoring it.")
+        return None
+    return index
+
+
+def index_summaries(index: np.ndarray) -> List[Dict[str, Any]]:
+    """
+    Convert index records to epoch summaries, which can be filtered like complete epochs.
+    Metrics not available for an epoch are omitted. `index` is the position of the record.
+    """
+    metrics = {metric: index[metric].tolist() for metric in INDEX_METRICS}
+    return [{
+        'index': idx,
+        'is_best': is_best,
+        'loss': loss,
+        'results_metrics': {metric: values[idx] for metric, values in metrics.items()
+                            if values[idx] == values[idx]},
+    } for idx, (is_best, loss) in enumerate(zip(index['is_best'].tolist(),
+                                                 index['loss'].tolist()))]
+
+
+class IndexedEpochs(Sequence):
+    """
+    Epochs of a results file, parsed on access.
+    """
+
+    def __init__(self, results_file: Path, records: np.ndarray) -> None:
+        self.results_file = results_file
+        self.records = records
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    @overload
+    def __getitem__(self, index: int) -> Dict[str, Any]:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> 'IndexedEpochs':
+        ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Dict[str, Any], 'IndexedEpochs']:
+        if isinstance(index, slice):
+            return IndexedEpochs(self.results_file, self.records[index])
+        record = self.records[index]
+        with self.results_file.open('rb') as f:
+            return self._read_epoch(f, record)
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        with self.results_file.open('rb') as f:
+            for record in self.records:
+                yield self._read_epoch(f, record)
+
+    @staticmethod
+    def _read_epoch(f, record) -> Dict[str, Any]:
+        f.seek(int(record['offset']))
+        return rapidjson.loads(f.read(int(record['length'])))
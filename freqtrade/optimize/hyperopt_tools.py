@@ -2,7 +2,7 @@ import logging
 from copy import deepcopy
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, Iterator, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
 
 import numpy as np
 import pandas as pd
@@ -16,6 +16,7 @@ from freqtrade.enums import HyperoptState
 from freqtrade.exceptions import OperationalException
 from freqtrade.misc import deep_merge_dicts, round_coin_value, round_dict, safe_value_fallback2
 from freqtrade.optimize.hyperopt_epoch_filters import hyperopt_filter_epochs
+from freqtrade.optimize.hyperopt_results_index import IndexedEpochs, index_summaries, load_index
 from freqtrade.optimize.optimize_reports import generate_wins_draws_losses
 
 
@@ -142,6 +143,20 @@ class HyperoptTools():
 
     @staticmethod
     def load_filtered_results(results_file: Path, config: Config) -> Tuple[List, int]:
+        """
+        Load the epochs matching the filters of the configuration.
+        :return: List of epochs, total number of epochs
+        """
+        epochs, total_epochs = HyperoptTools.load_filtered_epochs(results_file, config)
+        return list(epochs), total_epochs
+
+    @staticmethod
+    def load_filtered_epochs(results_file: Path, config: Config) -> Tuple[Sequence[Dict], int]:
+        """
+        Like `load_filtered_results()` - but for indexed results files, epochs are only
+        parsed once accessed.
+        :return: Sequence of epochs, total number of epochs
+        """
         filteroptions = {
             'only_best': config.get('hyperopt_list_best', False),
             'only_profitable': config.get('hyperopt_list_profitable', False),
@@ -161,6 +176,14 @@ class HyperoptTools():
             logger.warning(f"Hyperopt file {results_file} not found.")
             return [], 0
 
+        index = load_index(results_file)
+        if index is not None:
+            logger.info(f"Reading epoch index of '{results_file}'")
+            logger.info(f"Loaded {len(index)} previous evaluations from disk.")
+            summaries = hyperopt_filter_epochs(index_summaries(index), filteroptions, log=True)
+            records = index[[summary['index'] for summary in summaries]]
+            return IndexedEpochs(results_file, records), len(index)
+
         epochs = []
         total_epochs = 0
         for epochs_tmp in HyperoptTools._read_results(results_file):
@@ -0,0 +1,29 @@
+"""
+Worker side of parallel hyperopt.
+
+Worker processes load the Hyperopt instance once per hyperopt run, and keep it - including the
+backtesting and strategy state - for all epochs they evaluate. Epochs only send their parameters.
+"""
+import pickle
+from pathlib import Path
+from typing import Any, Dict, List
+
+
+# Hyperopt instance of the current run, by the file it was loaded from.
+_worker_hyperopt: Dict[Path, Any] = {}
+
+
+def run_epoch(hyperopt_file: Path, raw_params: List[Any]) -> Dict[str, Any]:
+    """
+    Evaluate one epoch in a worker process.
+    :param hyperopt_file: Pickled Hyperopt instance (unique per hyperopt run)
+    :param raw_params: Parameters of this epoch, as asked from the optimizer
+    :return: Epoch result, as returned by Hyperopt.generate_optimizer()
+    """
+    hyperopt = _worker_hyperopt.get(hyperopt_file)
+    if hyperopt is None:
+        # New hyperopt run - drop the instance of the prior run.
+        _worker_hyperopt.clear()
+        with hyperopt_file.open('rb') as f:
+            hyperopt = _worker_hyperopt[hyperopt_file] = pickle.load(f)
+    return hyperopt.generate_optimizer(raw_params)
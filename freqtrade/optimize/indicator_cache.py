@@ -0,0 +1,181 @@
+"""
+On-disk cache for the indicators populated by backtesting and hyperopt.
+
+Indicators are stored per pair as uncompressed feather (Arrow IPC) files. Entries are keyed
+by everything the indicators are derived from: the source of the strategy and its base classes,
+the values of the parameters not only used by the entry / exit signals, pair, timeframe,
+timerange, candle type, and a fingerprint of the candles (including the candles of informative
+pairs).
+"""
+import hashlib
+import inspect
+import logging
+import re
+from pathlib import Path
+from typing import Dict, List, Optional, Set
+
+import numpy as np
+import rapidjson
+from pandas import DataFrame
+
+from freqtrade import __version__
+from freqtrade.misc import pair_to_filename
+from freqtrade.strategy.interface import IStrategy
+
+
+logger = logging.getLogger(__name__)
+
+# Only generate signals from the indicators - parameters used nowhere else can't change them.
+SIGNAL_METHODS = ('populate_entry_trend', 'populate_exit_trend',
+                  'populate_buy_trend', 'populate_sell_trend')
+# Accessing parameters by (computed) name - any parameter may be used then.
+DYNAMIC_ACCESS = re.compile(r'\bgetattr\b|\battrgetter\b|\bvars\(|__dict__|__getattribute__|'
+                            r'\benumerate_parameters\b|\bdetect_parameters\b')
+
+
+def get_dataframe_fingerprint(dataframe: DataFrame) -> str:
+    """
+    Hash the content of a candle dataframe.
+    """
+    digest = hashlib.sha1()
+    for column, values in dataframe.items():
+        digest.update(str(column).encode('utf-8'))
+        array = values.to_numpy()
+        if array.dtype == object:
+            digest.update(repr(array.tolist()).encode('utf-8'))
+        else:
+            digest.update(np.ascontiguousarray(array).tobytes())
+    return digest.hexdigest()
+
+
+class IndicatorCache:
+    """
+    Drop-in for `IStrategy.advise_all_indicators()`, reusing indicators of prior runs.
+    Only the most recent entry is kept per strategy, pair and timeframe.
+    """
+
+    def __init__(self, cache_dir: Path) -> None:
+        self.cache_dir = cache_dir
+
+    def advise_all_indicators(self, strategy: IStrategy,
+                              data: Dict[str, DataFrame]) -> Dict[str, DataFrame]:
+        """
+        Populate indicators for all pairs - loading them from the cache where possible,
+        and caching newly populated indicators.
+        """
+        strategy_key = self.get_strategy_key(strategy)
+        result: Dict[str, DataFrame] = {}
+        cached_pairs = 0
+        for pair, pair_data in data.items():
+            digest = hashlib.sha1(strategy_key.encode('utf-8'))
+            digest.update(pair.encode('utf-8'))
+            digest.update(get_dataframe_fingerprint(pair_data).encode('utf-8'))
+            filename = (self.cache_dir / strategy.get_strategy_name()
+                        / f'{pair_to_filename(pair)}-{strategy.timeframe}'
+                        / f'{digest.hexdigest()}.feather')
+            cached = self._load(filename)
+            if cached is None:
+                cached = strategy.advise_indicators(pair_data.copy(), {'pair': pair}).copy()
+                self._store(filename, cached)
+            else:
+                cached_pairs += 1
+            result[pair] = cached
+        logger.info(f'Loaded indicators of {cached_pairs} of {len(data)} pairs from the '
+                    'indicator cache.')
+        return result
+
+    @staticmethod
+    def get_strategy_key(strategy) -> str:
+        """
+        Hash everything the indicators of all pairs depend on.
+        """
+        digest = hashlib.sha1(__version__.encode('utf-8'))
+        sources = []
+        for file in IndicatorCache.get_strategy_files(strategy):
+            source = file.read_bytes()
+            digest.update(source)
+            sources.append(source.decode('utf-8', errors='replace'))
+        indicator_params = IndicatorCache.get_indicator_parameters(strategy, '\n'.join(sources))
+        params = {name: param.value for name, param in strategy.enumerate_parameters()
+                  if name in indicator_params}
+        settings = [strategy.timeframe, strategy.config.get('timerange'),
+                    strategy.config.get('candle_type_def'), strategy.config.get('trading_mode'),
+                    strategy.config.get('margin_mode'), strategy.config['exchange']['name']]
+        digest.update(rapidjson.dumps([params, settings], default=str,
+                                      number_mode=rapidjson.NM_NAN).encode('utf-8'))
+        # Informative candles are loaded by the strategy itself.
+        for pair, timeframe, candle_type in sorted(strategy.gather_informative_pairs()):
+            informative = strategy.dp.historic_ohlcv(pair, timeframe, candle_type)
+            digest.update(f'{pair} {timeframe} {candle_type}'.encode())
+            digest.update(get_dataframe_fingerprint(informative).encode('utf-8'))
+        return digest.hexdigest()
+
+    @staticmethod
+    def get_strategy_files(strategy) -> List[Path]:
+        """
+        Source files of the strategy and of the classes it inherits from (except freqtrade's own).
+        """
+        files = {Path(strategy.__file__).resolve()}
+        for cls in type(strategy).__mro__:
+            if cls in IStrategy.__mro__ or cls.__module__.startswith('freqtrade.'):
+                continue
+            try:
+                files.add(Path(inspect.getfile(cls)).resolve())
+            except TypeError:
+                # Modules loaded by the strategy resolver aren't registered.
+                pass
+            for attr in vars(cls).values():
+                func = inspect.unwrap(getattr(attr, '__func__', getattr(attr, 'fget', attr)))
+                if inspect.isfunction(func):
+                    files.add(Path(func.__code__.co_filename).resolve())
+        return sorted(file for file in files if file.is_file())
+
+    @staticmethod
+    def get_indicator_parameters(strategy: IStrategy, source: str) -> Set[str]:
+        """
+        Names of the parameters accessed (as `.<name>`) anywhere in the strategy source
+        (including its base classes), except in the methods generating entry / exit signals.
+        Parameters of e.g. the buy and sell spaces used only for the signals therefore don't
+        invalidate the cached indicators.
+        If the source accesses parameters by name elsewhere (e.g. via `getattr()`), all
+        parameters are used.
+        """
+        for method in SIGNAL_METHODS:
+            func = getattr(type(strategy), method, None)
+            if func is None:
+                continue
+            try:
+                source = source.replace(inspect.getsource(func), '')
+            except (OSError, TypeError):
+                pass
+        if DYNAMIC_ACCESS.search(source):
+            return {name for name, _ in strategy.enumerate_parameters()}
+        return {name for name, _ in strategy.enumerate_parameters()
+                if re.search(rf'\.{name}\b', source)}
+
+    @staticmethod
+    def _load(filename: Path) -> Optional[DataFrame]:
+        if not filename.is_file():
+            return None
+        from pyarrow import feather
+        try:
+            return feather.read_table(filename, memory_map=True).to_pandas(
+                split_blocks=True, self_destruct=True)
+        except Exception as e:
+            logger.warning(f'Could not load cached indicators from {filename}: {e}')
+            return None
+
+    @staticmethod
+    def _store(filename: Path, dataframe: DataFrame) -> None:
+        filename.parent.mkdir(parents=True, exist_ok=True)
+        # Entries of older strategy versions / candles are outdated.
+        for outdated in filename.parent.glob('*.feather'):
+            outdated.unlink()
+        tmp_file = filename.with_suffix('.tmp')
+        try:
+            dataframe.to_feather(tmp_file, compression='uncompressed')
+            tmp_file.replace(filename)
+        except Exception as e:
+            # E.g. columns feather can't store - indicators are populated on every run.
+            logger.warning(f'Could not cache indicators in {filename}: {e}')
+            tmp_file.unlink(missing_ok=True)
@@ -2,13 +2,14 @@ import logging
 from copy import deepcopy
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Union
+from typing import Any, Collection, Dict, List, Optional, Tuple, Union
 
 from pandas import DataFrame, concat, to_datetime
 from tabulate import tabulate
 
 from freqtrade.constants import (BACKTEST_BREAKDOWNS, DATETIME_PRINT_FORMAT, LAST_BT_RESULT_FN,
                                  UNLIMITED_STAKE_AMOUNT, Config, IntOrInf)
+from freqtrade.data.btanalysis import BT_DATA_COLUMNS
 from freqtrade.data.metrics import (calculate_cagr, calculate_calmar, calculate_csum,
                                     calculate_expectancy, calculate_market_change,
                                     calculate_max_drawdown, calculate_sharpe, calculate_sortino)
@@ -18,6 +19,21 @@ from freqtrade.optimize.backtest_caching import get_backtest_metadata_filename
 
 logger = logging.getLogger(__name__)
 
+# Report sections of the strategy stats, with the keys they provide. These are skipped by lean
+# strategy stats (as used by hyperopt) unless requested - all other keys are always generated.
+REPORT_SECTIONS: Dict[str, Tuple[str, ...]] = {
+    'pairs': ('best_pair', 'worst_pair', 'results_per_pair'),
+    'enter_tags': ('results_per_enter_tag', ),
+    'exit_reasons': ('exit_reason_summary', ),
+    'left_open_trades': ('left_open_trades', ),
+    'daily': ('backtest_best_day', 'backtest_worst_day', 'backtest_best_day_abs',
+              'backtest_worst_day_abs', 'winning_days', 'draw_days', 'losing_days',
+              'daily_profit'),
+    'sortino': ('sortino', ),
+    'sharpe': ('sharpe', ),
+    'calmar': ('calmar', ),
+}
+
 
 def store_backtest_stats(
         recordfilename: Path, stats: Dict[str, DataFrame], dtappendix: str) -> None:
@@ -436,12 +452,83 @@ def generate_daily_stats(results: DataFrame) -> Dict[str, Any]:
     }
 
 
+def generate_report_sections(results: DataFrame, strat_stats: Dict[str, Any],
+                             min_date: datetime, max_date: datetime,
+                             stats: Optional[Collection[str]] = None) -> Dict[str, Any]:
+    """
+    Generate the report sections (see REPORT_SECTIONS) of the strategy stats.
+    :param results: Trades of the backtest
+    :param strat_stats: Strategy stats, containing at least the summary metrics
+    :param stats: Keys of the strategy stats to generate - generates all sections if None.
+    :return: Dictionary containing the keys of the generated sections.
+    """
+    sections = [name for name, keys in REPORT_SECTIONS.items()
+                if stats is None or any(key in stats for key in keys)]
+    pairlist = strat_stats['pairlist']
+    start_balance = strat_stats['starting_balance']
+    stake_currency = strat_stats['stake_currency']
+    report: Dict[str, Any] = {}
+
+    if 'pairs' in sections:
+        pair_results = generate_pair_metrics(pairlist, stake_currency=stake_currency,
+                                             starting_balance=start_balance,
+                                             results=results, skip_nan=False)
+        report['best_pair'] = max([pair for pair in pair_results if pair['key'] != 'TOTAL'],
+                                  key=lambda x: x['profit_sum']) if len(pair_results) > 1 else None
+        report['worst_pair'] = min([pair for pair in pair_results if pair['key'] != 'TOTAL'],
+                                   key=lambda x: x['profit_sum']) if len(pair_results) > 1 else None
+        report['results_per_pair'] = pair_results
+    if 'enter_tags' in sections:
+        report['results_per_enter_tag'] = generate_tag_metrics(
+            "enter_tag", starting_balance=start_balance, results=results, skip_nan=False)
+    if 'exit_reasons' in sections:
+        report['exit_reason_summary'] = generate_exit_reason_stats(
+            max_open_trades=strat_stats['max_open_trades'], results=results)
+    if 'left_open_trades' in sections:
+        report['left_open_trades'] = generate_pair_metrics(
+            pairlist, stake_currency=stake_currency, starting_balance=start_balance,
+            results=results.loc[results['exit_reason'] == 'force_exit'], skip_nan=True)
+    if 'daily' in sections:
+        report.update(generate_daily_stats(results))
+    if 'sortino' in sections:
+        report['sortino'] = calculate_sortino(results, min_date, max_date, start_balance)
+    if 'sharpe' in sections:
+        report['sharpe'] = calculate_sharpe(results, min_date, max_date, start_balance)
+    if 'calmar' in sections:
+        report['calmar'] = calculate_calmar(results, min_date, max_date, start_balance)
+    return report
+
+
+def complete_strategy_stats(strat_stats: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Generate the report sections missing from lean strategy stats, based on the trades
+    stored in the stats. Accepts trades as generated, or as loaded from a json file.
+    :param strat_stats: Strategy stats, as generated by generate_strategy_stats()
+    :return: Complete strategy stats
+    """
+    missing = [key for keys in REPORT_SECTIONS.values() for key in keys if key not in strat_stats]
+    if not missing or 'trades' not in strat_stats:
+        return strat_stats
+
+    if strat_stats['trades']:
+        results = DataFrame(strat_stats['trades'])
+    else:
+        results = DataFrame(columns=BT_DATA_COLUMNS)
+    for col in ('open_date', 'close_date'):
+        results[col] = to_datetime(results[col], utc=True)
+    min_date = datetime.fromtimestamp(strat_stats['backtest_start_ts'] / 1000, tz=timezone.utc)
+    max_date = datetime.fromtimestamp(strat_stats['backtest_end_ts'] / 1000, tz=timezone.utc)
+    return {**strat_stats,
+            **generate_report_sections(results, strat_stats, min_date, max_date, missing)}
+
+
 def generate_strategy_stats(pairlist: List[str],
                             strategy: str,
                             content: Dict[str, Any],
                             min_date: datetime, max_date: datetime,
                             market_change: float,
                             is_hyperopt: bool = False,
+                            stats: Optional[Collection[str]] = None,
                             ) -> Dict[str, Any]:
     """
     :param pairlist: List of pairs to backtest
@@ -451,6 +538,8 @@ def generate_strategy_stats(pairlist: List[str],
     :param min_date: Backtest start date
     :param max_date: Backtest end date
     :param market_change: float indicating the market change
+    :param stats: Generate lean stats - which only contain these report sections
+        (see REPORT_SECTIONS) in addition to the summary metrics. Generates all sections if None.
     :return: Dictionary containing results per strategy and a strategy summary.
     """
     results: Dict[str, DataFrame] = content['results']
@@ -459,32 +548,13 @@ def generate_strategy_stats(pairlist: List[str],
     config = content['config']
     max_open_trades = min(config['max_open_trades'], len(pairlist))
     start_balance = config['dry_run_wallet']
-    stake_currency = config['stake_currency']
-
-    pair_results = generate_pair_metrics(pairlist, stake_currency=stake_currency,
-                                         starting_balance=start_balance,
-                                         results=results, skip_nan=False)
-
-    enter_tag_results = generate_tag_metrics("enter_tag", starting_balance=start_balance,
-                                             results=results, skip_nan=False)
-
-    exit_reason_stats = generate_exit_reason_stats(max_open_trades=max_open_trades,
-                                                   results=results)
-    left_open_results = generate_pair_metrics(
-        pairlist, stake_currency=stake_currency, starting_balance=start_balance,
-        results=results.loc[results['exit_reason'] == 'force_exit'], skip_nan=True)
 
-    daily_stats = generate_daily_stats(results)
     trade_stats = generate_trading_stats(results)
 
     periodic_breakdown = {}
     if not is_hyperopt:
         periodic_breakdown = {'periodic_breakdown': generate_all_periodic_breakdown_stats(results)}
 
-    best_pair = max([pair for pair in pair_results if pair['key'] != 'TOTAL'],
-                    key=lambda x: x['profit_sum']) if len(pair_results) > 1 else None
-    worst_pair = min([pair for pair in pair_results if pair['key'] != 'TOTAL'],
-                     key=lambda x: x['profit_sum']) if len(pair_results) > 1 else None
     winning_profit = results.loc[results['profit_abs'] > 0, 'profit_abs'].sum()
     losing_profit = results.loc[results['profit_abs'] < 0, 'profit_abs'].sum()
     profit_factor = winning_profit / abs(losing_profit) if losing_profit else 0.0
@@ -493,12 +563,6 @@ def generate_strategy_stats(pairlist: List[str],
     strat_stats = {
         'trades': results.to_dict(orient='records'),
         'locks': [lock.to_json() for lock in content['locks']],
-        'best_pair': best_pair,
-        'worst_pair': worst_pair,
-        'results_per_pair': pair_results,
-        'results_per_enter_tag': enter_tag_results,
-        'exit_reason_summary': exit_reason_stats,
-        'left_open_trades': left_open_results,
 
         'total_trades': len(results),
         'trade_count_long': len(results.loc[~results['is_short']]),
@@ -515,9 +579,6 @@ def generate_strategy_stats(pairlist: List[str],
         'profit_total_short_abs': results.loc[results['is_short'], 'profit_abs'].sum(),
         'cagr': calculate_cagr(backtest_days, start_balance, content['final_balance']),
         'expectancy': calculate_expectancy(results),
-        'sortino': calculate_sortino(results, min_date, max_date, start_balance),
-        'sharpe': calculate_sharpe(results, min_date, max_date, start_balance),
-        'calmar': calculate_calmar(results, min_date, max_date, start_balance),
         'profit_factor': profit_factor,
         'backtest_start': min_date.strftime(DATETIME_PRINT_FORMAT),
         'backtest_start_ts': int(min_date.timestamp() * 1000),
@@ -564,9 +625,9 @@ def generate_strategy_stats(pairlist: List[str],
         'exit_profit_offset': config['exit_profit_offset'],
         'ignore_roi_if_entry_signal': config['ignore_roi_if_entry_signal'],
         **periodic_breakdown,
-        **daily_stats,
         **trade_stats
     }
+    strat_stats.update(generate_report_sections(results, strat_stats, min_date, max_date, stats))
 
     try:
         max_drawdown_legacy, _, _, _, _, _ = calculate_max_drawdown(
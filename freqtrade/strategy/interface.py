@@ -4,10 +4,11 @@ This module defines the interface to apply for strategies
 """
 import logging
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from typing import Dict, List, Optional, Tuple, Union
 
-from pandas import DataFrame
+from pandas import DataFrame, concat
 
 from freqtrade.constants import CUSTOM_TAG_MAX_LENGTH, Config, IntOrInf, ListPairsWithTimeframes
 from freqtrade.data.dataprovider import DataProvider
@@ -86,6 +87,9 @@ class IStrategy(ABC, HyperStrategyMixin):
 
     # run "populate_indicators" only for new candle
     process_only_new_candles: bool = True
+    # Only analyze new candles, together with the `startup_candle_count` candles before them.
+    # Requires indicators which only depend on these candles.
+    incremental_analysis: bool = False
 
     use_exit_signal: bool
     exit_profit_only: bool
@@ -128,6 +132,11 @@ class IStrategy(ABC, HyperStrategyMixin):
         self.config = config
         # Dict to determine if analysis is necessary
         self._last_candle_seen_per_pair: Dict[str, datetime] = {}
+        # Last analyzed dataframe per pair, used for incremental analysis
+        self._incremental_dataframes: Dict[str, DataFrame] = {}
+        # Analyzed dataframes of the parallel analysis, stored once all pairs are analyzed
+        self._analyzed_pending: Optional[Dict[str, Tuple[DataFrame, bool]]] = None
+        self._analyze_executor: Optional[ThreadPoolExecutor] = None
         super().__init__(config)
 
         # Gather informative pairs from @informative-decorated methods.
@@ -195,6 +204,9 @@ class IStrategy(ABC, HyperStrategyMixin):
         Clean up FreqAI and child threads
         """
         self.freqai.shutdown()
+        if self._analyze_executor:
+            self._analyze_executor.shutdown()
+            self._analyze_executor = None
 
     @abstractmethod
     def populate_indicators(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
@@ -835,6 +847,39 @@ class IStrategy(ABC, HyperStrategyMixin):
         dataframe = self.advise_exit(dataframe, metadata)
         return dataframe
 
+    def _analyze_ticker_incremental(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
+        """
+        Analyze the candles which are new since the last analysis of this pair only - together
+        with the `startup_candle_count` candles before them - and append them to the previously
+        analyzed candles.
+        The previously last candle is analyzed again, as it may have been incomplete.
+        Analyzes all candles if the candles don't connect to the previously analyzed candles.
+        :param dataframe: Dataframe containing data from exchange
+        :param metadata: Metadata dictionary with additional data (e.g. 'pair')
+        :return: DataFrame of candle (OHLCV) data with indicator data and signals added
+        """
+        pair = str(metadata.get('pair'))
+        previous = self._incremental_dataframes.get(pair)
+        analyzed = None
+        if previous is not None and not previous.empty:
+            # Candles from the previously last candle on
+            recompute = len(dataframe) - int(
+                dataframe['date'].searchsorted(previous['date'].iloc[-1], side='left'))
+            window = recompute + self.startup_candle_count
+            if (1 < recompute and window < len(dataframe)
+                    and len(previous) + recompute - 1 >= len(dataframe)
+                    and dataframe['date'].iloc[-recompute] == previous['date'].iloc[-1]):
+                logger.debug(f"Analyzing {recompute - 1} new candles for pair {pair}.")
+                new = self.analyze_ticker(dataframe.iloc[-window:].reset_index(drop=True),
+                                          metadata)
+                if list(new.columns) == list(previous.columns):
+                    analyzed = concat([previous.iloc[recompute - 1 - len(dataframe):-1],
+                                       new.iloc[-recompute:]], ignore_index=True)
+        if analyzed is None:
+            analyzed = self.analyze_ticker(dataframe, metadata)
+        self._incremental_dataframes[pair] = analyzed
+        return analyzed
+
     def _analyze_ticker_internal(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
         """
         Parses the given candle (OHLCV) data and returns a populated DataFrame
@@ -852,13 +897,17 @@ class IStrategy(ABC, HyperStrategyMixin):
         if not self.process_only_new_candles or new_candle:
 
             # Defs that only make change on new candle data.
-            dataframe = self.analyze_ticker(dataframe, metadata)
+            if self.incremental_analysis and self.process_only_new_candles:
+                dataframe = self._analyze_ticker_incremental(dataframe, metadata)
+            else:
+                dataframe = self.analyze_ticker(dataframe, metadata)
 
             self._last_candle_seen_per_pair[pair] = dataframe.iloc[-1]['date']
 
-            candle_type = self.config.get('candle_type_def', CandleType.SPOT)
-            self.dp._set_cached_df(pair, self.timeframe, dataframe, candle_type=candle_type)
-            self.dp._emit_df((pair, self.timeframe, candle_type), dataframe, new_candle)
+            if self._analyzed_pending is not None:
+                self._analyzed_pending[pair] = (dataframe, new_candle)
+            else:
+                self._store_analyzed_df(pair, dataframe, new_candle)
 
         else:
             logger.debug("Skipping TA Analysis for already analyzed candle")
@@ -868,6 +917,14 @@ class IStrategy(ABC, HyperStrategyMixin):
 
         return dataframe
 
+    def _store_analyzed_df(self, pair: str, dataframe: DataFrame, new_candle: bool) -> None:
+        """
+        Store the analyzed dataframe into the dataprovider, and send it to RPC.
+        """
+        candle_type = self.config.get('candle_type_def', CandleType.SPOT)
+        self.dp._set_cached_df(pair, self.timeframe, dataframe, candle_type=candle_type)
+        self.dp._emit_df((pair, self.timeframe, candle_type), dataframe, new_candle)
+
     def analyze_pair(self, pair: str) -> None:
         """
         Fetch data for this pair from dataprovider and analyze.
@@ -901,10 +958,34 @@ class IStrategy(ABC, HyperStrategyMixin):
     def analyze(self, pairs: List[str]) -> None:
         """
         Analyze all pairs using analyze_pair().
+        With `analyze_workers` > 1, pairs are analyzed in parallel threads. The analyzed
+        dataframes are stored (and sent to RPC) in the order of `pairs` once all pairs are
+        analyzed.
         :param pairs: List of pairs to analyze
         """
+        # Pairs removed from the whitelist aren't analyzed incrementally anymore.
+        for pair in set(self._incremental_dataframes) - set(pairs):
+            del self._incremental_dataframes[pair]
+
+        workers = self.config.get('analyze_workers', 1)
+        if workers <= 1 or len(pairs) <= 1:
+            for pair in pairs:
+                self.analyze_pair(pair)
+            return
+
+        if not self._analyze_executor:
+            self._analyze_executor = ThreadPoolExecutor(max_workers=workers,
+                                                        thread_name_prefix='analyze')
+        self._analyzed_pending = {}
+        try:
+            # Consume the results to re-raise exceptions of the analysis.
+            list(self._analyze_executor.map(self.analyze_pair, pairs))
+            analyzed = self._analyzed_pending
+        finally:
+            self._analyzed_pending = None
         for pair in pairs:
-            self.analyze_pair(pair)
+            if pair in analyzed:
+                self._store_analyzed_df(pair, *analyzed[pair])
 
     @staticmethod
     def preserve_df(dataframe: DataFrame) -> Tuple[int, float, datetime]:
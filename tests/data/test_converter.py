@@ -5,15 +5,19 @@ from shutil import copyfile
 
 import numpy as np
 import pytest
+from pandas import DataFrame
+from pandas.testing import assert_frame_equal
 
 from freqtrade.configuration.timerange import TimeRange
+from freqtrade.constants import DEFAULT_TRADES_COLUMNS
 from freqtrade.data.converter import (convert_ohlcv_format, convert_trades_format,
                                       ohlcv_fill_up_missing_data, ohlcv_to_dataframe,
-                                      reduce_dataframe_footprint, trades_dict_to_list,
+                                      reduce_dataframe_footprint, trades_chunks_to_ohlcv,
+                                      trades_df_remove_duplicates, trades_dict_to_list,
                                       trades_remove_duplicates, trades_to_ohlcv, trim_dataframe)
 from freqtrade.data.history import (get_timerange, load_data, load_pair_history,
                                     validate_backtest_data)
-from freqtrade.data.history.idatahandler import IDataHandler
+from freqtrade.data.history.idatahandler import IDataHandler, get_datahandler
 from freqtrade.enums import CandleType
 from tests.conftest import generate_test_data, log_has, log_has_re
 from tests.data.test_history import _clean_test_file
@@ -56,6 +60,22 @@ def test_trades_to_ohlcv(ohlcv_history_list, caplog):
     assert df.loc[:, 'low'][0] == 0.00141266
 
 
+def test_trades_chunks_to_ohlcv(testdatadir):
+    with pytest.raises(ValueError, match="Trade-list empty."):
+        trades_chunks_to_ohlcv([], ['1m'])
+
+    dh = get_datahandler(testdatadir, 'feather')
+    trades = dh.trades_load('XRP/ETH')
+    # Chunk borders within a candle are merged
+    chunks = [DataFrame(trades[start:start + 777], columns=DEFAULT_TRADES_COLUMNS)
+              for start in range(0, len(trades), 777)]
+    result = trades_chunks_to_ohlcv(chunks, ['1m', '5m'])
+    assert list(result.keys()) == ['1m', '5m']
+    for timeframe, df in result.items():
+        expected = trades_to_ohlcv(trades, timeframe).reset_index(drop=True)
+        assert_frame_equal(df, expected, check_dtype=False)
+
+
 def test_ohlcv_fill_up_missing_data(testdatadir, caplog):
     data = load_pair_history(datadir=testdatadir,
                              timeframe='1m',
@@ -233,6 +253,13 @@ def test_trim_dataframe(testdatadir) -> None:
     assert len(data_modify) == len(data) - 55
     # first row matches 25th original row
     assert all(data_modify.iloc[0] == data.iloc[25])
+    # Sorted data is trimmed without copying it
+    assert np.shares_memory(trim_dataframe(data, tr)['close'].values, data['close'].values)
+
+    # Unsorted data
+    data_modify = trim_dataframe(data.iloc[::-1], tr)
+    assert len(data_modify) == len(data) - 55
+    assert all(data_modify.iloc[-1] == data.iloc[25])
 
 
 def test_trades_remove_duplicates(trades_history):
@@ -244,6 +271,16 @@ def test_trades_remove_duplicates(trades_history):
         assert t == trades_history[i]
 
 
+def test_trades_df_remove_duplicates(trades_history):
+    trades = trades_history * 3
+    # Trades differing from the preceding trade are kept
+    trades.append(trades_history[-1][:2] + [None, 'buy', 1.0, 1.0, 1.0])
+    expected = trades_remove_duplicates(trades)
+    res = trades_df_remove_duplicates(DataFrame(trades, columns=DEFAULT_TRADES_COLUMNS))
+    assert len(res) == len(trades_history) + 1
+    assert res.values.tolist() == expected
+
+
 def test_trades_dict_to_list(fetch_trades_result):
     res = trades_dict_to_list(fetch_trades_result)
     assert isinstance(res, list)
@@ -9,7 +9,6 @@ import pytest
 from pandas import DataFrame
 
 from freqtrade.configuration import TimeRange
-from freqtrade.constants import AVAILABLE_DATAHANDLERS
 from freqtrade.data.history.featherdatahandler import FeatherDataHandler
 from freqtrade.data.history.hdf5datahandler import HDF5DataHandler
 from freqtrade.data.history.idatahandler import IDataHandler, get_datahandler, get_datahandlerclass
@@ -252,15 +251,6 @@ def test_datahandler__check_empty_df(testdatadir, caplog):
     assert log_has_re(expected_text, caplog)
 
 
-@pytest.mark.parametrize('datahandler', ['parquet'])
-def test_datahandler_trades_not_supported(datahandler, testdatadir, ):
-    dh = get_datahandler(testdatadir, datahandler)
-    with pytest.raises(NotImplementedError):
-        dh.trades_load('UNITTEST/ETH')
-    with pytest.raises(NotImplementedError):
-        dh.trades_store('UNITTEST/ETH', MagicMock())
-
-
 def test_jsondatahandler_trades_load(testdatadir, caplog):
     dh = JsonGzDataHandler(testdatadir)
     logmsg = "Old trades format detected - converting"
@@ -284,7 +274,7 @@ def test_jsondatahandler_trades_purge(mocker, testdatadir):
     assert unlinkmock.call_count == 1
 
 
-@pytest.mark.parametrize('datahandler', AVAILABLE_DATAHANDLERS)
+@pytest.mark.parametrize('datahandler', ['json', 'jsongz', 'hdf5'])
 def test_datahandler_ohlcv_append(datahandler, testdatadir, ):
     dh = get_datahandler(testdatadir, datahandler)
     with pytest.raises(NotImplementedError):
@@ -293,7 +283,7 @@ def test_datahandler_ohlcv_append(datahandler, testdatadir, ):
         dh.ohlcv_append('UNITTEST/ETH', '5m', DataFrame(), CandleType.MARK)
 
 
-@pytest.mark.parametrize('datahandler', AVAILABLE_DATAHANDLERS)
+@pytest.mark.parametrize('datahandler', ['json', 'jsongz', 'hdf5'])
 def test_datahandler_trades_append(datahandler, testdatadir):
     dh = get_datahandler(testdatadir, datahandler)
     with pytest.raises(NotImplementedError):
@@ -482,6 +472,105 @@ def test_generic_datahandler_ohlcv_load_and_resave(
     assert ohlcv.empty
 
 
+@pytest.mark.parametrize('datahandler', ['feather', 'parquet'])
+def test_columnar_datahandler_ohlcv_load_timerange(mocker, testdatadir, tmp_path, datahandler):
+    mocker.patch('freqtrade.data.history.featherdatahandler.FEATHER_CHUNK_SIZE', 500)
+    mocker.patch('freqtrade.data.history.parquetdatahandler.PARQUET_ROW_GROUP_SIZE', 500)
+    # Data goes from 2018-01-10 - 2018-01-30
+    ohlcv = get_datahandler(testdatadir, 'json').ohlcv_load('UNITTEST/BTC', '5m', CandleType.SPOT)
+    dh = get_datahandler(tmp_path, datahandler)
+    dh.ohlcv_store('UNITTEST/BTC', '5m', ohlcv, CandleType.SPOT)
+    assert len(dh._ohlcv_load('UNITTEST/BTC', '5m', None, CandleType.SPOT)) == len(ohlcv)
+
+    timerange = TimeRange.parse_timerange('20180115-20180116')
+    partial = dh._ohlcv_load('UNITTEST/BTC', '5m', timerange, CandleType.SPOT)
+    # Only the batches / row groups containing the timerange are read.
+    assert len(partial) <= 288 + 2 * 500
+    assert partial['date'].min() <= datetime(2018, 1, 15, tzinfo=timezone.utc)
+    assert partial['date'].max() >= datetime(2018, 1, 16, tzinfo=timezone.utc)
+    expected = ohlcv[(ohlcv['date'] >= '2018-01-15') & (ohlcv['date'] <= '2018-01-16')]
+    loaded = dh.ohlcv_load('UNITTEST/BTC', '5m', CandleType.SPOT, timerange=timerange)
+    assert loaded.equals(expected.reset_index(drop=True))
+
+    # Open-ended timeranges
+    timerange = TimeRange.parse_timerange('20180128-')
+    loaded = dh._ohlcv_load('UNITTEST/BTC', '5m', timerange, CandleType.SPOT)
+    assert loaded['date'].iloc[-1] == ohlcv['date'].iloc[-1]
+    assert len(loaded) < 3 * 288 + 500
+    timerange = TimeRange.parse_timerange('-20180111')
+    loaded = dh._ohlcv_load('UNITTEST/BTC', '5m', timerange, CandleType.SPOT)
+    assert loaded['date'].iloc[0] == ohlcv['date'].iloc[0]
+    assert len(loaded) < 2 * 288 + 500
+
+
+def test_parquetdatahandler_ohlcv_load_timerange_ms(testdatadir, tmp_path):
+    ohlcv = get_datahandler(testdatadir, 'json').ohlcv_load('UNITTEST/BTC', '5m', CandleType.SPOT)
+    dh = get_datahandler(tmp_path, 'parquet')
+    # Dates stored as milliseconds
+    stored = ohlcv.copy()
+    stored['date'] = stored['date'].astype('int64') // 1_000_000
+    stored.to_parquet(tmp_path / 'UNITTEST_BTC-5m.parquet', row_group_size=500)
+
+    timerange = TimeRange.parse_timerange('20180115-20180116')
+    loaded = dh._ohlcv_load('UNITTEST/BTC', '5m', timerange, CandleType.SPOT)
+    assert len(loaded) == 289
+    assert loaded['date'].iloc[0] == datetime(2018, 1, 15, tzinfo=timezone.utc)
+
+
+@pytest.mark.parametrize('datahandler', ['feather', 'parquet'])
+def test_columnar_datahandler_ohlcv_append(mocker, testdatadir, tmp_path, datahandler):
+    mocker.patch('freqtrade.data.history.columnardatahandler.MAX_SEGMENTS', 3)
+    ohlcv = get_datahandler(testdatadir, 'json').ohlcv_load('UNITTEST/BTC', '5m', CandleType.SPOT)
+    dh = get_datahandler(tmp_path, datahandler)
+    filename = tmp_path / f'UNITTEST_BTC-5m.{datahandler}'
+    segments_dir = tmp_path / f'UNITTEST_BTC-5m.{datahandler}.segments'
+
+    # Without data, appending stores the data.
+    dh.ohlcv_append('UNITTEST/BTC', '5m', ohlcv.iloc[:1000], CandleType.SPOT)
+    assert filename.is_file()
+    assert not segments_dir.exists()
+    mtime = filename.stat().st_mtime_ns
+
+    dh.ohlcv_append('UNITTEST/BTC', '5m', ohlcv.iloc[1000:2000], CandleType.SPOT)
+    # The last stored candle may be appended again.
+    dh.ohlcv_append('UNITTEST/BTC', '5m', ohlcv.iloc[1999:3000], CandleType.SPOT)
+    dh.ohlcv_append('UNITTEST/BTC', '5m', ohlcv.iloc[:0], CandleType.SPOT)
+    assert filename.stat().st_mtime_ns == mtime
+    assert len(list(segments_dir.iterdir())) == 2
+    assert dh.ohlcv_load('UNITTEST/BTC', '5m', CandleType.SPOT).equals(ohlcv.iloc[:3000])
+
+    # min / max are read without loading the data.
+    load_mock = mocker.spy(dh, '_ohlcv_load')
+    assert dh.ohlcv_data_min_max('UNITTEST/BTC', '5m', CandleType.SPOT) == (
+        ohlcv['date'].iloc[0], ohlcv['date'].iloc[2999])
+    assert load_mock.call_count == 0
+    assert dh.ohlcv_data_min_max('NOPAIR/XXX', '5m', CandleType.SPOT) == (
+        datetime.fromtimestamp(0, tz=timezone.utc), datetime.fromtimestamp(0, tz=timezone.utc))
+
+    # Only the segments covering the timerange are read.
+    timerange = TimeRange.parse_timerange('20180115-20180116')
+    loaded = dh._ohlcv_load('UNITTEST/BTC', '5m', timerange, CandleType.SPOT)
+    assert loaded['date'].iloc[0] >= ohlcv['date'].iloc[1000]
+    assert loaded['date'].iloc[-1] <= ohlcv['date'].iloc[1999]
+    expected = ohlcv[(ohlcv['date'] >= '2018-01-15') & (ohlcv['date'] <= '2018-01-16')]
+    loaded = dh.ohlcv_load('UNITTEST/BTC', '5m', CandleType.SPOT, timerange=timerange)
+    assert loaded.equals(expected.reset_index(drop=True))
+
+    # Segments are merged into the data file.
+    dh.ohlcv_append('UNITTEST/BTC', '5m', ohlcv.iloc[3000:], CandleType.SPOT)
+    assert not segments_dir.exists()
+    assert len(dh._ohlcv_load('UNITTEST/BTC', '5m', None, CandleType.SPOT)) == len(ohlcv)
+    assert dh.ohlcv_load('UNITTEST/BTC', '5m', CandleType.SPOT).equals(ohlcv)
+    assert dh.ohlcv_data_min_max('UNITTEST/BTC', '5m', CandleType.SPOT) == (
+        ohlcv['date'].iloc[0], ohlcv['date'].iloc[-1])
+
+    dh.ohlcv_append('UNITTEST/BTC', '5m', ohlcv.iloc[-1:], CandleType.SPOT)
+    assert segments_dir.is_dir()
+    assert dh.ohlcv_purge('UNITTEST/BTC', '5m', CandleType.SPOT)
+    assert not filename.exists()
+    assert not segments_dir.exists()
+
+
 def test_hdf5datahandler_ohlcv_purge(mocker, testdatadir):
     mocker.patch.object(Path, "exists", MagicMock(return_value=False))
     unlinkmock = mocker.patch.object(Path, "unlink", MagicMock())
@@ -536,6 +625,103 @@ def test_featherdatahandler_trades_store(testdatadir, tmpdir):
     assert trades[-1][6] == trades_new[-1][6]
 
 
+@pytest.mark.parametrize('datahandler', ['feather', 'parquet'])
+def test_columnar_datahandler_trades_load_timerange(mocker, testdatadir, tmp_path, datahandler):
+    mocker.patch('freqtrade.data.history.featherdatahandler.FEATHER_CHUNK_SIZE', 500)
+    mocker.patch('freqtrade.data.history.parquetdatahandler.PARQUET_ROW_GROUP_SIZE', 500)
+    # data goes from 2019-10-11 - 2019-10-13
+    trades = get_datahandler(testdatadir, 'feather').trades_load('XRP/ETH')
+    dh = get_datahandler(tmp_path, datahandler)
+    dh.trades_store('XRP/ETH', trades)
+    assert dh.trades_load('XRP/ETH') == trades
+
+    timerange = TimeRange.parse_timerange('20191011-20191012')
+    expected = [t for t in trades
+                if timerange.startts * 1000 <= t[0] <= timerange.stopts * 1000]
+    assert 0 < len(expected) < len(trades)
+    assert dh.trades_load('XRP/ETH', timerange) == expected
+
+
+@pytest.mark.parametrize('datahandler', ['feather', 'parquet'])
+def test_columnar_datahandler_trades_append(mocker, testdatadir, tmp_path, datahandler):
+    mocker.patch('freqtrade.data.history.columnardatahandler.MAX_SEGMENTS', 3)
+    mocker.patch('freqtrade.data.history.columnardatahandler.TRADES_CHUNK_SIZE', 1000)
+    trades = get_datahandler(testdatadir, 'feather').trades_load('XRP/ETH')
+    dh = get_datahandler(tmp_path, datahandler)
+    filename = tmp_path / f'XRP_ETH-trades.{datahandler}'
+    segments_dir = tmp_path / f'XRP_ETH-trades.{datahandler}.segments'
+
+    dh.trades_append('XRP/ETH', trades[:1000])
+    assert filename.is_file()
+    dh.trades_append('XRP/ETH', trades[1000:2000])
+    dh.trades_append('XRP/ETH', trades[2000:2500])
+    dh.trades_append('XRP/ETH', [])
+    assert len(list(segments_dir.iterdir())) == 2
+    assert dh.trades_load('XRP/ETH') == trades[:2500]
+    timerange = TimeRange('date', None, trades[2100][0] // 1000, 0)
+    assert dh.trades_load('XRP/ETH', timerange) == [
+        t for t in trades[:2500] if t[0] >= timerange.startts * 1000]
+
+    chunks = list(dh.trades_load_chunks('XRP/ETH'))
+    assert len(chunks) == 4
+    assert all(len(chunk) <= 1000 for chunk in chunks)
+    assert sum((chunk.values.tolist() for chunk in chunks), []) == trades[:2500]
+    assert all(chunk['timestamp'].iloc[-1] < next_chunk['timestamp'].iloc[0]
+               for chunk, next_chunk in zip(chunks, chunks[1:]))
+
+    # Segments are merged into the data file
+    dh.trades_append('XRP/ETH', trades[2500:])
+    assert not segments_dir.exists()
+    assert dh.trades_load('XRP/ETH') == trades
+
+    dh.trades_append('XRP/ETH', trades[-1:])
+    assert dh.trades_purge('XRP/ETH')
+    assert not filename.exists()
+    assert not segments_dir.exists()
+
+
+@pytest.mark.parametrize('datahandler', ['feather', 'parquet'])
+def test_columnar_datahandler_trades_load_chunks_duplicates(mocker, testdatadir, tmp_path,
+                                                            datahandler):
+    mocker.patch('freqtrade.data.history.columnardatahandler.TRADES_CHUNK_SIZE', 999)
+    trades = get_datahandler(testdatadir, 'feather').trades_load('XRP/ETH')[:2000]
+    dh = get_datahandler(tmp_path, datahandler)
+    # Duplicates within a chunk, and spanning the chunk boundary - appended trades start at
+    # the last stored timestamp.
+    dh.trades_store('XRP/ETH', trades[:1000] + trades[500:501])
+    dh.trades_append('XRP/ETH', trades[999:])
+    assert len(dh._trades_load('XRP/ETH')) == len(trades) + 2
+
+    chunks = list(dh.trades_load_chunks('XRP/ETH'))
+    assert sum((chunk.values.tolist() for chunk in chunks), []) == trades
+    assert dh.trades_load('XRP/ETH') == trades
+
+
+@pytest.mark.parametrize('datahandler', ['jsongz', 'hdf5', 'feather'])
+def test_datahandler_trades_get_index(testdatadir, tmp_path, datahandler):
+    trades = get_datahandler(testdatadir, 'feather').trades_load('XRP/ETH')
+    dh = get_datahandler(tmp_path, datahandler)
+    assert dh.trades_get_index('XRP/ETH') is None
+
+    dh.trades_store('XRP/ETH', trades[:100])
+    index = dh.trades_get_index('XRP/ETH')
+    assert index['first_timestamp'] == trades[0][0]
+    assert index['first_id'] == trades[0][1]
+    assert index['last_timestamp'] == trades[99][0]
+    assert index['last_id'] == trades[99][1]
+    assert index['count'] == 100
+    index_file = tmp_path / f'XRP_ETH-trades.{dh._get_file_extension()}.index.json'
+    assert index_file.is_file()
+    assert dh.trades_get_index('XRP/ETH') == index
+
+    # Outdated, as the trades were stored without updating the index
+    dh.trades_store('XRP/ETH', trades[:200])
+    assert dh.trades_get_index('XRP/ETH')['count'] == 200
+
+    assert dh.trades_purge('XRP/ETH')
+    assert not index_file.exists()
+
+
 def test_featherdatahandler_trades_purge(mocker, testdatadir):
     mocker.patch.object(Path, "exists", MagicMock(return_value=False))
     unlinkmock = mocker.patch.object(Path, "unlink", MagicMock())
@@ -102,6 +102,24 @@ def test_load_data_startup_candles(mocker, testdatadir) -> None:
     assert ltfmock.call_args_list[0][1]['timerange'].startts == timerange.startts - 20 * 60
 
 
+@pytest.mark.parametrize('data_format', ['json', 'hdf5', 'feather'])
+def test_load_data_workers(testdatadir, tmp_path, data_format) -> None:
+    pairs = ['UNITTEST/BTC', 'ETH/BTC', 'XLM/BTC', 'NOPAIR/BTC', 'TRX/BTC', 'ADA/BTC']
+    data = load_data(testdatadir, '5m', pairs)
+    for pair, pair_data in data.items():
+        get_datahandler(tmp_path, data_format).ohlcv_store(
+            pair, '5m', pair_data, CandleType.SPOT)
+
+    timerange = TimeRange.parse_timerange('20180115-20180120')
+    expected = load_data(tmp_path, '5m', pairs, timerange=timerange, data_format=data_format)
+    result = load_data(tmp_path, '5m', pairs, timerange=timerange, data_format=data_format,
+                       workers=4)
+    assert list(result) == list(expected)
+    assert 'NOPAIR/BTC' not in result
+    for pair in expected:
+        assert_frame_equal(result[pair], expected[pair])
+
+
 @pytest.mark.parametrize('candle_type', ['mark', ''])
 def test_load_data_with_new_pair_1min(ohlcv_history_list, mocker, caplog,
                                       default_conf, tmpdir, candle_type) -> None:
@@ -338,6 +356,36 @@ def test_download_pair_history2(mocker, default_conf, testdatadir) -> None:
     assert json_dump_mock.call_count == 3
 
 
+def test_download_pair_history_append(mocker, default_conf, tmp_path) -> None:
+    ohlcv = [[1509836520000 + idx * 60000, 0.0016, 0.0017, 0.0015, 0.0016, 100 + idx]
+             for idx in range(10)]
+    mocker.patch(f'{EXMS}.get_historic_ohlcv', return_value=ohlcv[:6])
+    exchange = get_patched_exchange(mocker, default_conf)
+    dh = get_datahandler(tmp_path, 'feather')
+    assert _download_pair_history(datadir=tmp_path, exchange=exchange, pair='UNITTEST/BTC',
+                                  timeframe='1m', data_handler=dh, candle_type='spot')
+
+    store_mock = mocker.spy(dh, 'ohlcv_store')
+    append_mock = mocker.spy(dh, 'ohlcv_append')
+    load_mock = mocker.spy(dh, '_ohlcv_load')
+    # Downloads start at the last stored candle.
+    download_mock = mocker.patch(f'{EXMS}.get_historic_ohlcv', return_value=ohlcv[3:])
+    assert _download_pair_history(datadir=tmp_path, exchange=exchange, pair='UNITTEST/BTC',
+                                  timeframe='1m', data_handler=dh, candle_type='spot')
+    assert download_mock.call_args[1]['since_ms'] == ohlcv[4][0]
+    # Only the last stored candle is loaded.
+    assert load_mock.call_count == 1
+    assert load_mock.call_args[1]['timerange'].startts * 1000 == ohlcv[4][0]
+    assert store_mock.call_count == 0
+    assert append_mock.call_count == 1
+    # Only the new candles (and the last stored candle) are appended.
+    assert len(append_mock.call_args[0][2]) == 5
+
+    data = dh.ohlcv_load('UNITTEST/BTC', '1m', candle_type='spot')
+    assert_frame_equal(data, ohlcv_to_dataframe(ohlcv, '1m', 'UNITTEST/BTC',
+                                                fill_missing=False, drop_incomplete=True))
+
+
 def test_download_backtesting_data_exception(mocker, caplog, default_conf, tmpdir) -> None:
     mocker.patch(f'{EXMS}.get_historic_ohlcv',
                  side_effect=Exception('File Error'))
@@ -523,6 +571,44 @@ def test_refresh_backtest_ohlcv_data(
     assert log_has("Downloading pair ETH/BTC, interval 1m.", caplog)
 
 
+@pytest.mark.parametrize('trademode,callcount', [
+    ('spot', 4),
+    ('margin', 4),
+    ('futures', 8),
+])
+def test_refresh_backtest_ohlcv_data_download_jobs(
+        mocker, default_conf, markets, caplog, tmp_path, trademode, callcount):
+    async def get_historic_ohlcv(pair, timeframe, since_ms, candle_type, **kwargs):
+        if pair == 'XRP/BTC' and timeframe == '5m':
+            raise ValueError('Exchange error')
+        ohlcv = [[since_ms + idx * timeframe_to_minutes(timeframe) * 60000, 1, 2, 0.5, 1.5, 100]
+                 for idx in range(5)]
+        return pair, timeframe, candle_type, ohlcv, True
+
+    mocker.patch(f'{EXMS}.markets', PropertyMock(return_value=markets))
+    ex = get_patched_exchange(mocker, default_conf)
+    dl_mock = mocker.patch.object(ex, '_async_get_historic_ohlcv',
+                                  side_effect=get_historic_ohlcv)
+    timerange = TimeRange.parse_timerange("20190101-")
+    unav_pairs = refresh_backtest_ohlcv_data(
+        exchange=ex, pairs=["ETH/BTC", "XRP/BTC", "NOPAIR/BTC"], timeframes=["1m", "5m"],
+        datadir=tmp_path, timerange=timerange, trading_mode=trademode, data_format='feather',
+        download_jobs=3)
+
+    assert unav_pairs == ['NOPAIR/BTC']
+    assert dl_mock.call_count == callcount
+    assert log_has("Downloading pair ETH/BTC, interval 1m.", caplog)
+    assert log_has('Failed to download history data for pair: "XRP/BTC", timeframe: 5m.', caplog)
+    candle_type = CandleType.get_default(trademode)
+    dh = get_datahandler(tmp_path, 'feather')
+    for pair, timeframe in [('ETH/BTC', '1m'), ('ETH/BTC', '5m'), ('XRP/BTC', '1m')]:
+        data = dh.ohlcv_load(pair, timeframe, candle_type=candle_type)
+        # The last (incomplete) candle is dropped
+        assert len(data) == 4
+        assert data['date'].iloc[0] == timerange.startdt
+    assert dh.ohlcv_load('XRP/BTC', '5m', candle_type=candle_type).empty
+
+
 def test_download_data_no_markets(mocker, default_conf, caplog, testdatadir):
     dl_mock = mocker.patch('freqtrade.data.history.history_utils._download_pair_history',
                            MagicMock())
@@ -622,6 +708,63 @@ def test_download_trades_history(trades_history, mocker, default_conf, testdatad
     _clean_test_file(file2)
 
 
+def test_download_trades_history_append(trades_history, mocker, default_conf, tmp_path,
+                                        caplog) -> None:
+    new_trades = [[1565798399972, '1261aa81334', None, 'buy', 0.019627, 0.1, 0.0019627],
+                  [1565798400012, '1261aa81335', None, 'sell', 0.019626, 0.2, 0.0039252]]
+    ght_mock = MagicMock(return_value=('ETH/BTC', trades_history[:3]))
+    mocker.patch(f'{EXMS}.get_historic_trades', ght_mock)
+    exchange = get_patched_exchange(mocker, default_conf)
+    data_handler = get_datahandler(tmp_path, data_format='feather')
+    timerange = TimeRange('date', None, trades_history[0][0] // 1000 + 1, 0)
+
+    assert _download_trades_history(data_handler=data_handler, exchange=exchange,
+                                    pair='ETH/BTC', timerange=timerange)
+    assert log_has("New Amount of trades: 3", caplog)
+    assert (tmp_path / 'ETH_BTC-trades.feather.index.json').is_file()
+
+    # Overlaps with the stored trades
+    ght_mock.return_value = ('ETH/BTC', trades_history[1:] + new_trades)
+    load_mock = mocker.spy(data_handler, 'trades_load')
+    append_mock = mocker.spy(data_handler, 'trades_append')
+    assert _download_trades_history(data_handler=data_handler, exchange=exchange,
+                                    pair='ETH/BTC', timerange=timerange)
+    assert ght_mock.call_args[1]['from_id'] == trades_history[2][1]
+    assert ght_mock.call_args[1]['since'] == trades_history[2][0] - 5000
+    # Only the overlapping trades are loaded
+    assert load_mock.call_count == 1
+    assert load_mock.call_args[1]['timerange'].startts == (trades_history[2][0] - 5000) // 1000
+    assert append_mock.call_count == 1
+    assert append_mock.call_args[0][1] == trades_history[3:] + new_trades
+    assert log_has("New Amount of trades: 7", caplog)
+    assert data_handler.trades_load('ETH/BTC') == trades_history + new_trades
+
+    index = data_handler.trades_get_index('ETH/BTC')
+    assert index['first_id'] == trades_history[0][1]
+    assert index['last_timestamp'] == new_trades[-1][0]
+    assert index['last_id'] == new_trades[-1][1]
+    assert index['count'] == 7
+
+    # Nothing new
+    append_mock.reset_mock()
+    assert _download_trades_history(data_handler=data_handler, exchange=exchange,
+                                    pair='ETH/BTC', timerange=timerange)
+    assert append_mock.call_count == 0
+    assert data_handler.trades_get_index('ETH/BTC')['count'] == 7
+
+    # Trades with NaN fields aren't appended again
+    nan_trade = [1565798400013, '1261aa81336', None, 'buy', 0.019626, 0.2, float('nan')]
+    ght_mock.return_value = ('ETH/BTC', new_trades + [nan_trade])
+    assert _download_trades_history(data_handler=data_handler, exchange=exchange,
+                                    pair='ETH/BTC', timerange=timerange)
+    assert append_mock.call_count == 1
+    assert data_handler.trades_get_index('ETH/BTC')['count'] == 8
+    assert _download_trades_history(data_handler=data_handler, exchange=exchange,
+                                    pair='ETH/BTC', timerange=timerange)
+    assert append_mock.call_count == 1
+    assert data_handler.trades_get_index('ETH/BTC')['count'] == 8
+
+
 def test_convert_trades_to_ohlcv(testdatadir, tmpdir, caplog):
     tmpdir1 = Path(tmpdir)
     pair = 'XRP/ETH'
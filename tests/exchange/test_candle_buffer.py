@@ -0,0 +1,91 @@
+import numpy as np
+import pytest
+from pandas import concat
+from pandas.testing import assert_frame_equal
+
+from freqtrade.data.converter import clean_ohlcv_dataframe, ohlcv_to_dataframe
+from freqtrade.exchange.candle_buffer import CandleBuffer
+from tests.conftest import generate_test_data_raw
+
+
+def test_candle_buffer_merge():
+    ohlcv = generate_test_data_raw('5m', 300, '2021-08-01')
+    capacity = 50
+    buffer = CandleBuffer('5m', capacity)
+    assert len(buffer) == 0
+    assert buffer.last_date_ms is None
+    assert buffer.merge(ohlcv_to_dataframe([], '5m', 'ETH/BTC'))
+    assert buffer.dataframe().empty
+
+    expected = ohlcv_to_dataframe(ohlcv[:30], '5m', 'ETH/BTC', drop_incomplete=False)
+    assert buffer.merge(expected)
+    assert_frame_equal(buffer.dataframe(), expected)
+    assert buffer.last_date_ms == ohlcv[29][0]
+
+    # Overlapping candles (with an updated last candle), and a gap to fill up
+    end = 30
+    for start, stop in [(25, 40), (38, 39), (45, 60), (58, 120), (119, 125), (150, 300)]:
+        candles = [list(candle) for candle in ohlcv[start:stop]]
+        candles[0][4] = candles[0][4] * 1.01
+        candles[0][5] = candles[0][5] * 2
+        new = ohlcv_to_dataframe(candles, '5m', 'ETH/BTC', drop_incomplete=False)
+        assert buffer.merge(new)
+        expected = clean_ohlcv_dataframe(concat([expected, new], axis=0), '5m', 'ETH/BTC',
+                                         fill_missing=True, drop_incomplete=False)
+        expected = expected.tail(capacity).reset_index(drop=True)
+        end = max(end, stop)
+        assert_frame_equal(buffer.dataframe(), expected)
+        assert len(buffer) == min(capacity, end)
+
+    # Candles before the buffered candles can't be merged
+    assert not buffer.merge(ohlcv_to_dataframe(ohlcv[:10], '5m', 'ETH/BTC'))
+    assert_frame_equal(buffer.dataframe(), expected)
+
+
+def test_candle_buffer_dataframe(mocker):
+    ohlcv = generate_test_data_raw('1h', 201, '2021-08-01')
+    buffer = CandleBuffer('1h', 100)
+    buffer.merge(ohlcv_to_dataframe(ohlcv[:100], '1h', 'ETH/BTC', drop_incomplete=False))
+    allocate = mocker.spy(buffer, '_allocate')
+    df = buffer.dataframe()
+    # Read-only view on the buffer, built once while the candles are unchanged
+    assert np.shares_memory(df['close'].values, buffer._values['close'])
+    assert np.shares_memory(df['date'].values.view('int64'), buffer._dates)
+    assert not df['close'].values.flags.writeable
+    with pytest.raises(ValueError):
+        df.loc[0, 'close'] = 1.0
+    assert buffer.dataframe() is df
+    # Merging unchanged candles keeps the DataFrame
+    buffer.merge(ohlcv_to_dataframe(ohlcv[98:100], '1h', 'ETH/BTC', drop_incomplete=False))
+    assert buffer.dataframe() is df
+    assert allocate.call_count == 0
+
+    # Updating a candle handed out copies the candles once, prior DataFrames don't change
+    candles = [list(candle) for candle in ohlcv[99:100]]
+    candles[0][4] = candles[0][4] * 1.01
+    buffer.merge(ohlcv_to_dataframe(candles, '1h', 'ETH/BTC', drop_incomplete=False))
+    assert allocate.call_count == 1
+    assert df.iloc[-1]['close'] == ohlcv[99][4]
+    # Candles not handed out yet are updated in place
+    candles[0][4] = candles[0][4] * 1.01
+    buffer.merge(ohlcv_to_dataframe(candles, '1h', 'ETH/BTC', drop_incomplete=False))
+    assert allocate.call_count == 1
+    df1 = buffer.dataframe()
+    assert df1.iloc[-1]['close'] == candles[0][4]
+    assert not np.shares_memory(df1['close'].values, df['close'].values)
+
+    # New candles are written behind the buffered candles, without copying
+    dates = buffer._dates
+    for i in range(100, 201):
+        buffer.merge(ohlcv_to_dataframe(ohlcv[i:i + 1], '1h', 'ETH/BTC',
+                                        drop_incomplete=False))
+        new_df = buffer.dataframe()
+        assert len(buffer) == len(new_df) == 100
+        assert np.shares_memory(new_df['close'].values, buffer._values['close'])
+        # Arrays are reallocated once per capacity candles
+        assert (buffer._dates is dates) == (i < 200)
+    assert allocate.call_count == 2
+    assert df.iloc[0]['date'].timestamp() * 1000 == ohlcv[0][0]
+    assert df.iloc[-1]['close'] == ohlcv[99][4]
+    assert df1.iloc[-1]['close'] == candles[0][4]
+    assert new_df.iloc[-1]['close'] == ohlcv[200][4]
@@ -0,0 +1,199 @@
+import asyncio
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List
+
+from freqtrade.enums import CandleType, RunMode
+from freqtrade.exchange.exchange_ws import ExchangeWS
+from tests.conftest import (EXMS, generate_test_data_raw, get_mock_coro, get_patched_exchange,
+                            log_has, log_has_re)
+
+
+class CandleStandIn:
+    """
+    Stand-in for a ccxt.pro exchange - candle updates are pushed by the test.
+    """
+    has = {'watchOHLCV': True}
+
+    def __init__(self) -> None:
+        self.queues: Dict[str, asyncio.Queue] = {}
+        self.ohlcvs: Dict[str, List[List]] = {}
+        self.watching: List[str] = []
+        self.unwatched: List[str] = []
+        self.closed = False
+
+    async def watch_ohlcv(self, pair, timeframe):
+        if pair not in self.queues:
+            self.queues[pair] = asyncio.Queue()
+        self.watching.append(pair)
+        try:
+            update = await self.queues[pair].get()
+        finally:
+            self.watching.remove(pair)
+        if isinstance(update, Exception):
+            raise update
+        stored = self.ohlcvs.setdefault(pair, [])
+        if stored and stored[-1][0] == update[0]:
+            stored[-1] = update
+        else:
+            stored.append(update)
+        return stored
+
+    async def un_watch_ohlcv(self, pair, timeframe):
+        self.unwatched.append(pair)
+
+    async def close(self):
+        self.closed = True
+
+
+def wait_for(condition) -> None:
+    for _ in range(200):
+        if condition():
+            return
+        time.sleep(0.01)
+    raise TimeoutError()
+
+
+def push(exchange_ws: ExchangeWS, pair: str, update) -> None:
+    stand_in = exchange_ws.ccxt_object
+    wait_for(lambda: pair in stand_in.queues)
+    exchange_ws._loop.call_soon_threadsafe(stand_in.queues[pair].put_nowait, update)
+
+
+def test_exchange_ws_ohlcv(time_machine, caplog):
+    start = datetime(2021, 8, 1, 0, 0, 0, 0, tzinfo=timezone.utc)
+    ohlcv = generate_test_data_raw('1h', 102, start.strftime('%Y-%m-%d'))
+    time_machine.move_to(start + timedelta(hours=99, minutes=30))
+    paircomb = ('ETH/BTC', '1h', CandleType.SPOT)
+    exchange_ws = ExchangeWS(CandleStandIn())
+
+    assert exchange_ws.ohlcv(*paircomb, ohlcv[98][0]) is None
+    exchange_ws.schedule_ohlcv(*paircomb)
+    push(exchange_ws, 'ETH/BTC', ohlcv[99])
+    wait_for(lambda: paircomb in exchange_ws._klines)
+    assert exchange_ws.ohlcv(*paircomb, ohlcv[98][0]) == [ohlcv[99]]
+    # Gap to the last known candle
+    assert exchange_ws.ohlcv(*paircomb, ohlcv[97][0]) is None
+
+    # No update since the next candle opened
+    time_machine.move_to(start + timedelta(hours=100, minutes=1))
+    assert exchange_ws.ohlcv(*paircomb, ohlcv[99][0]) is None
+    push(exchange_ws, 'ETH/BTC', ohlcv[100])
+    wait_for(lambda: len(exchange_ws._klines[paircomb][1]) == 2)
+    assert exchange_ws.ohlcv(*paircomb, ohlcv[98][0]) == [ohlcv[99], ohlcv[100]]
+    assert exchange_ws.ohlcv(*paircomb, ohlcv[99][0]) == [ohlcv[99], ohlcv[100]]
+
+    # Failure stops watching, until scheduled again
+    push(exchange_ws, 'ETH/BTC', ValueError('Connection lost'))
+    wait_for(lambda: paircomb not in exchange_ws._klines_watching)
+    assert log_has('Watching candles of ETH/BTC, 1h failed: Connection lost', caplog)
+    assert exchange_ws.ohlcv(*paircomb, ohlcv[99][0]) is None
+
+    exchange_ws.schedule_ohlcv(*paircomb)
+    assert paircomb in exchange_ws._klines_watching
+    time_machine.move_to(start + timedelta(hours=104))
+    exchange_ws.cleanup_expired()
+    assert paircomb not in exchange_ws._klines_watching
+
+    exchange_ws.cleanup()
+    assert exchange_ws.ccxt_object.closed
+    assert not exchange_ws._thread.is_alive()
+
+
+def test_exchange_ws_cleanup_expired(time_machine):
+    start = datetime(2021, 8, 1, 0, 0, 0, 0, tzinfo=timezone.utc)
+    ohlcv = generate_test_data_raw('1h', 110, start.strftime('%Y-%m-%d'))
+    time_machine.move_to(start + timedelta(hours=99, minutes=30))
+    paircomb = ('ETH/BTC', '1h', CandleType.SPOT)
+    exchange_ws = ExchangeWS(CandleStandIn())
+    exchange_ws.ccxt_object.has = {'watchOHLCV': True, 'unWatchOHLCV': True}
+
+    exchange_ws.schedule_ohlcv(*paircomb)
+    push(exchange_ws, 'ETH/BTC', ohlcv[99])
+    wait_for(lambda: paircomb in exchange_ws._klines)
+    watcher = exchange_ws._klines_watching[paircomb]
+
+    # Expired watchers are cancelled and unsubscribed.
+    time_machine.move_to(start + timedelta(hours=104))
+    exchange_ws.cleanup_expired()
+    assert paircomb not in exchange_ws._klines_watching
+    assert paircomb not in exchange_ws._klines
+    wait_for(lambda: watcher.done() and exchange_ws.ccxt_object.unwatched == ['ETH/BTC'])
+    assert watcher.cancelled()
+
+    # A new watcher isn't removed by the old one, and is the only one watching.
+    exchange_ws.schedule_ohlcv(*paircomb)
+    new_watcher = exchange_ws._klines_watching[paircomb]
+    assert new_watcher is not watcher
+    wait_for(lambda: exchange_ws.ccxt_object.watching == ['ETH/BTC'])
+    exchange_ws._watch_done(paircomb, watcher)
+    assert exchange_ws._klines_watching[paircomb] is new_watcher
+    push(exchange_ws, 'ETH/BTC', ohlcv[104])
+    wait_for(lambda: paircomb in exchange_ws._klines)
+    assert exchange_ws.ohlcv(*paircomb, ohlcv[103][0]) == [ohlcv[104]]
+
+    exchange_ws.cleanup()
+    assert new_watcher.cancelled()
+
+
+def test_refresh_latest_ohlcv_ws(mocker, default_conf, time_machine) -> None:
+    start = datetime(2021, 8, 1, 0, 0, 0, 0, tzinfo=timezone.utc)
+    ohlcv = generate_test_data_raw('1h', 102, start.strftime('%Y-%m-%d'))
+    time_machine.move_to(start + timedelta(hours=99, minutes=30))
+
+    exchange = get_patched_exchange(mocker, default_conf)
+    mocker.patch(f"{EXMS}.ohlcv_candle_limit", return_value=100)
+    exchange._exchange_ws = ExchangeWS(CandleStandIn())
+    exchange._api_async.fetch_ohlcv = get_mock_coro(ohlcv[:100])
+    pair = ('ETH/BTC', '1h', CandleType.SPOT)
+
+    # Initial candles via REST
+    res = exchange.refresh_latest_ohlcv([pair])
+    assert exchange._api_async.fetch_ohlcv.call_count == 1
+    assert len(res[pair]) == 99
+    assert pair in exchange._exchange_ws._klines_watching
+    push(exchange._exchange_ws, 'ETH/BTC', ohlcv[99])
+    wait_for(lambda: pair in exchange._exchange_ws._klines)
+
+    # New candle - via websocket
+    exchange._api_async.fetch_ohlcv.reset_mock()
+    time_machine.move_to(start + timedelta(hours=100, minutes=5))
+    push(exchange._exchange_ws, 'ETH/BTC', ohlcv[100])
+    wait_for(lambda: len(exchange._exchange_ws._klines[pair][1]) == 2)
+    res = exchange.refresh_latest_ohlcv([pair])
+    assert exchange._api_async.fetch_ohlcv.call_count == 0
+    assert len(res[pair]) == 100
+    assert res[pair].iloc[-1]['close'] == ohlcv[99][4]
+    assert exchange._pairs_last_refresh_time[pair] == ohlcv[99][0] // 1000
+
+    # Websocket updates missing - REST fallback
+    time_machine.move_to(start + timedelta(hours=101, minutes=5))
+    exchange._api_async.fetch_ohlcv = get_mock_coro(ohlcv[2:102])
+    res = exchange.refresh_latest_ohlcv([pair])
+    assert exchange._api_async.fetch_ohlcv.call_count == 1
+    assert len(res[pair]) == 100
+    assert res[pair].iloc[-1]['date'].timestamp() * 1000 == ohlcv[100][0]
+    assert exchange._pairs_last_refresh_time[pair] == ohlcv[100][0] // 1000
+
+    exchange_ws = exchange._exchange_ws
+    exchange.close()
+    assert exchange_ws.ccxt_object.closed
+    assert exchange._exchange_ws is None
+
+
+def test_init_exchange_ws(mocker, default_conf, caplog) -> None:
+    default_conf['exchange']['enable_ws'] = True
+    default_conf['runmode'] = RunMode.BACKTEST
+    exchange = get_patched_exchange(mocker, default_conf)
+    assert exchange._exchange_ws is None
+
+    default_conf['runmode'] = RunMode.DRY_RUN
+    exchange = get_patched_exchange(mocker, default_conf)
+    assert exchange._exchange_ws is not None
+    assert log_has('Using websocket candle (OHLCV) updates.', caplog)
+    exchange.close()
+
+    exchange._init_ccxt = mocker.Mock(return_value=mocker.Mock(has={'watchOHLCV': False}))
+    exchange._init_exchange_ws(default_conf['exchange'], {})
+    assert exchange._exchange_ws is None
+    assert log_has_re(r'Websocket candle updates are not supported for .*', caplog)
@@ -2,6 +2,7 @@
 import logging
 from unittest.mock import MagicMock
 
+import pandas as pd
 import pytest
 
 from freqtrade.data.history import get_timerange
@@ -899,11 +900,7 @@ TESTS = [
 ]
 
 
-@pytest.mark.parametrize("data", TESTS)
-def test_backtest_results(default_conf, fee, mocker, caplog, data: BTContainer) -> None:
-    """
-    run functional tests
-    """
+def _get_backtesting(default_conf, mocker, data: BTContainer):
     default_conf["stoploss"] = data.stop_loss
     default_conf["minimal_roi"] = data.roi
     default_conf["timeframe"] = tests_timeframe
@@ -944,6 +941,15 @@ def test_backtest_results(default_conf, fee, mocker, caplog, data: BTContainer)
 
     backtesting.strategy.use_custom_stoploss = data.use_custom_stoploss
     backtesting.strategy.leverage = lambda **kwargs: data.leverage
+    return backtesting, frame
+
+
+@pytest.mark.parametrize("data", TESTS)
+def test_backtest_results(default_conf, fee, mocker, caplog, data: BTContainer) -> None:
+    """
+    run functional tests
+    """
+    backtesting, frame = _get_backtesting(default_conf, mocker, data)
     caplog.set_level(logging.DEBUG)
 
     pair = "UNITTEST/BTC"
@@ -971,3 +977,25 @@ def test_backtest_results(default_conf, fee, mocker, caplog, data: BTContainer)
     assert len(LocalTrade.trades_open) == 0
     backtesting.cleanup()
     del backtesting
+
+
+@pytest.mark.parametrize("data", TESTS)
+def test_backtest_results_vectorized(default_conf, mocker, data: BTContainer) -> None:
+    """
+    The vectorized engine must produce the same trades as the loop engine.
+    """
+    backtesting, frame = _get_backtesting(default_conf, mocker, data)
+    assert backtesting.vectorized_backtest_supported() is not data.use_custom_stoploss
+    min_date, max_date = get_timerange({"UNITTEST/BTC": frame})
+
+    results = {}
+    for vectorized in (False, True):
+        mocker.patch.object(backtesting, 'vectorized_backtest_supported', return_value=vectorized)
+        results[vectorized] = backtesting.backtest(
+            processed={"UNITTEST/BTC": frame.copy()},
+            start_date=min_date,
+            end_date=max_date,
+        )
+    pd.testing.assert_frame_equal(results[False]['results'], results[True]['results'])
+    assert results[False]['final_balance'] == results[True]['final_balance']
+    backtesting.cleanup()
@@ -9,6 +9,7 @@ from unittest.mock import MagicMock, PropertyMock
 import numpy as np
 import pandas as pd
 import pytest
+from joblib import dump
 
 from freqtrade import constants
 from freqtrade.commands.optimize_commands import setup_optimize_configuration, start_backtesting
@@ -18,16 +19,24 @@ from freqtrade.data.btanalysis import BT_DATA_COLUMNS, evaluate_result_multi
 from freqtrade.data.converter import clean_ohlcv_dataframe
 from freqtrade.data.dataprovider import DataProvider
 from freqtrade.data.history import get_timerange
-from freqtrade.enums import CandleType, ExitType, RunMode
+from freqtrade.enums import CandleType, ExitType, RunMode, TradingMode
 from freqtrade.exceptions import DependencyException, OperationalException
 from freqtrade.exchange.exchange import timeframe_to_next_date
+from freqtrade.optimize import backtest_candles
 from freqtrade.optimize.backtest_caching import get_strategy_run_id
+from freqtrade.optimize.backtest_candles import (DATE_IDX, ENTER_TAG_IDX, EXIT_TAG_IDX, HEADERS,
+                                                 LONG_IDX, OPEN_IDX, DetailCandles, PairCandles,
+                                                 price_cache)
+from freqtrade.optimize.backtest_parallel import shared_wallet_allows
+from freqtrade.optimize.backtest_vectorized import get_processing_steps
 from freqtrade.optimize.backtesting import Backtesting
+from freqtrade.optimize.indicator_cache import IndicatorCache
 from freqtrade.persistence import LocalTrade, Trade
 from freqtrade.resolvers import StrategyResolver
 from freqtrade.util.datetime_helpers import dt_utc
-from tests.conftest import (CURRENT_TEST_STRATEGY, EXMS, get_args, log_has, log_has_re,
-                            patch_exchange, patched_configuration_load_config_file)
+from tests.conftest import (CURRENT_TEST_STRATEGY, EXMS, generate_test_data, get_args, get_markets,
+                            log_has, log_has_re, patch_exchange,
+                            patched_configuration_load_config_file)
 
 
 ORDER_TYPES = [
@@ -1368,6 +1377,102 @@ def test_backtest_multi_pair(default_conf, fee, mocker, tres, pair, testdatadir)
     assert len(evaluate_result_multi(results['results'], '5m', 1)) == 0
 
 
+@pytest.mark.parametrize('max_open_trades,trailing,use_exit_signal,protections', [
+    (3, False, True, False),
+    (1, False, True, True),
+    (-1, True, False, False),
+    (2, True, True, True),
+])
+def test_backtest_vectorized_multi_pair(default_conf, fee, mocker, testdatadir, max_open_trades,
+                                        trailing, use_exit_signal, protections):
+
+    def _random_signals(dataframe=None, metadata=None):
+        rng = np.random.default_rng(len(metadata['pair']) + len(dataframe))
+        dataframe['enter_long'] = (rng.random(len(dataframe)) > 0.9).astype(int)
+        dataframe['exit_long'] = (rng.random(len(dataframe)) > 0.95).astype(int)
+        dataframe['enter_short'] = 0
+        dataframe['exit_short'] = 0
+        dataframe['enter_tag'] = np.where(dataframe['enter_long'] == 1, metadata['pair'], None)
+        return dataframe
+
+    mocker.patch(f"{EXMS}.get_min_pair_stake_amount", return_value=0.00001)
+    mocker.patch(f"{EXMS}.get_max_pair_stake_amount", return_value=float('inf'))
+    mocker.patch(f'{EXMS}.get_fee', fee)
+    patch_exchange(mocker)
+
+    pairs = ['ADA/BTC', 'DASH/BTC', 'ETH/BTC', 'LTC/BTC', 'NXT/BTC']
+    data = history.load_data(datadir=testdatadir, timeframe='5m', pairs=pairs)
+    data = trim_dictlist(data, -1000)
+    # Missing start for one pair
+    data['LTC/BTC'] = data['LTC/BTC'][50:].reset_index(drop=True)
+    default_conf.update({
+        'timeframe': '5m',
+        'max_open_trades': max_open_trades,
+        'stake_amount': 'unlimited' if max_open_trades > 0 else 0.001,
+        'minimal_roi': {'0': 0.03, '30': 0.01, '90': 0},
+        'stoploss': -0.02,
+        'trailing_stop': trailing,
+        'trailing_stop_positive': 0.005,
+        'trailing_stop_positive_offset': 0.01,
+        'use_exit_signal': use_exit_signal,
+    })
+    if protections:
+        default_conf['protections'] = [{"method": "CooldownPeriod", "stop_duration": 30}]
+        default_conf['enable_protections'] = True
+
+    backtesting = Backtesting(default_conf)
+    backtesting._set_strategy(backtesting.strategylist[0])
+    backtesting.strategy.advise_entry = _random_signals
+    backtesting.strategy.advise_exit = _random_signals
+    assert backtesting.vectorized_backtest_supported()
+
+    processed = backtesting.strategy.advise_all_indicators(data)
+    min_date, max_date = get_timerange(processed)
+    results = {}
+    for vectorized in (False, True):
+        mocker.patch.object(backtesting, 'vectorized_backtest_supported', return_value=vectorized)
+        results[vectorized] = backtesting.backtest(
+            processed=deepcopy(processed), start_date=min_date, end_date=max_date)
+
+    assert len(results[True]['results']) > 10
+    pd.testing.assert_frame_equal(results[False]['results'], results[True]['results'])
+    for key in ('rejected_signals', 'final_balance'):
+        assert results[False][key] == results[True][key]
+    assert ([lock.to_json() for lock in results[False]['locks']] ==
+            [lock.to_json() for lock in results[True]['locks']])
+
+
+def test_backtest_vectorized_supported(default_conf, mocker) -> None:
+    patch_exchange(mocker)
+    backtesting = Backtesting(default_conf)
+    backtesting._set_strategy(backtesting.strategylist[0])
+    assert backtesting.vectorized_backtest_supported()
+
+    backtesting.strategy.position_adjustment_enable = True
+    assert not backtesting.vectorized_backtest_supported()
+    backtesting.strategy.position_adjustment_enable = False
+
+    backtesting.strategy.custom_exit = MagicMock()
+    assert not backtesting.vectorized_backtest_supported()
+    del backtesting.strategy.custom_exit
+    assert backtesting.vectorized_backtest_supported()
+
+    backtesting.timeframe_detail = '1m'
+    assert not backtesting.vectorized_backtest_supported()
+
+
+def test_get_processing_steps() -> None:
+    tf = 300 * 10**9
+    start = 1_000 * tf
+    dates = np.array([1001, 1002, 1005, 1006, 1006, 1007], dtype=np.int64) * tf
+    # Duplicate dates are processed one candle later - as in the loop engine.
+    assert get_processing_steps(dates, start, tf).tolist() == [1, 2, 5, 6, 7, 8]
+    # Data starting before start_date + timeframe
+    dates = np.array([999, 1000, 1001, 1003], dtype=np.int64) * tf
+    assert get_processing_steps(dates, start, tf).tolist() == [1, 2, 3, 4]
+    assert get_processing_steps(np.array([], dtype=np.int64), start, tf).tolist() == []
+
+
 def test_backtest_start_timerange(default_conf, mocker, caplog, testdatadir):
 
     patch_exchange(mocker)
@@ -1993,3 +2098,472 @@ def test_get_strategy_run_id(default_conf_usdt):
     strategy = StrategyResolver.load_strategy(default_conf_usdt)
     x = get_strategy_run_id(strategy)
     assert isinstance(x, str)
+
+    strategy.config['timerange'] = '20220101-'
+    assert get_strategy_run_id(strategy) != x
+    assert get_strategy_run_id(strategy, ignored_keys=('timerange', )) == x
+
+
+def test_pair_candles_from_dataframe() -> None:
+    df = pd.DataFrame({
+        'date': pd.date_range('2022-01-01', periods=4, freq='5min', tz='UTC'),
+        'open': [1.0, 2.0, 3.0, 4.0],
+        'high': [1.5, 2.5, 3.5, 4.5],
+        'low': [0.5, 1.5, 2.5, 3.5],
+        'close': [1.2, 2.2, 3.2, 4.2],
+        'volume': [10.0, 10.0, 10.0, 10.0],
+        'enter_long': [1, np.nan, 1, 1],
+        'exit_long': [np.nan, 1, np.nan, np.nan],
+        'enter_tag': ['tag1', np.nan, 'tag3', 'tag4'],
+    })
+    candles = PairCandles.from_dataframe(df)
+    assert len(candles) == 3
+    # Prices remain on their candle, signals / tags are shifted by one candle
+    assert candles.open.tolist() == [2.0, 3.0, 4.0]
+    assert candles.enter_long.tolist() == [1.0, 0.0, 1.0]
+    assert candles.exit_long.tolist() == [0.0, 1.0, 0.0]
+    assert candles.enter_short.tolist() == [0.0, 0.0, 0.0]
+
+    row = candles[0]
+    assert row[DATE_IDX] == pd.Timestamp('2022-01-01 00:05', tz='UTC')
+    assert row[DATE_IDX].to_pydatetime() == datetime(2022, 1, 1, 0, 5, tzinfo=timezone.utc)
+    assert row[OPEN_IDX] == 2.0
+    assert isinstance(row[OPEN_IDX], float)
+    assert row[LONG_IDX] == 1
+    assert row[ENTER_TAG_IDX] == 'tag1'
+    assert row[EXIT_TAG_IDX] is None
+    assert len(row) == len(HEADERS)
+    assert candles[1][ENTER_TAG_IDX] is None
+    assert candles[-1][ENTER_TAG_IDX] == 'tag3'
+    assert list(candles[-1])[:5] == [pd.Timestamp('2022-01-01 00:15', tz='UTC'),
+                                     4.0, 4.5, 3.5, 4.2]
+    with pytest.raises(IndexError):
+        candles[3]
+
+    # Dataframe is not modified
+    assert df['enter_long'].isna().sum() == 1
+
+    assert len(PairCandles.from_dataframe(df.iloc[:0])) == 0
+    assert len(PairCandles.from_dataframe(df.iloc[:1])) == 0
+
+
+def test_backtest_price_cache(default_conf, fee, mocker, testdatadir) -> None:
+    default_conf['max_open_trades'] = 10
+    mocker.patch(f'{EXMS}.get_fee', fee)
+    mocker.patch(f"{EXMS}.get_min_pair_stake_amount", return_value=0.00001)
+    mocker.patch(f"{EXMS}.get_max_pair_stake_amount", return_value=float('inf'))
+    patch_exchange(mocker)
+    default_conf['timerange'] = '20180129-20180130'
+    backtesting = Backtesting(default_conf)
+    backtesting._set_strategy(backtesting.strategylist[0])
+    pair = 'UNITTEST/BTC'
+    data = history.load_data(datadir=testdatadir, timeframe='5m', pairs=[pair],
+                             timerange=TimeRange('date', None, 1517227800, 0))
+    processed = backtesting.strategy.advise_all_indicators(data)
+    min_date, max_date = get_timerange(processed)
+
+    expected = backtesting.backtest(deepcopy(processed), min_date, max_date)['results']
+    assert price_cache.scope is None
+
+    backtesting.price_cache_scope = 'hyperopt_run'
+    spy = mocker.spy(backtest_candles, 'get_prices')
+    for _ in range(2):
+        epoch_data = deepcopy(processed)
+        close = epoch_data[pair]['close'].values
+        result = backtesting.backtest(epoch_data, min_date, max_date)['results']
+        pd.testing.assert_frame_equal(result, expected)
+    # Prices are only converted in the first epoch
+    assert spy.call_count == 1
+    # The epoch's (memory-mapped) data isn't copied
+    assert np.shares_memory(epoch_data[pair]['close'].values, close)
+    assert price_cache.scope == 'hyperopt_run'
+
+    # Trimmed dataframe, as used by the backtest
+    df = epoch_data[pair]
+    candles = price_cache.get_candles('hyperopt_run', pair, df)
+    assert candles.open is price_cache.get_candles('hyperopt_run', pair, df).open
+    assert spy.call_count == 1
+    # Different data or a new scope invalidate the cache
+    assert len(price_cache.get_candles('hyperopt_run', pair, df.iloc[:-10])) == len(df) - 11
+    assert spy.call_count == 2
+    price_cache.get_candles('hyperopt_run2', pair, df)
+    assert spy.call_count == 3
+
+    Backtesting.cleanup()
+    assert price_cache.scope is None
+
+
+def test_detail_candles_get_range() -> None:
+    dates = pd.to_datetime([
+        '2022-01-01 00:00', '2022-01-01 00:01', '2022-01-01 00:04',
+        # Gap - no data for 00:05 - 00:10
+        '2022-01-01 00:10', '2022-01-01 00:12',
+    ], utc=True)
+    df = pd.DataFrame({'date': dates, 'open': [1.0, 2.0, 3.0, 4.0, 5.0],
+                       'high': 2.0, 'low': 0.5, 'close': 1.5, 'volume': 1.0})
+    tf = 300 * 10**9
+    detail = DetailCandles(df, tf)
+
+    def get_range(date):
+        return detail.get_range(pd.Timestamp(date, tz='UTC').value)
+
+    assert get_range('2022-01-01 00:00') == (0, 3)
+    assert get_range('2022-01-01 00:05') == (3, 3)
+    assert get_range('2022-01-01 00:10') == (3, 5)
+    assert get_range('2021-12-31 23:55') == (0, 0)
+    assert get_range('2022-01-01 00:15') == (0, 0)
+    # Main candles not aligned to the index fall back to a search.
+    assert get_range('2022-01-01 00:02') == (2, 3)
+    assert get_range('2021-12-31 23:58') == (0, 2)
+
+    rows = list(detail.get_rows(1, 3, [1, 0, 0, 0, 'tag', None]))
+    assert rows == [
+        (pd.Timestamp('2022-01-01 00:01', tz='UTC'), 2.0, 2.0, 0.5, 1.5, 1, 0, 0, 0, 'tag', None),
+        (pd.Timestamp('2022-01-01 00:04', tz='UTC'), 3.0, 2.0, 0.5, 1.5, 1, 0, 0, 0, 'tag', None),
+    ]
+
+    empty = DetailCandles(df.iloc[:0], tf)
+    assert empty.get_range(pd.Timestamp('2022-01-01 00:00', tz='UTC').value) == (0, 0)
+
+
+def test_backtest_start_multi_strat_parallel(default_conf, mocker, testdatadir, fee):
+    mocker.patch(f'{EXMS}.validate_config', MagicMock())
+    mocker.patch(f'{EXMS}._load_markets')
+    mocker.patch(f'{EXMS}.markets', PropertyMock(return_value=get_markets()))
+    default_conf.update({
+        'datadir': testdatadir,
+        'timeframe': '5m',
+        'timerange': '20180125-20180130',
+        'strategy_path': str(Path(__file__).parents[1] / 'strategy/strats'),
+        'strategy_list': ['StrategyTestV2', 'StrategyTestV3'],
+        'export': 'none',
+        'fee': fee.return_value,
+        'backtest_cache': 'none',
+        'tradable_balance_ratio': 1.0,
+        'amend_last_stake_amount': False,
+    })
+    default_conf['exchange']['pair_whitelist'] = ['UNITTEST/BTC', 'XRP/BTC', 'ETH/BTC']
+    mocker.patch('freqtrade.optimize.backtesting.show_backtest_results')
+
+    def run_backtest(jobs):
+        conf = deepcopy(default_conf)
+        conf['backtest_jobs'] = jobs
+        backtesting = Backtesting(conf)
+        # Instance attributes - so they're available in the worker processes as well.
+        backtesting.exchange._markets = get_markets()
+        backtesting.exchange.get_min_pair_stake_amount = lambda *x, **xx: 0.00001
+        backtesting.exchange.get_max_pair_stake_amount = lambda *x, **xx: 100.0
+        backtesting.start()
+        return backtesting
+
+    sequential = run_backtest(1)
+    parallel = run_backtest(2)
+    assert list(parallel.all_results) == list(sequential.all_results)
+    for strategy_name, results in sequential.all_results.items():
+        assert len(results['results']) > 0
+        pd.testing.assert_frame_equal(parallel.all_results[strategy_name]['results'],
+                                      results['results'])
+        assert parallel.all_results[strategy_name]['final_balance'] == results['final_balance']
+    assert parallel.results['strategy_comparison'] == sequential.results['strategy_comparison']
+    # Detail data is restored after the parallel run.
+    assert parallel.detail_data == {}
+
+
+
+def test_backtest_strategy_job(default_conf, mocker, tmp_path):
+    patch_exchange(mocker)
+    default_conf.update({
+        'strategy_list': ['StrategyTestV2', 'StrategyTestV3'],
+        'strategy_path': str(Path(__file__).parents[1] / 'strategy/strats'),
+    })
+    backtesting = Backtesting(default_conf)
+    strat = backtesting.strategylist[1]
+    data = {'UNITTEST/BTC': generate_test_data('5m', 100)}
+    data_file = tmp_path / 'backtest_data.pkl'
+    dump((data, {}), data_file)
+
+    job_instance = backtesting._strategy_job_instance(strat)
+    # Only the strategy of the job is shipped to the worker
+    assert job_instance.strategylist == [strat]
+    assert job_instance.strategy is strat
+    assert job_instance.backtest_jobs == 1
+    assert len(backtesting.strategylist) == 2
+
+    loaded = {}
+
+    def backtest_one_strategy(strategy, data, timerange):
+        loaded.update(data)
+        job_instance.all_results[strategy.get_strategy_name()] = {}
+        return None, None
+
+    mocker.patch.object(job_instance, 'backtest_one_strategy', side_effect=backtest_one_strategy)
+    res = job_instance._backtest_strategy_job(data_file, TimeRange())
+    assert res[0] == 'StrategyTestV3'
+    # Candles are memory-mapped, not copied into the worker
+    values = loaded['UNITTEST/BTC']['close'].values
+    while not isinstance(values, np.memmap) and values.base is not None:
+        values = values.base
+    assert isinstance(values, np.memmap)
+    assert values.mode == 'c'
+
+
+@pytest.mark.parametrize('dry_run_wallet,sharded', [(1000, True), (0.001, False)])
+def test_backtest_start_pair_shards(default_conf, mocker, testdatadir, fee, caplog,
+                                    dry_run_wallet, sharded):
+    mocker.patch(f'{EXMS}.validate_config', MagicMock())
+    mocker.patch(f'{EXMS}._load_markets')
+    mocker.patch(f'{EXMS}.markets', PropertyMock(return_value=get_markets()))
+    default_conf.update({
+        'datadir': testdatadir,
+        'timeframe': '5m',
+        'timerange': '20180125-20180130',
+        'strategy': 'StrategyTestV3',
+        'export': 'none',
+        'fee': fee.return_value,
+        'backtest_cache': 'none',
+        'max_open_trades': -1,
+        'stake_amount': 0.001,
+        'dry_run_wallet': dry_run_wallet,
+        'tradable_balance_ratio': 1.0,
+        'amend_last_stake_amount': False,
+    })
+    default_conf['exchange']['pair_whitelist'] = ['ETH/BTC', 'LTC/BTC', 'XRP/BTC']
+    mocker.patch('freqtrade.optimize.backtesting.show_backtest_results')
+
+    def run_backtest(jobs):
+        conf = deepcopy(default_conf)
+        conf['backtest_jobs'] = jobs
+        backtesting = Backtesting(conf)
+        backtesting.exchange._markets = get_markets()
+        backtesting.exchange.get_min_pair_stake_amount = lambda *x, **xx: 0.00001
+        backtesting.exchange.get_max_pair_stake_amount = lambda *x, **xx: 100.0
+        backtesting.start()
+        ids = [(trade.pair, trade.id, [(order.id, order.order_id, order.ft_trade_id)
+                                       for order in trade.orders])
+               for trade in LocalTrade.trades]
+        return backtesting, ids
+
+    wallet_check = mocker.patch('freqtrade.optimize.backtesting.shared_wallet_allows',
+                                wraps=shared_wallet_allows)
+    sequential, sequential_ids = run_backtest(1)
+    assert wallet_check.call_count == 0
+    parallel, parallel_ids = run_backtest(2)
+    assert wallet_check.call_count == 1
+    # Trade and order ids match a regular backtest - and don't collide between shards.
+    assert parallel_ids == sequential_ids
+    assert len({pair for pair, _, _ in sequential_ids}) == (2 if sharded else 1)
+    # Pairs are backtested together if the shared wallet would have limited the shards.
+    assert log_has('Wallet limited the pair shards - backtesting pairs together.',
+                   caplog) is not sharded
+    results = sequential.all_results['StrategyTestV3']
+    assert len(results['results']) > 0
+    pd.testing.assert_frame_equal(parallel.all_results['StrategyTestV3']['results'],
+                                  results['results'])
+    assert parallel.all_results['StrategyTestV3']['final_balance'] == pytest.approx(
+        results['final_balance'])
+    assert parallel.results['strategy_comparison'] == sequential.results['strategy_comparison']
+
+
+def test_pair_sharding_supported(default_conf, mocker):
+    patch_exchange(mocker)
+    default_conf.update({'backtest_jobs': 2, 'max_open_trades': -1, 'stake_amount': 0.001})
+    backtesting = Backtesting(default_conf)
+    backtesting._set_strategy(backtesting.strategylist[0])
+    data = {'UNITTEST/BTC': None, 'XRP/BTC': None}
+    assert backtesting.pair_sharding_supported(data)
+    assert not backtesting.pair_sharding_supported({'UNITTEST/BTC': None})
+
+    backtesting.config['max_open_trades'] = 3
+    assert not backtesting.pair_sharding_supported(data)
+    backtesting.config['max_open_trades'] = float('inf')
+    assert backtesting.pair_sharding_supported(data)
+
+    backtesting.enable_protections = True
+    assert not backtesting.pair_sharding_supported(data)
+    backtesting.enable_protections = False
+
+    backtesting.config['stake_amount'] = 'unlimited'
+    assert not backtesting.pair_sharding_supported(data)
+    backtesting.config['stake_amount'] = 0.001
+
+    # Callbacks may read the wallet, which isn't shared between the shards.
+    for callback in ('custom_stake_amount', 'confirm_trade_entry', 'custom_exit',
+                     'custom_stoploss'):
+        setattr(backtesting.strategy, callback, MagicMock())
+        assert not backtesting.pair_sharding_supported(data)
+        delattr(backtesting.strategy, callback)
+    assert backtesting.pair_sharding_supported(data)
+    # The strategy implements leverage(), which is only called in futures mode.
+    backtesting.trading_mode = TradingMode.FUTURES
+    assert not backtesting.pair_sharding_supported(data)
+    backtesting.trading_mode = TradingMode.SPOT
+
+    backtesting.backtest_jobs = 1
+    assert not backtesting.pair_sharding_supported(data)
+
+
+
+def test_pair_shard_job_instance(default_conf, mocker):
+    patch_exchange(mocker)
+    backtesting = Backtesting(default_conf)
+    backtesting._set_strategy(backtesting.strategylist[0])
+    df = generate_test_data('5m', 10)
+    for pair in ['UNITTEST/BTC', 'XRP/BTC', 'ETH/BTC']:
+        backtesting.dataprovider._set_cached_df(pair, '5m', df, CandleType.SPOT)
+    backtesting.dataprovider._set_dataframe_max_index(10)
+    backtesting.detail_data = {'UNITTEST/BTC': df, 'ETH/BTC': df}
+
+    shard = backtesting._pair_shard_job_instance(['UNITTEST/BTC', 'XRP/BTC'])
+    # Only the data of the shard's pairs is shipped to the worker
+    assert shard.detail_data == {'UNITTEST/BTC': df}
+    assert shard.strategylist == [shard.strategy]
+    assert shard.strategy is not backtesting.strategy
+    assert shard.strategy.dp is shard.dataprovider
+    assert shard.dataprovider.get_analyzed_dataframe('ETH/BTC', '5m')[0].empty
+    assert not shard.dataprovider.get_analyzed_dataframe('XRP/BTC', '5m')[0].empty
+    # The original instance is unchanged
+    assert backtesting.strategy.dp is backtesting.dataprovider
+    assert not backtesting.dataprovider.get_analyzed_dataframe('ETH/BTC', '5m')[0].empty
+    assert len(backtesting.detail_data) == 2
+
+
+def test_shared_wallet_allows():
+    start = datetime(2018, 1, 1, tzinfo=timezone.utc)
+
+    def trade(open_min, close_min, profit):
+        return MagicMock(open_date_utc=start + timedelta(minutes=open_min),
+                         close_date_utc=start + timedelta(minutes=close_min),
+                         stake_amount=10.0, close_profit_abs=profit)
+
+    assert shared_wallet_allows([], 10, 5, 0.99)
+    trades = [trade(0, 10, 1.0), trade(5, 20, -2.0)]
+    assert shared_wallet_allows(trades, 10, 21, 1.0)
+    assert not shared_wallet_allows(trades, 10, 21, 0.9)
+    assert shared_wallet_allows(trades, 10, 21, 0.9, available_capital=20.5)
+    # The second trade opens after the first closed - with a loss.
+    trades = [trade(0, 10, -1.0), trade(15, 20, 0.0)]
+    assert shared_wallet_allows(trades, 10, 11.5, 1.0)
+    assert not shared_wallet_allows(trades, 10, 10.5, 1.0)
+    # Trades closing at the time of an entry count as open.
+    trades = [trade(0, 10, 1.0), trade(10, 20, -2.0)]
+    assert not shared_wallet_allows(trades, 10, 15, 1.0)
+    assert shared_wallet_allows(trades, 10, 21, 1.0)
+
+
+@pytest.mark.parametrize('vectorized', [True, False])
+def test_backtest_start_checkpoint(default_conf, mocker, testdatadir, fee, caplog, tmp_path,
+                                   vectorized):
+    mocker.patch(f'{EXMS}.validate_config', MagicMock())
+    mocker.patch(f'{EXMS}._load_markets')
+    mocker.patch(f'{EXMS}.markets', PropertyMock(return_value=get_markets()))
+    mocker.patch(f'{EXMS}.get_min_pair_stake_amount', return_value=0.00001)
+    mocker.patch(f'{EXMS}.get_max_pair_stake_amount', return_value=float('inf'))
+    mocker.patch('freqtrade.optimize.backtesting.show_backtest_results')
+    mocker.patch('freqtrade.optimize.backtesting.Backtesting.vectorized_backtest_supported',
+                 return_value=vectorized)
+    default_conf.update({
+        'datadir': testdatadir,
+        'user_data_dir': tmp_path,
+        'timeframe': '5m',
+        'strategy': 'StrategyTestV3',
+        'export': 'none',
+        'fee': fee.return_value,
+        'backtest_cache': 'none',
+        'max_open_trades': 1,
+        'stake_amount': 0.001,
+        'enable_protections': True,
+        'protections': [{"method": "CooldownPeriod", "stop_duration": 30}],
+    })
+    default_conf['exchange']['pair_whitelist'] = ['ETH/BTC', 'LTC/BTC']
+
+    def run_backtest(timerange, checkpoint):
+        conf = deepcopy(default_conf)
+        conf.update({'timerange': timerange, 'backtest_checkpoint': checkpoint})
+        backtesting = Backtesting(conf)
+        backtesting.start()
+        return backtesting.all_results['StrategyTestV3']
+
+    full = run_backtest('1516838400-1517270400', False)
+    checkpoint_file = tmp_path / 'backtest_results' / '.checkpoints' / 'StrategyTestV3.pkl'
+    assert not checkpoint_file.exists()
+
+    # LTC/BTC trade is still open at the end.
+    partial = run_backtest('1516838400-1517193000', True)
+    assert partial['results'].iloc[-1]['exit_reason'] == ExitType.FORCE_EXIT.value
+    assert checkpoint_file.is_file()
+    assert not log_has_re(r'Resuming backtest from checkpoint.*', caplog)
+
+    resumed = run_backtest('1516838400-1517270400', True)
+    assert log_has('Resuming backtest from checkpoint at 2018-01-29 02:30:00.', caplog)
+    assert len(full['results']) > 5
+    pd.testing.assert_frame_equal(resumed['results'], full['results'])
+    for key in ('rejected_signals', 'final_balance'):
+        assert resumed[key] == full[key]
+    assert ([lock.to_json() for lock in resumed['locks']] ==
+            [lock.to_json() for lock in full['locks']])
+
+    # Checkpoint of the extended backtest is used for the identical backtest.
+    caplog.clear()
+    resumed = run_backtest('1516838400-1517270400', True)
+    assert log_has('Resuming backtest from checkpoint at 2018-01-30 00:00:00.', caplog)
+    pd.testing.assert_frame_equal(resumed['results'], full['results'])
+
+    caplog.clear()
+    run_backtest('20180126-20180130', True)
+    assert log_has('Backtest checkpoint does not match this backtest, '
+                   'running the full backtest.', caplog)
+
+
+def test_backtest_indicator_cache(default_conf, mocker, testdatadir, tmp_path, caplog):
+    patch_exchange(mocker)
+    default_conf.update({'user_data_dir': tmp_path, 'indicator_cache': True})
+    backtesting = Backtesting(default_conf)
+    backtesting._set_strategy(backtesting.strategylist[0])
+    pairs = ['UNITTEST/BTC', 'ETH/BTC']
+    data = history.load_data(datadir=testdatadir, timeframe='5m', pairs=pairs)
+    expected = backtesting.strategy.advise_all_indicators(data)
+    cache_files = tmp_path / 'backtest_results' / '.indicators' / CURRENT_TEST_STRATEGY
+
+    result = backtesting.advise_all_indicators(data)
+    assert log_has('Loaded indicators of 0 of 2 pairs from the indicator cache.', caplog)
+    assert len(list(cache_files.glob('*/*.feather'))) == 2
+
+    indicators = mocker.spy(backtesting.strategy, 'advise_indicators')
+    result = backtesting.advise_all_indicators(data)
+    assert log_has('Loaded indicators of 2 of 2 pairs from the indicator cache.', caplog)
+    assert indicators.call_count == 0
+    for pair in pairs:
+        pd.testing.assert_frame_equal(result[pair], expected[pair])
+
+    # Changed candles, timerange or indicator parameters invalidate the cached indicators.
+    data['ETH/BTC'] = data['ETH/BTC'].iloc[:-10]
+    backtesting.advise_all_indicators(data)
+    assert indicators.call_count == 1
+    backtesting.strategy.config['timerange'] = '20180110-'
+    backtesting.advise_all_indicators(data)
+    assert indicators.call_count == 3
+    backtesting.strategy.protection_cooldown_lookback.value += 1
+    backtesting.advise_all_indicators(data)
+    assert indicators.call_count == 5
+    # Parameters only used for entry / exit signals don't.
+    backtesting.strategy.buy_rsi.value += 1
+    backtesting.strategy.sell_minusdi.value += 0.1
+    backtesting.advise_all_indicators(data)
+    assert indicators.call_count == 5
+    # Only the latest entry per pair is kept.
+    assert len(list(cache_files.glob('*/*.feather'))) == 2
+
+    source = Path(backtesting.strategy.__file__).read_text()
+    assert IndicatorCache.get_indicator_parameters(backtesting.strategy, source) == {
+        'protection_enabled', 'protection_cooldown_lookback'}
+    # Parameters accessed by name may be used anywhere.
+    assert IndicatorCache.get_indicator_parameters(
+        backtesting.strategy, source + "\ngetattr(self, f'buy_{name}')") == {
+        name for name, _ in backtesting.strategy.enumerate_parameters()}
+
+    # Base classes are part of the strategy.
+    default_conf['strategy'] = 'HyperoptableStrategy'
+    strategy = StrategyResolver.load_strategy(default_conf)
+    strats = Path(__file__).parents[1] / 'strategy' / 'strats'
+    assert IndicatorCache.get_strategy_files(strategy) == [
+        (strats / 'hyperoptable_strategy.py').resolve(), (strats / 'strategy_test_v3.py').resolve()]
@@ -1,18 +1,26 @@
 # pragma pylint: disable=missing-docstring,W0212,C0103
+import pickle
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from functools import wraps
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import ANY, MagicMock, PropertyMock
 
+import numpy as np
 import pandas as pd
 import pytest
 from filelock import Timeout
+from joblib import dump
 from skopt.space import Integer
 
 from freqtrade.commands.optimize_commands import setup_optimize_configuration, start_hyperopt
 from freqtrade.data.history import load_data
 from freqtrade.enums import ExitType, RunMode
 from freqtrade.exceptions import OperationalException
+from freqtrade.optimize import hyperopt_worker
 from freqtrade.optimize.hyperopt import Hyperopt
 from freqtrade.optimize.hyperopt_auto import HyperOptAuto
 from freqtrade.optimize.hyperopt_tools import HyperoptTools
@@ -20,8 +28,9 @@ from freqtrade.optimize.optimize_reports import generate_strategy_stats
 from freqtrade.optimize.space import SKDecimal
 from freqtrade.strategy import IntParameter
 from freqtrade.util import dt_utc
-from tests.conftest import (CURRENT_TEST_STRATEGY, EXMS, get_args, get_markets, log_has, log_has_re,
-                            patch_exchange, patched_configuration_load_config_file)
+from tests.conftest import (CURRENT_TEST_STRATEGY, EXMS, generate_test_data, get_args, get_markets,
+                            log_has, log_has_re, patch_exchange,
+                            patched_configuration_load_config_file)
 
 
 def generate_result_metrics():
@@ -311,13 +320,13 @@ def test_start_calls_optimizer(mocker, hyperopt_conf, capsys) -> None:
         MagicMock(return_value=(datetime(2017, 12, 10), datetime(2017, 12, 13)))
     )
 
-    parallel = mocker.patch(
-        'freqtrade.optimize.hyperopt.Hyperopt.run_optimizer_parallel',
-        MagicMock(return_value=[{
+    generate_optimizer = mocker.patch(
+        'freqtrade.optimize.hyperopt.Hyperopt.generate_optimizer',
+        MagicMock(return_value={
             'loss': 1, 'results_explanation': 'foo result',
             'params': {'buy': {}, 'sell': {}, 'roi': {}, 'stoploss': 0.0},
             'results_metrics': generate_result_metrics(),
-        }])
+        })
     )
     patch_exchange(mocker)
     # Co-test loading timeframe from strategy
@@ -329,7 +338,7 @@ def test_start_calls_optimizer(mocker, hyperopt_conf, capsys) -> None:
 
     hyperopt.start()
 
-    parallel.assert_called_once()
+    generate_optimizer.assert_called_once()
 
     out, err = capsys.readouterr()
     assert 'Best result:\n\n*    1/1: foo result Objective: 1.00000\n' in out
@@ -518,6 +527,36 @@ def test_generate_optimizer(mocker, hyperopt_conf) -> None:
     hyperopt.init_spaces()
     generate_optimizer_value = hyperopt.generate_optimizer(list(optimizer_param.values()))
     assert generate_optimizer_value == response_expected
+    # The loss function only needs the summary metrics
+    assert 'max_drawdown_account' in generate_optimizer_value['results_metrics']
+    assert 'results_per_pair' not in generate_optimizer_value['results_metrics']
+
+
+def test_generate_optimizer_memmap(mocker, hyperopt_conf, tmp_path) -> None:
+    patch_exchange(mocker)
+    hyperopt_conf['user_data_dir'] = tmp_path
+    (tmp_path / 'hyperopt_results').mkdir()
+    hyperopt = Hyperopt(hyperopt_conf)
+    hyperopt.min_date = dt_utc(2017, 12, 10)
+    hyperopt.max_date = dt_utc(2017, 12, 13)
+    hyperopt.init_spaces()
+    dump({'UNITTEST/BTC': generate_test_data('5m', 100)}, hyperopt.data_pickle_file)
+    loaded = {}
+
+    def backtest(processed, start_date, end_date):
+        loaded.update(processed)
+        return {}
+
+    mocker.patch('freqtrade.optimize.hyperopt.Backtesting.backtest', side_effect=backtest)
+    mocker.patch('freqtrade.optimize.hyperopt.Hyperopt._get_results_dict', return_value={})
+    hyperopt.generate_optimizer([dim.rvs(random_state=1)[0] for dim in hyperopt.dimensions])
+
+    # Candles are memory-mapped (copy-on-write), not copied into the worker
+    values = loaded['UNITTEST/BTC']['close'].values
+    while not isinstance(values, np.memmap) and values.base is not None:
+        values = values.base
+    assert isinstance(values, np.memmap)
+    assert values.mode == 'c'
 
 
 def test_clean_hyperopt(mocker, hyperopt_conf, caplog):
@@ -529,7 +568,7 @@ def test_clean_hyperopt(mocker, hyperopt_conf, caplog):
     unlinkmock = mocker.patch("freqtrade.optimize.hyperopt.Path.unlink", MagicMock())
     h = Hyperopt(hyperopt_conf)
 
-    assert unlinkmock.call_count == 2
+    assert unlinkmock.call_count == 3
     assert log_has(f"Removing `{h.data_pickle_file}`.", caplog)
 
 
@@ -546,9 +585,9 @@ def test_print_json_spaces_all(mocker, hyperopt_conf, capsys) -> None:
         MagicMock(return_value=(datetime(2017, 12, 10), datetime(2017, 12, 13)))
     )
 
-    parallel = mocker.patch(
-        'freqtrade.optimize.hyperopt.Hyperopt.run_optimizer_parallel',
-        MagicMock(return_value=[{
+    generate_optimizer = mocker.patch(
+        'freqtrade.optimize.hyperopt.Hyperopt.generate_optimizer',
+        MagicMock(return_value={
             'loss': 1, 'results_explanation': 'foo result', 'params': {},
             'params_details': {
                 'buy': {'mfi-value': None},
@@ -558,7 +597,7 @@ def test_print_json_spaces_all(mocker, hyperopt_conf, capsys) -> None:
                 'max_open_trades': {'max_open_trades': None}
             },
             'results_metrics': generate_result_metrics(),
-        }])
+        })
     )
     patch_exchange(mocker)
 
@@ -573,7 +612,7 @@ def test_print_json_spaces_all(mocker, hyperopt_conf, capsys) -> None:
 
     hyperopt.start()
 
-    parallel.assert_called_once()
+    generate_optimizer.assert_called_once()
 
     out, err = capsys.readouterr()
     result_str = (
@@ -598,9 +637,9 @@ def test_print_json_spaces_default(mocker, hyperopt_conf, capsys) -> None:
         MagicMock(return_value=(datetime(2017, 12, 10), datetime(2017, 12, 13)))
     )
 
-    parallel = mocker.patch(
-        'freqtrade.optimize.hyperopt.Hyperopt.run_optimizer_parallel',
-        MagicMock(return_value=[{
+    generate_optimizer = mocker.patch(
+        'freqtrade.optimize.hyperopt.Hyperopt.generate_optimizer',
+        MagicMock(return_value={
             'loss': 1, 'results_explanation': 'foo result', 'params': {},
             'params_details': {
                 'buy': {'mfi-value': None},
@@ -608,7 +647,7 @@ def test_print_json_spaces_default(mocker, hyperopt_conf, capsys) -> None:
                 'roi': {}, 'stoploss': {'stoploss': None}
             },
             'results_metrics': generate_result_metrics(),
-        }])
+        })
     )
     patch_exchange(mocker)
 
@@ -620,7 +659,7 @@ def test_print_json_spaces_default(mocker, hyperopt_conf, capsys) -> None:
 
     hyperopt.start()
 
-    parallel.assert_called_once()
+    generate_optimizer.assert_called_once()
 
     out, err = capsys.readouterr()
     assert '{"params":{"mfi-value":null,"sell-mfi-value":null},"minimal_roi":{},"stoploss":null}' in out  # noqa: E501
@@ -641,13 +680,13 @@ def test_print_json_spaces_roi_stoploss(mocker, hyperopt_conf, capsys) -> None:
         MagicMock(return_value=(datetime(2017, 12, 10), datetime(2017, 12, 13)))
     )
 
-    parallel = mocker.patch(
-        'freqtrade.optimize.hyperopt.Hyperopt.run_optimizer_parallel',
-        MagicMock(return_value=[{
+    generate_optimizer = mocker.patch(
+        'freqtrade.optimize.hyperopt.Hyperopt.generate_optimizer',
+        MagicMock(return_value={
             'loss': 1, 'results_explanation': 'foo result', 'params': {},
             'params_details': {'roi': {}, 'stoploss': {'stoploss': None}},
             'results_metrics': generate_result_metrics(),
-        }])
+        })
     )
     patch_exchange(mocker)
 
@@ -662,7 +701,7 @@ def test_print_json_spaces_roi_stoploss(mocker, hyperopt_conf, capsys) -> None:
 
     hyperopt.start()
 
-    parallel.assert_called_once()
+    generate_optimizer.assert_called_once()
 
     out, err = capsys.readouterr()
     assert '{"minimal_roi":{},"stoploss":null}' in out
@@ -683,12 +722,12 @@ def test_simplified_interface_roi_stoploss(mocker, hyperopt_conf, capsys) -> Non
         MagicMock(return_value=(datetime(2017, 12, 10), datetime(2017, 12, 13)))
     )
 
-    parallel = mocker.patch(
-        'freqtrade.optimize.hyperopt.Hyperopt.run_optimizer_parallel',
-        MagicMock(return_value=[{
+    generate_optimizer = mocker.patch(
+        'freqtrade.optimize.hyperopt.Hyperopt.generate_optimizer',
+        MagicMock(return_value={
             'loss': 1, 'results_explanation': 'foo result', 'params': {'stoploss': 0.0},
             'results_metrics': generate_result_metrics(),
-        }])
+        })
     )
     patch_exchange(mocker)
 
@@ -700,7 +739,7 @@ def test_simplified_interface_roi_stoploss(mocker, hyperopt_conf, capsys) -> Non
 
     hyperopt.start()
 
-    parallel.assert_called_once()
+    generate_optimizer.assert_called_once()
 
     out, err = capsys.readouterr()
     assert 'Best result:\n\n*    1/1: foo result Objective: 1.00000\n' in out
@@ -756,12 +795,12 @@ def test_simplified_interface_buy(mocker, hyperopt_conf, capsys) -> None:
         MagicMock(return_value=(datetime(2017, 12, 10), datetime(2017, 12, 13)))
     )
 
-    parallel = mocker.patch(
-        'freqtrade.optimize.hyperopt.Hyperopt.run_optimizer_parallel',
-        MagicMock(return_value=[{
+    generate_optimizer = mocker.patch(
+        'freqtrade.optimize.hyperopt.Hyperopt.generate_optimizer',
+        MagicMock(return_value={
             'loss': 1, 'results_explanation': 'foo result', 'params': {},
             'results_metrics': generate_result_metrics(),
-        }])
+        })
     )
     patch_exchange(mocker)
 
@@ -773,7 +812,7 @@ def test_simplified_interface_buy(mocker, hyperopt_conf, capsys) -> None:
 
     hyperopt.start()
 
-    parallel.assert_called_once()
+    generate_optimizer.assert_called_once()
 
     out, err = capsys.readouterr()
     assert 'Best result:\n\n*    1/1: foo result Objective: 1.00000\n' in out
@@ -798,12 +837,12 @@ def test_simplified_interface_sell(mocker, hyperopt_conf, capsys) -> None:
         MagicMock(return_value=(datetime(2017, 12, 10), datetime(2017, 12, 13)))
     )
 
-    parallel = mocker.patch(
-        'freqtrade.optimize.hyperopt.Hyperopt.run_optimizer_parallel',
-        MagicMock(return_value=[{
+    generate_optimizer = mocker.patch(
+        'freqtrade.optimize.hyperopt.Hyperopt.generate_optimizer',
+        MagicMock(return_value={
             'loss': 1, 'results_explanation': 'foo result', 'params': {},
             'results_metrics': generate_result_metrics(),
-        }])
+        })
     )
     patch_exchange(mocker)
 
@@ -815,7 +854,7 @@ def test_simplified_interface_sell(mocker, hyperopt_conf, capsys) -> None:
 
     hyperopt.start()
 
-    parallel.assert_called_once()
+    generate_optimizer.assert_called_once()
 
     out, err = capsys.readouterr()
     assert 'Best result:\n\n*    1/1: foo result Objective: 1.00000\n' in out
@@ -874,6 +913,8 @@ def test_in_strategy_auto_hyperopt(mocker, hyperopt_conf, tmpdir, fee) -> None:
     assert isinstance(hyperopt.backtesting.strategy.buy_rsi, IntParameter)
     assert hyperopt.backtesting.strategy.bot_started is True
     assert hyperopt.backtesting.strategy.bot_loop_started is False
+    # Epochs reuse converted prices
+    assert hyperopt.backtesting.price_cache_scope
 
     assert hyperopt.backtesting.strategy.buy_rsi.in_space is True
     assert hyperopt.backtesting.strategy.buy_rsi.value == 35
@@ -935,7 +976,110 @@ def test_in_strategy_auto_hyperopt_with_parallel(mocker, hyperopt_conf, tmpdir,
     # Range from 0 - 50 (inclusive)
     assert len(list(buy_rsi_range)) == 51
 
+    generate_optimizer = mocker.spy(Hyperopt, 'generate_optimizer')
     hyperopt.start()
+    assert hyperopt.num_epochs_saved == 2
+    # Epochs ran in the worker processes
+    assert generate_optimizer.call_count == 0
+    # Best epochs come with the full report
+    assert 'results_per_pair' in hyperopt.current_best_epoch['results_metrics']
+    assert hyperopt.worker_file is None
+
+
+def test_run_optimizer_async(mocker, hyperopt_conf, tmp_path) -> None:
+    patch_exchange(mocker)
+    hyperopt_conf['spaces'] = ['roi', 'stoploss']
+    rng = random.Random()
+
+    def run_epoch(hyperopt_file, raw_params):
+        # Epochs finish out of order
+        time.sleep(rng.random() / 100)
+        return {'loss': float(sum(raw_params))}
+
+    mocker.patch('freqtrade.optimize.hyperopt.run_epoch', side_effect=run_epoch)
+    mocker.patch('freqtrade.optimize.hyperopt.Hyperopt.get_worker_file',
+                 return_value=tmp_path / 'hyperopt_worker.pkl')
+
+    def run_async(start):
+        executor = ThreadPoolExecutor(max_workers=2)
+        shutdown = mocker.spy(executor, 'shutdown')
+        mocker.patch('freqtrade.optimize.hyperopt.ProcessPoolExecutor', return_value=executor)
+        hyperopt = Hyperopt(hyperopt_conf)
+        hyperopt.evaluate_result = MagicMock()
+        hyperopt.init_spaces()
+        hyperopt.random_state = 42
+        hyperopt.total_epochs = 10
+        hyperopt.opt = hyperopt.get_optimizer(hyperopt.dimensions, 1)
+        epoch_done = MagicMock()
+        try:
+            hyperopt.run_optimizer_async(2, start, epoch_done)
+        finally:
+            assert shutdown.call_count == 1
+
+        assert epoch_done.call_count == 10 - start
+        assert [c[0][1] for c in hyperopt.evaluate_result.call_args_list] == list(
+            range(start + 1, 11))
+        return hyperopt.opt.Xi
+
+    points = run_async(0)
+    assert len(points) == 10
+    # No point was evaluated twice, even though epochs overlap
+    assert len({tuple(x) for x in points}) == 10
+    # Same random state - same points, independent of the order epochs finished in
+    assert run_async(0) == points
+    assert len(run_async(5)) == 5
+
+    # Workers are shut down if an epoch fails
+    mocker.patch('freqtrade.optimize.hyperopt.run_epoch', side_effect=ValueError('Epoch failed'))
+    with pytest.raises(ValueError, match='Epoch failed'):
+        run_async(0)
+
+
+def test_get_asked_points(mocker, hyperopt_conf) -> None:
+    patch_exchange(mocker)
+    hyperopt_conf['spaces'] = ['roi', 'stoploss']
+    hyperopt = Hyperopt(hyperopt_conf)
+    hyperopt.init_spaces()
+    hyperopt.random_state = 42
+    hyperopt.opt = hyperopt.get_optimizer(hyperopt.dimensions, 1)
+
+    asked, is_random = hyperopt.get_asked_points(n_points=4)
+    assert len(asked) == 4
+    assert is_random == [False] * 4
+    hyperopt.tell_results(asked[:2], [1.0, 2.0])
+    assert hyperopt.evaluated_points == {tuple(x) for x in asked[:2]}
+    assert hyperopt.opt.Xi == asked[:2]
+
+    # Evaluated and pending points are not asked again
+    ask = mocker.patch.object(hyperopt.opt, 'ask', return_value=asked + asked)
+    new_asked, is_random = hyperopt.get_asked_points(n_points=1, pending=asked[2:3])
+    assert new_asked == asked[3:4]
+    assert is_random == [False]
+    assert ask.call_count == 1
+
+    # Fall back to random points
+    new_asked, is_random = hyperopt.get_asked_points(n_points=2, pending=asked[2:])
+    assert ask.call_count == 4
+    assert len(new_asked) == 2
+    assert is_random == [True, True]
+    assert not {tuple(x) for x in new_asked} & {tuple(x) for x in asked}
+
+
+def test_hyperopt_worker_run_epoch(mocker, tmp_path) -> None:
+    load = mocker.spy(hyperopt_worker.pickle, 'load')
+    hyperopt_file = tmp_path / 'hyperopt_worker.pkl'
+    hyperopt_file.write_bytes(pickle.dumps(SimpleNamespace(generate_optimizer=sum)))
+
+    assert hyperopt_worker.run_epoch(hyperopt_file, [1, 2]) == 3
+    assert hyperopt_worker.run_epoch(hyperopt_file, [3, 4]) == 7
+    # The instance is only loaded once per run
+    assert load.call_count == 1
+
+    hyperopt_file2 = tmp_path / 'hyperopt_worker2.pkl'
+    hyperopt_file2.write_bytes(pickle.dumps(SimpleNamespace(generate_optimizer=len)))
+    assert hyperopt_worker.run_epoch(hyperopt_file2, [3, 4]) == 2
+    assert load.call_count == 2
+    assert list(hyperopt_worker._worker_hyperopt) == [hyperopt_file2]
 
 
 def test_in_strategy_auto_hyperopt_per_epoch(mocker, hyperopt_conf, tmpdir, fee) -> None:
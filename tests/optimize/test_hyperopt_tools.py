@@ -9,6 +9,7 @@ import rapidjson
 
 from freqtrade.constants import FTHYPT_FILEVERSION
 from freqtrade.exceptions import OperationalException
+from freqtrade.optimize.hyperopt_results_index import IndexedEpochs, get_index_filename, load_index
 from freqtrade.optimize.hyperopt_tools import HyperoptTools, hyperopt_serializer
 from tests.conftest import CURRENT_TEST_STRATEGY, log_has, log_has_re
 
@@ -56,6 +57,45 @@ def test_save_results_saves_epochs(hyperopt, tmpdir, caplog) -> None:
         next(result_gen)
 
 
+def test_load_filtered_epochs_indexed(hyperopt, tmp_path, caplog) -> None:
+    hyperopt.results_file = tmp_path / 'ut_results.fthypt'
+    for i in range(5):
+        hyperopt._save_result({
+            'loss': 1 - i, 'params': {}, 'is_best': i % 2 == 0, 'current_epoch': i + 1,
+            'results_metrics': {'total_trades': i, 'profit_total': i - 2.5, 'comment': 'é'},
+        })
+    index = load_index(hyperopt.results_file)
+    assert len(index) == 5
+    assert index['total_trades'].tolist() == [0, 1, 2, 3, 4]
+    assert np.isnan(index['holding_avg_s']).all()
+
+    epochs, total_epochs = HyperoptTools.load_filtered_epochs(hyperopt.results_file, {})
+    assert isinstance(epochs, IndexedEpochs)
+    assert total_epochs == 5
+    assert [e['current_epoch'] for e in epochs] == [1, 2, 3, 4, 5]
+    assert epochs[-1]['results_metrics']['comment'] == 'é'
+
+    config = {'hyperopt_list_best': True, 'hyperopt_list_profitable': True}
+    epochs, total_epochs = HyperoptTools.load_filtered_epochs(hyperopt.results_file, config)
+    assert log_has("1 best profitable epochs found.", caplog)
+    assert total_epochs == 5
+    assert [e['current_epoch'] for e in epochs] == [5]
+    assert HyperoptTools.load_filtered_results(hyperopt.results_file, config) == (
+        [epochs[0]], 5)
+
+    with pytest.raises(OperationalException, match=r"Holding-average not available.*"):
+        HyperoptTools.load_filtered_epochs(hyperopt.results_file,
+                                           {'hyperopt_list_min_avg_time': 1})
+
+    # Results without a matching index are read entirely
+    with get_index_filename(hyperopt.results_file).open('ab') as f:
+        f.write(b'x')
+    assert load_index(hyperopt.results_file) is None
+    epochs, total_epochs = HyperoptTools.load_filtered_epochs(hyperopt.results_file, config)
+    assert isinstance(epochs, list)
+    assert [e['current_epoch'] for e in epochs] == [5]
+
+
 def test_load_previous_results2(mocker, testdatadir, caplog) -> None:
     results_file = testdatadir / 'hyperopt_results_SampleStrategy.pickle'
     with pytest.raises(OperationalException,
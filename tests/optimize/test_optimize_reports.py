@@ -6,6 +6,7 @@ from shutil import copyfile
 import joblib
 import pandas as pd
 import pytest
+import rapidjson
 
 from freqtrade.configuration import TimeRange
 from freqtrade.constants import BACKTEST_BREAKDOWNS, DATETIME_PRINT_FORMAT, LAST_BT_RESULT_FN
@@ -14,12 +15,15 @@ from freqtrade.data.btanalysis import (get_latest_backtest_filename, load_backte
                                        load_backtest_stats)
 from freqtrade.edge import PairInfo
 from freqtrade.enums import ExitType
-from freqtrade.optimize.optimize_reports import (_get_resample_from_period, generate_backtest_stats,
-                                                 generate_daily_stats, generate_edge_table,
-                                                 generate_exit_reason_stats, generate_pair_metrics,
+from freqtrade.optimize.hyperopt_tools import hyperopt_serializer
+from freqtrade.optimize.optimize_reports import (_get_resample_from_period, complete_strategy_stats,
+                                                 generate_backtest_stats, generate_daily_stats,
+                                                 generate_edge_table, generate_exit_reason_stats,
+                                                 generate_pair_metrics,
                                                  generate_periodic_breakdown_stats,
                                                  generate_strategy_comparison,
-                                                 generate_trading_stats, show_sorted_pairlist,
+                                                 generate_strategy_stats, generate_trading_stats,
+                                                 show_sorted_pairlist,
                                                  store_backtest_analysis_results,
                                                  store_backtest_stats, text_table_bt_results,
                                                  text_table_exit_reason, text_table_strategy)
@@ -207,6 +211,71 @@ def test_generate_backtest_stats(default_conf, testdatadir, tmpdir):
     filename1.unlink()
 
 
+def test_generate_strategy_stats_lean(default_conf):
+    default_conf.update({'strategy': CURRENT_TEST_STRATEGY})
+    StrategyResolver.load_strategy(default_conf)
+    content = {
+        'results': pd.DataFrame({
+            "pair": ["UNITTEST/BTC", "ETH/BTC", "UNITTEST/BTC"],
+            "profit_ratio": [0.003312, -0.010801, 0.013803],
+            "profit_abs": [0.000003, -0.000011, 0.000014],
+            "open_date": [dt_utc(2017, 11, 14, 19, 32), dt_utc(2017, 11, 14, 21, 36),
+                          dt_utc(2017, 11, 15, 22, 12)],
+            "close_date": [dt_utc(2017, 11, 14, 21, 35), dt_utc(2017, 11, 14, 22, 10),
+                           dt_utc(2017, 11, 15, 22, 43)],
+            "trade_duration": [123, 34, 31],
+            "is_open": [False, False, True],
+            "is_short": [False, True, False],
+            "stake_amount": [0.01, 0.01, 0.01],
+            "enter_tag": ['tag1', None, 'tag1'],
+            "exit_reason": [ExitType.ROI.value, ExitType.STOP_LOSS.value,
+                            ExitType.FORCE_EXIT.value],
+        }),
+        'config': default_conf,
+        'locks': [],
+        'final_balance': 1000.02,
+        'rejected_signals': 20,
+        'timedout_entry_orders': 0,
+        'timedout_exit_orders': 0,
+        'canceled_trade_entries': 0,
+        'canceled_entry_orders': 0,
+        'replaced_entry_orders': 0,
+        'backtest_start_time': dt_ts() // 1000,
+        'backtest_end_time': dt_ts() // 1000,
+    }
+    pairlist = ['UNITTEST/BTC', 'ETH/BTC']
+    min_date = dt_utc(2017, 11, 14)
+    max_date = dt_utc(2017, 11, 16)
+    full = generate_strategy_stats(pairlist, 'DefStrat', content, min_date, max_date,
+                                   market_change=0.1, is_hyperopt=True)
+    lean = generate_strategy_stats(pairlist, 'DefStrat', content, min_date, max_date,
+                                   market_change=0.1, is_hyperopt=True, stats=['sharpe'])
+    assert 'sharpe' in lean
+    for key in ('results_per_pair', 'best_pair', 'exit_reason_summary', 'daily_profit',
+                'results_per_enter_tag', 'left_open_trades', 'sortino', 'calmar'):
+        assert key not in lean
+    assert all(full[key] == value for key, value in lean.items())
+    assert complete_strategy_stats(full) is full
+
+    completed = complete_strategy_stats(lean)
+    assert completed == full
+
+    # Lean stats as loaded from a hyperopt results file
+    loaded = rapidjson.loads(rapidjson.dumps(
+        lean, default=hyperopt_serializer, number_mode=rapidjson.NM_NATIVE | rapidjson.NM_NAN))
+    completed = complete_strategy_stats(loaded)
+    for key in ('results_per_pair', 'exit_reason_summary', 'daily_profit', 'results_per_enter_tag',
+                'left_open_trades', 'sortino', 'calmar', 'best_pair'):
+        assert completed[key] == pytest.approx(full[key]), key
+
+    content['results'] = content['results'].iloc[0:0]
+    lean = generate_strategy_stats(pairlist, 'DefStrat', content, min_date, max_date,
+                                   market_change=0.1, is_hyperopt=True, stats=[])
+    completed = complete_strategy_stats(lean)
+    assert completed['results_per_pair'][-1]['trades'] == 0
+    assert completed['daily_profit_list'] == []
+
+
 def test_store_backtest_stats(testdatadir, mocker):
 
     dump_mock = mocker.patch('freqtrade.optimize.optimize_reports.file_dump_json')
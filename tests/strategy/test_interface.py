@@ -1,11 +1,14 @@
 # pragma pylint: disable=missing-docstring, C0103
 import logging
+import threading
+import time
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from unittest.mock import MagicMock
 
 import pytest
 from pandas import DataFrame
+from pandas.testing import assert_frame_equal
 
 from freqtrade.configuration import TimeRange
 from freqtrade.constants import CUSTOM_TAG_MAX_LENGTH
@@ -22,8 +25,8 @@ from freqtrade.strategy.parameters import (BaseParameter, BooleanParameter, Cate
                                            DecimalParameter, IntParameter, RealParameter)
 from freqtrade.strategy.strategy_wrapper import strategy_safe_wrapper
 from freqtrade.util import dt_now
-from tests.conftest import (CURRENT_TEST_STRATEGY, TRADE_SIDES, create_mock_trades, log_has,
-                            log_has_re)
+from tests.conftest import (CURRENT_TEST_STRATEGY, TRADE_SIDES, create_mock_trades,
+                            generate_test_data, log_has, log_has_re)
 
 from .strats.strategy_test_v3 import StrategyTestV3
 
@@ -718,6 +721,117 @@ def test__analyze_ticker_internal_skip_analyze(ohlcv_history, mocker, caplog) ->
     assert log_has('Skipping TA Analysis for already analyzed candle', caplog)
 
 
+def test_analyze_parallel(mocker, ohlcv_history) -> None:
+    pairs = ['ETH/BTC', 'XRP/BTC', 'LTC/BTC', 'NEO/BTC']
+    delays = {'ETH/BTC': 0.1, 'XRP/BTC': 0.0, 'LTC/BTC': 0.05, 'NEO/BTC': 0.0}
+    strategy = StrategyTestV3({'analyze_workers': 3})
+    strategy.dp = DataProvider({}, None, None)
+    mocker.patch.object(strategy.dp, 'ohlcv', side_effect=lambda *a, **k: ohlcv_history.copy())
+    set_cached_mock = mocker.patch.object(strategy.dp, '_set_cached_df')
+    emit_mock = mocker.patch.object(strategy.dp, '_emit_df')
+    threads = set()
+
+    def analyze_ticker(dataframe, metadata):
+        threads.add(threading.current_thread().name)
+        # Finish analysis in a different order than the pairs
+        time.sleep(delays[metadata['pair']])
+        dataframe['enter_long'] = 0
+        dataframe['pair'] = metadata['pair']
+        return dataframe
+
+    mocker.patch.object(strategy, 'analyze_ticker', side_effect=analyze_ticker)
+    strategy.analyze(pairs)
+
+    assert all(name.startswith('analyze') for name in threads)
+    assert [c[0][0] for c in set_cached_mock.call_args_list] == pairs
+    assert [c[0][0][0] for c in emit_mock.call_args_list] == pairs
+    for c in set_cached_mock.call_args_list:
+        assert (c[0][2]['pair'] == c[0][0]).all()
+    assert strategy._analyzed_pending is None
+
+    # Already analyzed candles - nothing is stored
+    set_cached_mock.reset_mock()
+    strategy.analyze(pairs)
+    assert set_cached_mock.call_count == 0
+
+    strategy.load_freqAI_model()
+    strategy.ft_bot_cleanup()
+    assert strategy._analyze_executor is None
+
+
+def test__analyze_ticker_internal_incremental(mocker, caplog) -> None:
+    caplog.set_level(logging.DEBUG)
+
+    def populate_indicators(dataframe, metadata):
+        dataframe['sma'] = dataframe['close'].rolling(10).mean()
+        return dataframe
+
+    def populate_entry(dataframe, metadata):
+        dataframe['enter_long'] = (dataframe['close'] > dataframe['sma']).astype(int)
+        return dataframe
+
+    def populate_exit(dataframe, metadata):
+        dataframe['exit_long'] = (dataframe['close'] < dataframe['sma']).astype(int)
+        return dataframe
+
+    ind_mock = MagicMock(side_effect=populate_indicators)
+    mocker.patch.multiple(
+        'freqtrade.strategy.interface.IStrategy',
+        advise_indicators=ind_mock,
+        advise_entry=MagicMock(side_effect=populate_entry),
+        advise_exit=MagicMock(side_effect=populate_exit),
+    )
+    candles = generate_test_data('5m', 220)
+    strategy = StrategyTestV3({})
+    strategy.dp = DataProvider({}, None, None)
+    strategy.startup_candle_count = 20
+    strategy.incremental_analysis = True
+
+    ret = strategy._analyze_ticker_internal(candles.iloc[:200].reset_index(drop=True),
+                                            {'pair': 'ETH/BTC'})
+    assert len(ind_mock.call_args[0][0]) == 200
+
+    # Candles age out - only the new candles (and the startup candles before them) are analyzed
+    for start in range(3, 21, 3):
+        dataframe = candles.iloc[start:start + 200].reset_index(drop=True)
+        ret = strategy._analyze_ticker_internal(dataframe, {'pair': 'ETH/BTC'})
+        assert len(ind_mock.call_args[0][0]) == 24
+        assert log_has('Analyzing 3 new candles for pair ETH/BTC.', caplog)
+        expected = strategy.analyze_ticker(dataframe.copy(), {'pair': 'ETH/BTC'})
+        # Rolling sums may differ in the last digits
+        assert_frame_equal(ret.iloc[20:], expected.iloc[20:])
+
+    # The last analyzed candle was incomplete - it's analyzed again with its final prices
+    partial = candles.iloc[19:219].reset_index(drop=True)
+    partial.loc[199, ['high', 'close']] = partial.loc[199, 'close'] * 2
+    strategy._analyze_ticker_internal(partial, {'pair': 'ETH/BTC'})
+    dataframe = candles.iloc[20:220].reset_index(drop=True)
+    ret = strategy._analyze_ticker_internal(dataframe, {'pair': 'ETH/BTC'})
+    assert log_has('Analyzing 1 new candles for pair ETH/BTC.', caplog)
+    assert ret.iloc[198]['close'] == dataframe.iloc[198]['close']
+    expected = strategy.analyze_ticker(dataframe.copy(), {'pair': 'ETH/BTC'})
+    assert_frame_equal(ret.iloc[20:], expected.iloc[20:])
+
+    # Candles don't connect to the analyzed candles
+    dataframe = candles.iloc[:199].reset_index(drop=True)
+    ind_mock.reset_mock()
+    ret = strategy._analyze_ticker_internal(dataframe, {'pair': 'ETH/BTC'})
+    assert len(ind_mock.call_args[0][0]) == 199
+    assert len(ret) == 199
+
+    # Disabled
+    strategy.incremental_analysis = False
+    dataframe = candles.iloc[1:200].reset_index(drop=True)
+    ret = strategy._analyze_ticker_internal(dataframe, {'pair': 'ETH/BTC'})
+    assert len(ind_mock.call_args[0][0]) == 199
+
+    # Analyzed dataframes of pairs removed from the whitelist are dropped
+    assert 'ETH/BTC' in strategy._incremental_dataframes
+    mocker.patch.object(strategy, 'analyze_pair')
+    strategy.analyze(['XRP/BTC'])
+    assert strategy._incremental_dataframes == {}
+
+
 @pytest.mark.usefixtures("init_persistence")
 def test_is_pair_locked(default_conf):
     PairLocks.timeframe = default_conf['timeframe']
@@ -117,6 +117,9 @@ def test_parse_args_backtesting_invalid() -> None:
     with pytest.raises(SystemExit, match=r'2'):
         Arguments(['backtesting --timeframe', 'abc']).get_parsed_arg()
 
+    with pytest.raises(SystemExit, match=r'2'):
+        Arguments(['backtesting', '--backtest-jobs', '0']).get_parsed_arg()
+
 
 def test_parse_args_backtesting_custom() -> None:
     args = [
@@ -2,6 +2,7 @@
 # pragma pylint: disable=protected-access, too-many-lines, invalid-name, too-many-arguments
 
 import logging
+import threading
 import time
 from copy import deepcopy
 from datetime import timedelta
@@ -656,6 +657,54 @@ def test_process_operational_exception(default_conf_usdt, ticker_usdt, mocker) -
     assert 'OperationalException' in msg_mock.call_args_list[-1][0][0]['status']
 
 
+def test_process_refresh_during_fee_update(default_conf_usdt, mocker) -> None:
+    patch_RPCManager(mocker)
+    patch_exchange(mocker)
+    freqtrade = get_patched_freqtradebot(mocker, default_conf_usdt)
+    events = []
+    updated = threading.Event()
+
+    def record(name):
+        def callback(*args, **kwargs):
+            events.append((name, threading.current_thread().name))
+        return callback
+
+    def refresh(*args, **kwargs):
+        events.append(('refresh', threading.current_thread().name))
+        # Candles are refreshed while fees of trades are updated
+        assert updated.wait(5)
+
+    def update_fees():
+        events.append(('update_fees', threading.current_thread().name))
+        updated.set()
+
+    mocker.patch.object(freqtrade.dataprovider, 'refresh', side_effect=refresh)
+    mocker.patch.object(freqtrade, 'update_trades_without_assigned_fees', side_effect=update_fees)
+    mocker.patch.object(freqtrade.strategy, 'bot_loop_start', side_effect=record('bot_loop_start'))
+    mocker.patch.object(freqtrade.strategy, 'analyze', side_effect=record('analyze'))
+    manage_mock = mocker.patch.object(freqtrade, 'manage_open_orders',
+                                      side_effect=record('manage_open_orders'))
+    mocker.patch.object(freqtrade, 'exit_positions')
+    mocker.patch.object(freqtrade, 'enter_positions')
+
+    freqtrade.process()
+    main_thread = threading.current_thread().name
+    assert ('refresh', main_thread) not in events
+    assert ('update_fees', main_thread) in events
+    # Orders are queried and managed after the analysis, in the regular order of callbacks
+    assert [name for name, _ in events if name not in ('refresh', 'update_fees')] == [
+        'bot_loop_start', 'analyze', 'manage_open_orders']
+    assert all(thread == main_thread for name, thread in events if name != 'refresh')
+
+    # Refresh failures are raised in the bot loop
+    mocker.patch.object(freqtrade.dataprovider, 'refresh', side_effect=ValueError('Refresh'))
+    with pytest.raises(ValueError, match='Refresh'):
+        freqtrade.process()
+    assert manage_mock.call_count == 1
+
+    freqtrade.cleanup()
+
+
 def test_process_trade_handling(default_conf_usdt, ticker_usdt, limit_buy_order_usdt_open, fee,
                                 mocker) -> None:
     patch_RPCManager(mocker)